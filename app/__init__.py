@@ -59,6 +59,13 @@ def create_app(environment: Optional[str] = None) -> Flask:
     # Initialize extensions
     init_extensions(app)
 
+    # Configure domain repositories from app config
+    from .domain import async_price_repo, price_repo, query_log
+
+    price_repo.init_app(app)
+    async_price_repo.init_app(app)
+    query_log.init_app(app)
+
     # Apply middleware
     CORSConfig.apply_cors(app)
     app.after_request(SecurityMiddleware.add_security_headers)
@@ -55,6 +55,56 @@ class BaseConfig:
     # Performance settings
     REQUEST_TIMEOUT = int(os.environ.get("REQUEST_TIMEOUT", "30"))
     MAX_WORKERS = int(os.environ.get("MAX_WORKERS", "4"))
+    MAX_BATCH_SIZE = int(os.environ.get("MAX_BATCH_SIZE", "10000"))
+    MAX_PORTFOLIO_SIZE = int(os.environ.get("MAX_PORTFOLIO_SIZE", "100"))
+
+    # Buffered query log: queue bound, rows per insert, flush interval and
+    # how long a request waits for queue space before its row is dropped
+    QUERY_LOG_QUEUE_SIZE = int(os.environ.get("QUERY_LOG_QUEUE_SIZE", "10000"))
+    QUERY_LOG_BATCH_SIZE = int(os.environ.get("QUERY_LOG_BATCH_SIZE", "500"))
+    QUERY_LOG_FLUSH_INTERVAL = float(os.environ.get("QUERY_LOG_FLUSH_INTERVAL", "1"))
+    QUERY_LOG_PUT_TIMEOUT = float(os.environ.get("QUERY_LOG_PUT_TIMEOUT", "0"))
+
+    # Kraken HTTP client (pooled keep-alive connections, timeouts in seconds)
+    KRAKEN_POOL_SIZE = int(os.environ.get("KRAKEN_POOL_SIZE", "10"))
+    KRAKEN_CONNECT_TIMEOUT = float(os.environ.get("KRAKEN_CONNECT_TIMEOUT", "3.05"))
+    KRAKEN_READ_TIMEOUT = float(os.environ.get("KRAKEN_READ_TIMEOUT", "10"))
+    KRAKEN_MAX_RETRIES = int(os.environ.get("KRAKEN_MAX_RETRIES", "3"))
+    KRAKEN_BACKOFF_FACTOR = float(os.environ.get("KRAKEN_BACKOFF_FACTOR", "0.5"))
+    KRAKEN_BACKOFF_JITTER = float(os.environ.get("KRAKEN_BACKOFF_JITTER", "0.5"))
+
+    # Concurrent multi-symbol fetching (keep at or below KRAKEN_POOL_SIZE)
+    PRICE_FETCH_CONCURRENCY = int(
+        os.environ.get("PRICE_FETCH_CONCURRENCY", str(KRAKEN_POOL_SIZE))
+    )
+    PRICE_WARMUP_SYMBOLS = [
+        symbol.strip().upper()
+        for symbol in os.environ.get("PRICE_WARMUP_SYMBOLS", "BTC,ETH,SOL").split(",")
+        if symbol.strip()
+    ]
+
+    # Price data representation: "exact" (Decimal) or "columnar" (NumPy)
+    PRICE_DATA_MODE = os.environ.get("PRICE_DATA_MODE", "exact")
+
+    # Analysis arithmetic: "exact" (Decimal) or "fast" (float64)
+    NUMERIC_MODE = os.environ.get("NUMERIC_MODE", "exact")
+
+    # In-process price cache (TTL in seconds, size in symbols)
+    PRICE_CACHE_TTL = float(os.environ.get("PRICE_CACHE_TTL", "300"))
+    PRICE_CACHE_SIZE = int(os.environ.get("PRICE_CACHE_SIZE", "256"))
+
+    # Price serving mode: "blocking" or "stale-while-revalidate". In the
+    # latter, data older than PRICE_CACHE_TTL is served while a background
+    # refresh runs, and requests only block past PRICE_CACHE_MAX_STALE
+    PRICE_SERVING_MODE = os.environ.get("PRICE_SERVING_MODE", "blocking")
+    PRICE_CACHE_MAX_STALE = float(os.environ.get("PRICE_CACHE_MAX_STALE", "3600"))
+    PRICE_REFRESH_WORKERS = int(os.environ.get("PRICE_REFRESH_WORKERS", "2"))
+
+    # Shared Redis price cache, enabled by ENABLE_CACHING (defaults to broker)
+    SHARED_CACHE_URL = os.environ.get("SHARED_CACHE_URL", CELERY_BROKER_URL)
+    SHARED_CACHE_TTL = float(os.environ.get("SHARED_CACHE_TTL", "300"))
+    SHARED_CACHE_LOCK_TTL = float(os.environ.get("SHARED_CACHE_LOCK_TTL", "30"))
+    SHARED_CACHE_LOCK_WAIT = float(os.environ.get("SHARED_CACHE_LOCK_WAIT", "10"))
 
     # Logging configuration
     LOG_INFO_FILE = os.path.join(
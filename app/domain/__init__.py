@@ -27,12 +27,40 @@ except ImportError:
     pass
 
 from app.shared import shared_db
+from app.shared.cache import TTLCache
 
-from .repositories import KrakenPriceRepository, SqlAlchemyInvestmentRepository
+from .async_repositories import AsyncKrakenPriceRepository
+from .constants import (
+    ANALYSIS_KERNEL_CACHE_SIZE,
+    ANALYSIS_KERNEL_TTL,
+    CHART_PAYLOAD_CACHE_SIZE,
+)
+from .query_log import BufferedInvestmentRepository
+from .repositories import (
+    KrakenPriceRepository,
+    SqlAlchemyCandleRepository,
+    SqlAlchemyInvestmentRepository,
+    SqlAlchemyLeaderboardRepository,
+    SqlAlchemyOpeningAverageRepository,
+)
 
 # Initialize repositories
-price_repo = KrakenPriceRepository(shared_db)
+candle_repo = SqlAlchemyCandleRepository(shared_db)
+opening_average_repo = SqlAlchemyOpeningAverageRepository(shared_db)
+price_repo = KrakenPriceRepository(
+    shared_db, candle_store=candle_repo, opening_averages=opening_average_repo
+)
 investment_repo = SqlAlchemyInvestmentRepository(shared_db)
+# Request handlers log through this, off the request path
+query_log = BufferedInvestmentRepository(investment_repo)
+leaderboard_repo = SqlAlchemyLeaderboardRepository(shared_db)
+async_price_repo = AsyncKrakenPriceRepository(price_repo)
+
+# Amount-independent analysis per (symbol, candle version, windows)
+analysis_kernels = TTLCache(maxsize=ANALYSIS_KERNEL_CACHE_SIZE, ttl=ANALYSIS_KERNEL_TTL)
+
+# Encoded graph_data per (symbol, interval, points, candle version)
+chart_payloads = TTLCache(maxsize=CHART_PAYLOAD_CACHE_SIZE, ttl=ANALYSIS_KERNEL_TTL)
 
 __all__ = [
     "Investment",
@@ -50,6 +78,13 @@ __all__ = [
     "validate_crypto_request",
     "validate_health_response",
     "schema",
+    "candle_repo",
+    "opening_average_repo",
     "price_repo",
+    "async_price_repo",
+    "analysis_kernels",
+    "chart_payloads",
     "investment_repo",
+    "query_log",
+    "leaderboard_repo",
 ]
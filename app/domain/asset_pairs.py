@@ -0,0 +1,154 @@
+"""Local index of Kraken's USD asset pairs."""
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Callable, Optional
+
+from app.domain.constants import ASSET_PAIRS_RETRY, ASSET_PAIRS_TTL, SYMBOL_ALIASES
+from app.domain.exceptions import ExternalServiceError
+
+logger = logging.getLogger(__name__)
+
+# Kraken's AssetPairs "result": pair name -> pair description
+AssetPairs = dict[str, dict[str, Any]]
+
+
+class AssetPairIndex:
+    """
+    In-memory index of the pairs Kraken quotes in USD.
+
+    Answers symbol existence, symbol to pair normalisation (BTC ->
+    XXBTZUSD) and prefix search locally. The pair list is reloaded when it
+    is older than ``ttl``; if a reload fails the previous index keeps
+    serving. Until a first load succeeds, attempts are spaced at least
+    ``retry`` seconds apart so an outage does not cost a request each.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], AssetPairs],
+        ttl: float = ASSET_PAIRS_TTL,
+        retry: float = ASSET_PAIRS_RETRY,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._loader = loader
+        self.ttl = ttl
+        self.retry = retry
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._loaded_at: Optional[float] = None
+        self._failed_at: Optional[float] = None
+        # Every accepted spelling of a symbol -> pair name
+        self._pairs: dict[str, str] = {}
+        # Display symbols, sorted for prefix search
+        self._symbols: list[str] = []
+        # One symbol per pair (Kraken's own spelling), sorted
+        self._canonical: list[str] = []
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the index holds a pair list."""
+        return self._loaded_at is not None
+
+    def pair_for(self, symbol: str, load: bool = True) -> Optional[str]:
+        """
+        Get Kraken's pair name for a symbol.
+
+        Args:
+            symbol: Symbol in any accepted spelling (BTC, XBT, XXBT)
+            load: Load or refresh the index first; when False an unloaded
+                index answers None
+
+        Returns:
+            Pair name such as "XXBTZUSD", or None if no USD pair exists
+
+        Raises:
+            ExternalServiceError: If the index has never loaded and Kraken
+                cannot be reached
+        """
+        if load:
+            self.refresh_if_stale()
+        return self._pairs.get(symbol.upper().strip())
+
+    def exists(self, symbol: str) -> bool:
+        """Check whether a USD pair exists for a symbol."""
+        return self.pair_for(symbol) is not None
+
+    def search(self, prefix: str, limit: int = 10) -> list[str]:
+        """Get up to ``limit`` symbols starting with ``prefix``, in order."""
+        self.refresh_if_stale()
+        prefix = prefix.upper().strip()
+        symbols = self._symbols
+        start = bisect_left(symbols, prefix)
+        matches = []
+        for symbol in symbols[start : start + limit]:
+            if not symbol.startswith(prefix):
+                break
+            matches.append(symbol)
+        return matches
+
+    def symbols(self, include_aliases: bool = True) -> list[str]:
+        """Get every symbol, sorted; without aliases there is one per pair."""
+        self.refresh_if_stale()
+        return list(self._symbols if include_aliases else self._canonical)
+
+    def refresh_if_stale(self) -> None:
+        """Reload the pair list if it is missing or older than ``ttl``."""
+        if self.loaded and self._clock() - self._loaded_at < self.ttl:
+            return
+        with self._lock:
+            if self.loaded and self._clock() - self._loaded_at < self.ttl:
+                return
+            if (
+                not self.loaded
+                and self._failed_at is not None
+                and self._clock() - self._failed_at < self.retry
+            ):
+                raise ExternalServiceError("Asset pair list unavailable")
+            try:
+                index = _build_index(self._loader())
+                if not index[0]:
+                    raise ExternalServiceError("Asset pair list has no USD pairs")
+            except Exception as e:
+                if not self.loaded:
+                    self._failed_at = self._clock()
+                    raise
+                logger.warning(f"Asset pair refresh failed, keeping old index: {e}")
+                self._loaded_at = self._clock()
+                return
+            self._pairs, self._symbols, self._canonical = index
+            self._loaded_at = self._clock()
+            logger.info(f"Indexed {len(self._symbols)} USD asset pairs")
+
+    def stats(self) -> dict[str, Any]:
+        """Return index size and age for monitoring."""
+        age = None if self._loaded_at is None else self._clock() - self._loaded_at
+        return {"symbols": len(self._symbols), "age": age, "ttl": self.ttl}
+
+
+def _build_index(
+    pairs: AssetPairs,
+) -> tuple[dict[str, str], list[str], list[str]]:
+    """Map every spelling of each USD pair's base to its pair name."""
+    lookup: dict[str, str] = {}
+    display: set[str] = set()
+    for name, info in pairs.items():
+        if not isinstance(info, dict):
+            continue
+        wsname = info.get("wsname", "")
+        if not wsname.endswith("/USD"):
+            continue
+        base = wsname.split("/")[0].upper()
+        display.add(base)
+        lookup[base] = name
+        if info.get("base"):
+            lookup.setdefault(info["base"].upper(), name)
+
+    canonical = sorted(display)
+    for alias, symbol in SYMBOL_ALIASES.items():
+        if symbol in lookup:
+            lookup[alias] = lookup[symbol]
+            display.add(alias)
+    return lookup, sorted(display), canonical
@@ -0,0 +1,152 @@
+"""Asyncio price repository for concurrent multi-symbol fetching."""
+
+import asyncio
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Coroutine, Iterable, Optional, TypeVar, Union
+
+from flask import Flask
+
+from app.domain.models import AnyPriceData
+from app.domain.repositories import KrakenPriceRepository
+
+T = TypeVar("T")
+
+# Result of a multi-symbol fetch: price data or the exception it raised
+PriceResult = Union[AnyPriceData, Exception]
+
+
+class AsyncKrakenPriceRepository:
+    """
+    Asyncio repository with KrakenPriceRepository's semantics.
+
+    Each fetch runs the blocking repository on a bounded thread pool, so
+    it shares the pooled HTTP client, price caches, negative cache and
+    candle store, and raises the same domain exceptions. ``get_many``
+    fans out over many symbols under a semaphore, so a warmup takes
+    about as long as the slowest single fetch rather than the sum.
+    """
+
+    def __init__(
+        self, price_repo: KrakenPriceRepository, max_concurrency: int = 10
+    ) -> None:
+        self.price_repo = price_repo
+        self.max_concurrency = max_concurrency
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        _repositories.add(self)
+
+    def init_app(self, app: Flask) -> None:
+        """Configure fetch concurrency from Flask app config."""
+        self.max_concurrency = app.config.get(
+            "PRICE_FETCH_CONCURRENCY", self.max_concurrency
+        )
+        self.shutdown()
+
+    async def get_price_data(self, symbol: str) -> AnyPriceData:
+        """
+        Get historical price data for a symbol.
+
+        Raises:
+            SymbolNotFoundError: If Kraken does not know the pair
+            ExternalServiceError: If Kraken cannot be reached or errors
+            InsufficientPriceDataError: If the response holds no candles
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, self.price_repo.get_price_data, symbol
+        )
+
+    async def symbol_exists(self, symbol: str) -> bool:
+        """Check if symbol exists on exchange."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, self.price_repo.symbol_exists, symbol
+        )
+
+    async def get_many(self, symbols: Iterable[str]) -> dict[str, PriceResult]:
+        """
+        Fetch price data for many symbols concurrently.
+
+        At most ``max_concurrency`` fetches are in flight at once. A
+        failing symbol does not cancel the others.
+
+        Args:
+            symbols: Symbols to fetch; duplicates are fetched once
+
+        Returns:
+            Mapping of symbol to PriceData, or to the exception raised
+        """
+        unique = list(dict.fromkeys(symbols))
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(symbol: str) -> AnyPriceData:
+            async with semaphore:
+                return await self.get_price_data(symbol)
+
+        results = await asyncio.gather(
+            *(fetch(symbol) for symbol in unique), return_exceptions=True
+        )
+        return dict(zip(unique, results))
+
+    def get_many_sync(self, symbols: Iterable[str]) -> dict[str, PriceResult]:
+        """Blocking facade over get_many for Flask routes and Celery tasks."""
+        return run_sync(self.get_many(symbols))
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Return the fetch thread pool, creating it on first use."""
+        executor = self._executor
+        if executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_concurrency,
+                        thread_name_prefix="price-fetch",
+                    )
+                executor = self._executor
+        return executor
+
+    def shutdown(self) -> None:
+        """Stop the thread pool; the next fetch starts a fresh one."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def _reset_after_fork(self) -> None:
+        """Forget the parent's pool; its threads do not exist in the child."""
+        self._executor = None
+        self._lock = threading.Lock()
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    Uses asyncio.run, or a helper thread when the caller is already
+    inside a running event loop.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as runner:
+        return runner.submit(asyncio.run, coro).result()
+
+
+# Every repository, so forked children can drop inherited thread pools
+_repositories: "weakref.WeakSet[AsyncKrakenPriceRepository]" = weakref.WeakSet()
+
+
+def _reset_repositories_after_fork() -> None:
+    for repo in list(_repositories):
+        repo._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_repositories_after_fork)
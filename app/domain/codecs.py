@@ -0,0 +1,256 @@
+"""Encodings for price data: Kraken OHLC decoding and cache blobs."""
+
+import json
+import math
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Optional
+
+import numpy as np
+
+# Conditional imports to avoid issues when dependencies are not installed
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None  # type: ignore
+
+from .exceptions import InsufficientPriceDataError
+from .models import AnyPriceData, ColumnarPriceData, PriceData
+
+# Header: magic, format, decimal exponent, candle count, symbol length and
+# fetch time (NaN if unknown); the magic is bumped whenever the layout changes
+_MAGIC = b"DWP2"
+_HEADER = struct.Struct("<4sBbIHd")
+
+# Formats: exact Decimal closes scaled to int64, or raw float64 closes
+_FORMAT_EXACT = 1
+_FORMAT_COLUMNAR = 2
+
+_NO_TIME = float("nan")
+
+
+def encode_price_data(price_data: AnyPriceData) -> bytes:
+    """
+    Encode price data as a compact little-endian binary blob.
+
+    Timestamps are stored as int64 epoch seconds. Exact PriceData closes
+    are scaled by a shared power of ten and stored as int64, so decoding
+    restores the exact Decimal values without pickling tuples; columnar
+    closes are stored as float64.
+
+    Args:
+        price_data: Price data to encode
+
+    Returns:
+        Encoded bytes
+    """
+    symbol = price_data.symbol.encode()
+    fetched_at = _NO_TIME if price_data.fetched_at is None else price_data.fetched_at
+
+    if isinstance(price_data, ColumnarPriceData):
+        count = price_data.timestamps.size
+        header = _HEADER.pack(
+            _MAGIC, _FORMAT_COLUMNAR, 0, count, len(symbol), fetched_at
+        )
+        return b"".join(
+            [
+                header,
+                symbol,
+                price_data.timestamps.astype("<i8").tobytes(),
+                price_data.closes.astype("<f8").tobytes(),
+            ]
+        )
+
+    closes = [price for _, price in price_data.prices]
+    exponent = min(min(int(p.as_tuple().exponent) for p in closes), 0)
+    scale = Decimal(1).scaleb(-exponent)
+    count = len(closes)
+    header = _HEADER.pack(
+        _MAGIC, _FORMAT_EXACT, exponent, count, len(symbol), fetched_at
+    )
+    timestamps = [int(timestamp.timestamp()) for timestamp, _ in price_data.prices]
+    scaled = [int(price * scale) for price in closes]
+    return b"".join(
+        [
+            header,
+            symbol,
+            np.array(timestamps, dtype="<i8").tobytes(),
+            np.array(scaled, dtype="<i8").tobytes(),
+        ]
+    )
+
+
+def decode_price_data(payload: bytes) -> AnyPriceData:
+    """
+    Decode bytes produced by encode_price_data.
+
+    Returns:
+        PriceData or ColumnarPriceData, matching what was encoded
+
+    Raises:
+        InsufficientPriceDataError: If the payload is not a price data blob
+    """
+    try:
+        magic, fmt, exponent, count, symbol_length, fetched_at = _HEADER.unpack_from(
+            payload
+        )
+        if magic != _MAGIC or fmt not in (_FORMAT_EXACT, _FORMAT_COLUMNAR):
+            raise InsufficientPriceDataError("Unsupported price data payload")
+
+        offset = _HEADER.size
+        symbol = payload[offset : offset + symbol_length].decode()
+        offset += symbol_length
+        timestamps = np.frombuffer(payload, dtype="<i8", count=count, offset=offset)
+        offset += 8 * count
+        closes = np.frombuffer(
+            payload,
+            dtype="<f8" if fmt == _FORMAT_COLUMNAR else "<i8",
+            count=count,
+            offset=offset,
+        )
+    except (struct.error, UnicodeDecodeError, ValueError) as e:
+        raise InsufficientPriceDataError(f"Invalid price data payload: {e}")
+
+    fetched = None if math.isnan(fetched_at) else fetched_at
+
+    if fmt == _FORMAT_COLUMNAR:
+        return ColumnarPriceData(
+            symbol=symbol, timestamps=timestamps, closes=closes, fetched_at=fetched
+        )
+
+    prices = [
+        (datetime.fromtimestamp(timestamp), Decimal(value).scaleb(exponent))
+        for timestamp, value in zip(timestamps.tolist(), closes.tolist())
+    ]
+    return PriceData(symbol=symbol, prices=prices, fetched_at=fetched)
+
+
+@dataclass(frozen=True)
+class OHLCFrame:
+    """
+    Decoded Kraken OHLC payload reduced to the columns we use.
+
+    Attributes:
+        pair: Kraken pair name, or None if the payload held no result
+        timestamps: int64 candle open times (epoch seconds)
+        closes: float64 close prices
+        close_text: Close prices as Kraken's exact decimal strings
+        last: Kraken's "last" cursor for incremental polling
+        errors: Kraken error strings
+    """
+
+    pair: Optional[str]
+    timestamps: np.ndarray
+    closes: np.ndarray
+    close_text: np.ndarray
+    last: Optional[int] = None
+    errors: tuple[str, ...] = ()
+
+    def rows(self) -> list[tuple[int, str]]:
+        """Return (timestamp, close text) rows for the candle store."""
+        return list(zip(self.timestamps.tolist(), self.close_text.tolist()))
+
+
+class OHLCDecoder:
+    """
+    Decoder stage for raw Kraken OHLC response bytes.
+
+    Parses with orjson when available and slices the timestamp and close
+    columns straight into NumPy arrays, without a Python loop over rows.
+    Parse and conversion time are tracked separately.
+    """
+
+    # Kraken OHLC row: [time, open, high, low, close, vwap, volume, count]
+    TIME_COLUMN = 0
+    CLOSE_COLUMN = 4
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.payloads = 0
+        self.bytes = 0
+        self.candles = 0
+        self.parse_seconds = 0.0
+        self.convert_seconds = 0.0
+
+    def decode(self, raw: bytes) -> OHLCFrame:
+        """
+        Decode a raw OHLC response body.
+
+        Args:
+            raw: Response bytes
+
+        Returns:
+            OHLCFrame with timestamp and close columns
+
+        Raises:
+            ValueError: If the body is not a valid OHLC payload
+        """
+        started = time.perf_counter()
+        data = _loads(raw)
+        parsed = time.perf_counter()
+
+        if not isinstance(data, dict):
+            raise ValueError("OHLC payload is not a JSON object")
+
+        errors = tuple(data.get("error") or ())
+        result = data.get("result") or {}
+        pair = next((key for key in result if key != "last"), None)
+        table = _to_table(result[pair] if pair is not None else [])
+
+        frame = OHLCFrame(
+            pair=pair,
+            timestamps=table[:, self.TIME_COLUMN].astype(np.int64),
+            closes=table[:, self.CLOSE_COLUMN].astype(np.float64),
+            close_text=table[:, self.CLOSE_COLUMN].astype(str),
+            last=result.get("last"),
+            errors=errors,
+        )
+        converted = time.perf_counter()
+
+        with self._lock:
+            self.payloads += 1
+            self.bytes += len(raw)
+            self.candles += frame.timestamps.size
+            self.parse_seconds += parsed - started
+            self.convert_seconds += converted - parsed
+        return frame
+
+    def stats(self) -> dict[str, Any]:
+        """Return decode counters and cumulative timings."""
+        with self._lock:
+            return {
+                "parser": "orjson" if ORJSON_AVAILABLE else "json",
+                "payloads": self.payloads,
+                "bytes": self.bytes,
+                "candles": self.candles,
+                "parse_seconds": self.parse_seconds,
+                "convert_seconds": self.convert_seconds,
+            }
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes with the fastest available parser."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _to_table(rows: list[list[Any]]) -> np.ndarray:
+    """View OHLC rows as a 2-D object array so columns can be sliced."""
+    if not rows:
+        return np.empty((0, OHLCDecoder.CLOSE_COLUMN + 1), dtype=object)
+    table = np.array(rows, dtype=object)
+    if table.ndim != 2 or table.shape[1] <= OHLCDecoder.CLOSE_COLUMN:
+        raise ValueError("Malformed OHLC rows")
+    return table
+
+
+# Shared decoder used by every consumer of OHLC payloads
+ohlc_decoder = OHLCDecoder()
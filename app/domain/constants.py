@@ -5,6 +5,10 @@ from decimal import Decimal
 # Price of a Lamborghini (used for profit calculations)
 LAMBO_PRICE = Decimal("200000")
 
+# Largest relative difference the fast (float64) numeric mode may show
+# against the exact (Decimal) mode in any reported metric
+FAST_MATH_RTOL = 1e-9
+
 # Number of weeks to use for opening price average
 OPENING_PERIOD_WEEKS = 4
 
@@ -14,6 +18,81 @@ CURRENT_PERIOD_WEEKS = 4
 # API timeout in seconds
 API_TIMEOUT = 10
 
+# Kraken OHLC candle interval in minutes (Kraken's largest, 15 days)
+OHLC_INTERVAL_MINUTES = 21600
+
+# Coarser candle levels rolled up from the base interval, in minutes
+# (30, 90 and 365 days), so long-range charts read a few stored points
+CANDLE_ROLLUP_INTERVALS = (43200, 129600, 525600)
+
+# Kraken OHLC returns at most this many of the most recent candles, whatever
+# "since" asks for; at 15-day candles that is about 29 years
+OHLC_MAX_CANDLES = 720
+
+# Start of the analysed price history (2019-01-21 UTC)
+HISTORY_START_TIMESTAMP = 1548111600
+
+# Seconds PriceData stays in the in-process cache
+PRICE_CACHE_TTL = 300
+
+# Seconds stale PriceData may still be served while it is refreshed in the
+# background (stale-while-revalidate serving mode)
+PRICE_CACHE_MAX_STALE = 3600
+
+# Background refresh threads for stale-while-revalidate
+PRICE_REFRESH_WORKERS = 2
+
+# Maximum number of symbols held in the in-process price cache
+PRICE_CACHE_SIZE = 256
+
+# Seconds an unknown symbol is remembered before Kraken is asked again
+UNKNOWN_SYMBOL_TTL = 3600
+
+# Upper bound on remembered unknown symbols
+UNKNOWN_SYMBOL_CACHE_SIZE = 10000
+
+# Seconds between reloads of Kraken's asset pair list
+ASSET_PAIRS_TTL = 3600
+
+# Seconds between attempts to load the asset pair list while it never has
+ASSET_PAIRS_RETRY = 60
+
+# Common names for assets Kraken spells differently
+SYMBOL_ALIASES = {"BTC": "XBT", "DOGE": "XDG"}
+
+# Most matches /symbols returns per request
+SYMBOL_SEARCH_LIMIT = 50
+
+# Memoised per-symbol analysis kernels (entries and seconds kept)
+ANALYSIS_KERNEL_CACHE_SIZE = 256
+ANALYSIS_KERNEL_TTL = 3600
+
+# Pre-encoded graph_data JSON per (symbol, interval, points, candle version)
+CHART_PAYLOAD_CACHE_SIZE = 512
+
+# Dollar-cost-averaging schedules and their spacing in days ("monthly"
+# repeats the start date's day of month, clamped to shorter months)
+DCA_FREQUENCIES = {"daily": 1, "weekly": 7, "monthly": None}
+
+# Top-movers leaderboard: entries kept, the amount lambos are quoted per,
+# and how long web processes reuse the stored leaderboard (seconds)
+LEADERBOARD_SIZE = 100
+LEADERBOARD_INVESTMENT = 1000
+LEADERBOARD_CACHE_TTL = 60
+# A refresh that loads fewer than this fraction of pairs (e.g. during a
+# Kraken outage) keeps the previous leaderboard instead of replacing it
+LEADERBOARD_MIN_LOADED = 0.5
+
+# Profit percentiles reported by the entry-date scan
+ENTRY_SCAN_PERCENTILES = (10, 25, 50, 75, 90)
+
+# Buffered query log: rows queued at most, rows per bulk insert, seconds
+# between flushes, and seconds a request waits for room before dropping
+QUERY_LOG_QUEUE_SIZE = 10000
+QUERY_LOG_BATCH_SIZE = 500
+QUERY_LOG_FLUSH_INTERVAL = 1.0
+QUERY_LOG_PUT_TIMEOUT = 0.0
+
 # Date time formats
 DATE_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
 ISO_DATE_TIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
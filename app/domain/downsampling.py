@@ -0,0 +1,77 @@
+"""Shape-preserving downsampling for chart series."""
+
+from typing import Any
+
+import numpy as np
+
+# LTTB always keeps the first and last point, so it needs at least one bucket
+MIN_POINTS = 3
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, points: int) -> np.ndarray:
+    """
+    Select ``points`` indices with Largest-Triangle-Three-Buckets.
+
+    The first and last points are kept. The points in between are split
+    into ``points - 2`` buckets, and each bucket keeps the point that forms
+    the largest triangle with the previously kept point and the average of
+    the next bucket, which preserves peaks and troughs.
+
+    Args:
+        x: Sorted x values (e.g. epoch seconds)
+        y: Values at each x
+        points: Number of points to keep
+
+    Returns:
+        Sorted int64 indices into x and y; every index if the series
+        already has at most ``points`` points
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    count = x.size
+    if points >= count or points < MIN_POINTS:
+        return np.arange(count, dtype=np.int64)
+
+    # Bucket i covers [edges[i], edges[i + 1]); the last "bucket" is the
+    # final point on its own
+    every = (count - 2) / (points - 2)
+    edges = (np.arange(points - 1) * every).astype(np.int64) + 1
+    edges = np.append(edges, count)
+
+    selected = np.empty(points, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = count - 1
+    previous = 0
+    for bucket in range(points - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_start, next_end = end, max(edges[bucket + 2], end + 1)
+        next_x = x[next_start:next_end].mean()
+        next_y = y[next_start:next_end].mean()
+
+        px, py = x[previous], y[previous]
+        areas = np.abs(
+            (px - next_x) * (y[start:end] - py) - (px - x[start:end]) * (next_y - py)
+        )
+        previous = start + int(areas.argmax())
+        selected[bucket + 1] = previous
+    return selected
+
+
+def downsample_chart(chart: list[dict[str, Any]], points: int) -> list[dict[str, Any]]:
+    """
+    Downsample chart data that has already been built.
+
+    Candles are evenly spaced, so positions stand in for the x values.
+
+    Args:
+        chart: List of {"x": label, "y": price} dictionaries
+        points: Number of points to keep
+
+    Returns:
+        The kept dictionaries, in order
+    """
+    if points >= len(chart):
+        return chart
+    values = [float(point["y"]) for point in chart]
+    indices = lttb_indices(np.arange(len(chart)), values, points)
+    return [chart[i] for i in indices.tolist()]
@@ -17,5 +17,9 @@ class InsufficientPriceDataError(CryptoDomainError):
     """Raised when there isn't enough price data for analysis."""
 
 
+class DateOutOfRangeError(InsufficientPriceDataError):
+    """Raised when a requested date leaves no price data to analyse."""
+
+
 class ExternalServiceError(CryptoDomainError):
     """Raised when external API service fails."""
@@ -1,16 +1,18 @@
 import json
 from decimal import Decimal
+from typing import Optional
 
 import strawberry
 from flask import current_app
 
+from app.domain.downsampling import MIN_POINTS
 from app.domain.exceptions import (
     ExternalServiceError,
     InsufficientPriceDataError,
     InvalidInvestmentError,
     SymbolNotFoundError,
 )
-from app.domain.routes import get_crypto_service
+from app.domain.routes import domain_error_response, get_crypto_service, parse_date
 
 
 @strawberry.type
@@ -23,13 +25,16 @@ class ProcessRequestResult:
 @strawberry.type
 class Query:
     @strawberry.field
-    def process_request(self, symbol: str, investment: int) -> ProcessRequestResult:
+    def process_request(
+        self, symbol: str, investment: int, points: Optional[int] = None
+    ) -> ProcessRequestResult:
         """
         Process crypto investment request via GraphQL.
 
         Args:
             symbol: Cryptocurrency symbol (e.g., 'BTC')
             investment: Investment amount in USD
+            points: Downsample graph_data to this many points (None for all)
 
         Returns:
             ProcessRequestResult with analysis data and graph data
@@ -52,17 +57,28 @@ class Query:
                     graph_data="[]",
                 )
 
+            if points is not None and points < MIN_POINTS:
+                return ProcessRequestResult(
+                    message=json.dumps(
+                        {"error": f"points must be an integer >= {MIN_POINTS}"}
+                    ),
+                    graph_data="[]",
+                )
+
             # Get service instance with wired infrastructure
             service = get_crypto_service()
 
             # Execute business logic
-            result = service.analyze_investment(symbol.strip(), Decimal(investment))
+            options = {"points": points} if points is not None else {}
+            result = service.analyze_investment(
+                symbol.strip(), Decimal(investment), encode_chart=True, **options
+            )
 
-            # Extract graph data and format response
-            graph_data = result.pop("graph_data", [])
+            # graph_data arrives JSON-encoded from the chart payload cache
+            graph_data = result.pop("graph_data", b"[]")
 
             return ProcessRequestResult(
-                message=json.dumps(result), graph_data=json.dumps(graph_data)
+                message=json.dumps(result), graph_data=graph_data.decode()
             )
 
         except InvalidInvestmentError as exc:
@@ -100,5 +116,61 @@ class Query:
                 message=json.dumps({"message": "Server Failure"}), graph_data="[]"
             )
 
+    @strawberry.field
+    def dca(
+        self,
+        symbol: str,
+        investment: int,
+        frequency: str,
+        start_date: str,
+        end_date: Optional[str] = None,
+        points: Optional[int] = None,
+    ) -> ProcessRequestResult:
+        """
+        Analyze dollar-cost averaging via GraphQL.
+
+        Args:
+            symbol: Cryptocurrency symbol (e.g., 'BTC')
+            investment: USD spent on each purchase
+            frequency: "daily", "weekly" or "monthly"
+            start_date: First purchase, ISO 8601 or epoch seconds
+            end_date: Last possible purchase (now if None)
+            points: Downsample graph_data to this many points (None for all)
+
+        Returns:
+            ProcessRequestResult with plan totals and holding value per candle
+        """
+        current_app.logger.info(f"GraphQL DCA request: {symbol}, {investment}")
+
+        options = {"start_date": parse_date(start_date)}
+        if end_date is not None:
+            options["end_date"] = parse_date(end_date)
+        if points is not None:
+            options["points"] = points
+
+        if None in options.values():
+            error = "Dates must be ISO 8601 or epoch seconds"
+        elif points is not None and points < MIN_POINTS:
+            error = f"points must be an integer >= {MIN_POINTS}"
+        else:
+            error = None
+        if error:
+            return ProcessRequestResult(
+                message=json.dumps({"error": error}), graph_data="[]"
+            )
+
+        try:
+            result = get_crypto_service().analyze_dca(
+                symbol.strip(), Decimal(investment), frequency, **options
+            )
+        except Exception as exc:
+            body, _, _ = domain_error_response(exc)
+            return ProcessRequestResult(message=body, graph_data="[]")
+
+        graph_data = result.pop("graph_data", [])
+        return ProcessRequestResult(
+            message=json.dumps(result), graph_data=json.dumps(graph_data)
+        )
+
 
 schema = strawberry.Schema(query=Query)
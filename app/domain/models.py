@@ -1,9 +1,15 @@
 """Domain models with business logic."""
 
+import time
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal
+from functools import cached_property
+from itertools import accumulate
+from typing import Optional, Union
 
+import numpy as np
 from sqlalchemy import Column, DateTime, Float, Integer, String
 
 from app.shared.database import Base
@@ -11,10 +17,17 @@ from app.shared.database import Base
 from .constants import (
     CURRENT_PERIOD_WEEKS,
     DATE_TIME_FORMAT,
+    DCA_FREQUENCIES,
     LAMBO_PRICE,
     OPENING_PERIOD_WEEKS,
 )
-from .exceptions import InsufficientPriceDataError, InvalidInvestmentError
+from .downsampling import lttb_indices
+from .exceptions import (
+    DateOutOfRangeError,
+    InsufficientPriceDataError,
+    InvalidInvestmentError,
+)
+from .numeric import EXACT, NumericBackend
 
 
 @dataclass
@@ -114,6 +127,212 @@ class Investment:
         return profit / LAMBO_PRICE
 
 
+def calculate_investment_metrics(
+    amounts: np.ndarray, opening_price: float, current_price: float
+) -> dict[str, np.ndarray]:
+    """
+    Vectorised Investment calculations for many amounts of one symbol.
+
+    Applies the same formulas as the Investment methods in float64.
+
+    Args:
+        amounts: Investment amounts in USD
+        opening_price: Price when the investments were made
+        current_price: Current price
+
+    Returns:
+        Arrays keyed "coins", "profit", "growth" and "lambos"
+
+    Raises:
+        InvalidInvestmentError: If opening price is invalid
+    """
+    if opening_price <= 0:
+        raise InvalidInvestmentError("Opening price must be positive")
+
+    amounts = np.asarray(amounts, dtype=np.float64)
+    coins = amounts / opening_price
+    profit = coins * current_price - amounts
+    return {
+        "coins": coins,
+        "profit": profit,
+        "growth": profit / amounts,
+        "lambos": profit / float(LAMBO_PRICE),
+    }
+
+
+def dca_schedule(
+    start: float, end: float, frequency: str, since: Optional[float] = None
+) -> np.ndarray:
+    """
+    Build the purchase times of a dollar-cost-averaging plan.
+
+    Purchases before ``since`` are skipped arithmetically rather than
+    built, so a plan starting long before the price history costs no more
+    than one starting at it.
+
+    Args:
+        start: Epoch seconds of the first purchase
+        end: Epoch seconds after which no purchase is made
+        frequency: One of DCA_FREQUENCIES
+        since: Only build purchases at or after this epoch time
+
+    Returns:
+        Purchase times as int64 epoch seconds, in order
+
+    Raises:
+        InvalidInvestmentError: If the frequency is unknown
+    """
+    days = _dca_days(frequency)
+    skipped = 0 if since is None else dca_purchases_before(start, since, frequency)
+    first = np.datetime64(int(start), "s")
+    last = np.datetime64(int(end), "s")
+    if days is not None:
+        step = np.timedelta64(days, "D")
+        times = np.arange(first + skipped * step, last + 1, step)
+    else:
+        months = np.arange(
+            first.astype("datetime64[M]") + skipped,
+            last.astype("datetime64[M]") + 1,
+        )
+        times = _monthly_purchases(first, months)
+        times = times[times <= last]
+    return times.astype("datetime64[s]").astype(np.int64)
+
+
+def dca_purchases_before(start: float, since: float, frequency: str) -> int:
+    """
+    Count the purchases of a DCA plan made before ``since``.
+
+    Args:
+        start: Epoch seconds of the first purchase
+        since: Epoch seconds; purchases strictly before it are counted
+        frequency: One of DCA_FREQUENCIES
+
+    Returns:
+        Number of scheduled purchases in [start, since)
+
+    Raises:
+        InvalidInvestmentError: If the frequency is unknown
+    """
+    days = _dca_days(frequency)
+    first = np.datetime64(int(start), "s")
+    cutoff = np.datetime64(int(since), "s")
+    if cutoff <= first:
+        return 0
+    if days is not None:
+        # Ceiling division: purchases at first, first + step, ... < cutoff
+        return int(-((first - cutoff) // np.timedelta64(days, "D")))
+
+    month = cutoff.astype("datetime64[M]")
+    count = int((month - first.astype("datetime64[M]")).astype(np.int64))
+    if _monthly_purchases(first, np.array([month]))[0] < cutoff:
+        count += 1
+    return count
+
+
+def _dca_days(frequency: str) -> Optional[int]:
+    """Days between purchases for a frequency, or None for monthly."""
+    if frequency not in DCA_FREQUENCIES:
+        raise InvalidInvestmentError(
+            f"Frequency must be one of {', '.join(DCA_FREQUENCIES)}"
+        )
+    return DCA_FREQUENCIES[frequency]
+
+
+def _monthly_purchases(first: np.datetime64, months: np.ndarray) -> np.ndarray:
+    """Purchase time in each month: same day and time as ``first``, clamped."""
+    day = first.astype("datetime64[D]")
+    starts = months.astype("datetime64[D]")
+    offset = np.minimum(
+        day - day.astype("datetime64[M]").astype("datetime64[D]"),
+        (months + 1).astype("datetime64[D]") - starts - 1,
+    )
+    return starts + offset + (first - day)
+
+
+def calculate_dca_metrics(
+    timestamps: np.ndarray,
+    closes: np.ndarray,
+    amount: float,
+    purchase_times: np.ndarray,
+) -> dict[str, np.ndarray]:
+    """
+    Vectorised dollar-cost averaging over a candle series.
+
+    Each purchase buys ``amount`` at the close of the candle open at the
+    purchase time. Purchases are counted per candle and accumulated with
+    cumulative sums, so the cost is O(candles + purchases) however long
+    the schedule is.
+
+    Args:
+        timestamps: Sorted candle open times in epoch seconds
+        closes: Close price of each candle
+        amount: USD spent on each purchase
+        purchase_times: Purchase times in epoch seconds
+
+    Returns:
+        Running totals after each candle, keyed "purchases", "invested"
+        and "coins"
+
+    Raises:
+        InsufficientPriceDataError: If no purchase falls within the series
+        InvalidInvestmentError: If a close price is not positive
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    if (closes <= 0).any():
+        raise InvalidInvestmentError("Opening price must be positive")
+
+    indices = np.searchsorted(timestamps, purchase_times, side="right") - 1
+    indices = indices[indices >= 0]
+    if indices.size == 0:
+        raise InsufficientPriceDataError("No price data covers the purchase dates")
+
+    counts = np.bincount(indices, minlength=closes.size)
+    purchases = np.cumsum(counts)
+    return {
+        "purchases": purchases,
+        "invested": purchases * amount,
+        "coins": np.cumsum(counts * (amount / closes)),
+    }
+
+
+def calculate_portfolio_values(
+    holdings: list[tuple[np.ndarray, np.ndarray, float, float]],
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorised value over time of lump-sum holdings in several symbols.
+
+    The series are aligned on the union of their candle times, and each
+    holding is forward-filled from its latest candle. Before a symbol's
+    history starts its holding counts as the uninvested amount.
+
+    Args:
+        holdings: (timestamps, closes, coins, amount) per holding, with
+            sorted epoch-second timestamps
+
+    Returns:
+        The aligned epoch-second times and the total value at each
+    """
+    grid = np.unique(np.concatenate([timestamps for timestamps, *_ in holdings]))
+    total = np.zeros(grid.size)
+    for timestamps, closes, coins, amount in holdings:
+        indices = np.searchsorted(timestamps, grid, side="right") - 1
+        values = coins * np.asarray(closes, dtype=np.float64)[indices.clip(0)]
+        total += np.where(indices >= 0, values, amount)
+    return grid, total
+
+
+def chart_points(
+    timestamps: np.ndarray, values: np.ndarray
+) -> list[dict[str, str | float]]:
+    """Build chart data from epoch-second times and values."""
+    labels = _format_local_timestamps(np.asarray(timestamps, dtype=np.int64))
+    return [
+        {"x": label, "y": value}
+        for label, value in zip(labels.tolist(), np.asarray(values).tolist())
+    ]
+
+
 @dataclass
 class PriceData:
     """
@@ -125,18 +344,45 @@ class PriceData:
 
     symbol: str
     prices: list[tuple[datetime, Decimal]]
+    # Precomputed OPENING_PERIOD_WEEKS average, e.g. from OPENING_AVERAGE
+    opening_average: Optional[Decimal] = field(default=None, compare=False)
+    # Wall-clock epoch seconds when the data was fetched from upstream
+    fetched_at: Optional[float] = field(default=None, compare=False)
 
     def __post_init__(self) -> None:
-        """Validate price data on creation."""
+        """Validate price data and build its prefix-sum index."""
         if not self.prices:
             raise InsufficientPriceDataError(
                 f"No price data available for {self.symbol}"
             )
+        # _cumulative[i] is the sum of the first i closes, so any window
+        # sum is one subtraction
+        self._cumulative = [Decimal(0), *accumulate(p for _, p in self.prices)]
+
+    @cached_property
+    def _epochs(self) -> list[float]:
+        """Candle times as epoch seconds, for binary search."""
+        return [timestamp.timestamp() for timestamp, _ in self.prices]
+
+    @cached_property
+    def series(self) -> tuple[np.ndarray, np.ndarray]:
+        """Candle times (epoch seconds) and closes as float64 arrays."""
+        closes = np.array([float(price) for _, price in self.prices])
+        return np.asarray(self._epochs, dtype=np.float64), closes
+
+    @property
+    def version(self) -> str:
+        """Identify the candle set: changes when a candle arrives or updates."""
+        timestamp, price = self.prices[-1]
+        return f"{len(self.prices)}:{int(timestamp.timestamp())}:{price}"
 
     def get_opening_average(self, weeks: int = OPENING_PERIOD_WEEKS) -> Decimal:
         """
         Get average price of first N weeks.
 
+        Returns the precomputed ``opening_average`` for the default window
+        when one is attached.
+
         Args:
             weeks: Number of weeks to average
 
@@ -146,13 +392,11 @@ class PriceData:
         Raises:
             InsufficientPriceDataError: If not enough data points
         """
-        if len(self.prices) < weeks:
-            raise InsufficientPriceDataError(
-                f"Not enough data points. Need {weeks}, have {len(self.prices)}"
-            )
+        if self.opening_average is not None and weeks == OPENING_PERIOD_WEEKS:
+            return self.opening_average
 
-        prices = [p[1] for p in self.prices[:weeks]]
-        return sum(prices) / Decimal(len(prices))
+        _require_points(weeks, len(self.prices))
+        return self.window_average(0, weeks)
 
     def get_current_average(self, weeks: int = CURRENT_PERIOD_WEEKS) -> Decimal:
         """
@@ -167,27 +411,472 @@ class PriceData:
         Raises:
             InsufficientPriceDataError: If not enough data points
         """
-        if len(self.prices) < weeks:
+        _require_points(weeks, len(self.prices))
+        return self.window_average(len(self.prices) - weeks, len(self.prices))
+
+    def window_average(self, start: int, end: int) -> Decimal:
+        """
+        Get average close of candles ``[start, end)`` by position in O(1).
+
+        Raises:
+            InsufficientPriceDataError: If the window is empty or out of range
+        """
+        _require_window(start, end, len(self.prices))
+        total = self._cumulative[end] - self._cumulative[start]
+        return total / Decimal(end - start)
+
+    def index_of(self, when: Union[datetime, float]) -> int:
+        """
+        Get the position of the first candle at or after ``when``.
+
+        Args:
+            when: Local naive datetime or epoch seconds
+
+        Returns:
+            Candle index, or the candle count if every candle is earlier
+        """
+        return bisect_left(self._epochs, _epoch_seconds(when))
+
+    def average_between(
+        self, start: Union[datetime, float], end: Union[datetime, float]
+    ) -> Decimal:
+        """
+        Get average close of candles opening in ``[start, end)``.
+
+        Binary search finds the window, so the cost is O(log n).
+
+        Raises:
+            InsufficientPriceDataError: If no candle falls in the range
+        """
+        return self.window_average(self.index_of(start), self.index_of(end))
+
+    def rolling_averages(self, weeks: int) -> np.ndarray:
+        """
+        Get the average close of every N-candle window, by start position.
+
+        One vectorized pass over the prefix sums; element i is
+        ``window_average(i, i + weeks)`` as float64.
+
+        Raises:
+            InsufficientPriceDataError: If not enough data points
+        """
+        _require_points(weeks, len(self.prices))
+        cumulative = np.array(self._cumulative, dtype=np.float64)
+        return (cumulative[weeks:] - cumulative[:-weeks]) / weeks
+
+    def average_from(
+        self, when: Union[datetime, float], weeks: int = OPENING_PERIOD_WEEKS
+    ) -> Decimal:
+        """
+        Get average close of the first N candles opening at or after ``when``.
+
+        Binary search finds the window, so the cost is O(log n).
+
+        Raises:
+            DateOutOfRangeError: If fewer than N candles follow ``when``
+        """
+        start = self.index_of(when)
+        _require_dated_window(start, start + weeks, len(self.prices))
+        return self.window_average(start, start + weeks)
+
+    def average_before(
+        self, when: Union[datetime, float], weeks: int = CURRENT_PERIOD_WEEKS
+    ) -> Decimal:
+        """
+        Get average close of the last N candles opening before ``when``.
+
+        Raises:
+            DateOutOfRangeError: If fewer than N candles precede ``when``
+        """
+        end = self.index_of(when)
+        _require_dated_window(end - weeks, end, len(self.prices))
+        return self.window_average(end - weeks, end)
+
+    def to_chart_data(
+        self, points: Optional[int] = None
+    ) -> list[dict[str, str | float]]:
+        """
+        Convert price data to chart format for frontend.
+
+        Args:
+            points: Downsample to this many points with LTTB; None keeps all
+
+        Returns:
+            List of dictionaries with 'x' (timestamp) and 'y' (price)
+        """
+        prices = self.prices
+        if points is not None and points < len(prices):
+            indices = lttb_indices(
+                np.asarray(self._epochs), [float(p) for _, p in prices], points
+            )
+            prices = [prices[i] for i in indices.tolist()]
+
+        return [
+            {"x": timestamp.strftime(DATE_TIME_FORMAT), "y": float(price)}
+            for timestamp, price in prices
+        ]
+
+
+@dataclass(eq=False)
+class ColumnarPriceData:
+    """
+    Columnar price data backed by NumPy arrays.
+
+    Same analysis interface as PriceData, but holds int64 epoch seconds
+    and float64 close prices so averages and chart export run as
+    vectorized operations. PriceData remains the exact Decimal mode.
+    """
+
+    symbol: str
+    timestamps: np.ndarray
+    closes: np.ndarray
+    # Precomputed OPENING_PERIOD_WEEKS average, e.g. from OPENING_AVERAGE
+    opening_average: Optional[Decimal] = None
+    # Wall-clock epoch seconds when the data was fetched from upstream
+    fetched_at: Optional[float] = None
+
+    def __post_init__(self) -> None:
+        """Validate and normalise the columns on creation."""
+        self.timestamps = np.asarray(self.timestamps, dtype=np.int64)
+        self.closes = np.asarray(self.closes, dtype=np.float64)
+
+        if self.timestamps.size == 0:
+            raise InsufficientPriceDataError(
+                f"No price data available for {self.symbol}"
+            )
+        if self.timestamps.shape != self.closes.shape:
             raise InsufficientPriceDataError(
-                f"Not enough data points. Need {weeks}, have {len(self.prices)}"
+                f"Mismatched price columns for {self.symbol}"
             )
+        # Prefix sums with a leading zero: window sums are one subtraction
+        self._cumulative = np.concatenate(([0.0], np.cumsum(self.closes)))
+
+    @classmethod
+    def from_price_data(cls, price_data: PriceData) -> "ColumnarPriceData":
+        """Build columnar data from exact PriceData."""
+        return cls(
+            symbol=price_data.symbol,
+            timestamps=[
+                int(timestamp.timestamp()) for timestamp, _ in price_data.prices
+            ],
+            closes=[float(price) for _, price in price_data.prices],
+            opening_average=price_data.opening_average,
+            fetched_at=price_data.fetched_at,
+        )
+
+    def to_price_data(self) -> PriceData:
+        """Convert back to exact PriceData."""
+        return PriceData(
+            symbol=self.symbol,
+            prices=self.prices,
+            opening_average=self.opening_average,
+            fetched_at=self.fetched_at,
+        )
+
+    @property
+    def series(self) -> tuple[np.ndarray, np.ndarray]:
+        """Candle times (epoch seconds) and closes as arrays."""
+        return self.timestamps, self.closes
+
+    @property
+    def version(self) -> str:
+        """Identify the candle set: changes when a candle arrives or updates."""
+        timestamp, price = self.timestamps[-1], self.closes[-1]
+        return f"{self.closes.size}:{timestamp}:{Decimal(repr(float(price)))}"
+
+    @property
+    def prices(self) -> list[tuple[datetime, Decimal]]:
+        """Materialise (datetime, Decimal) rows for row-oriented callers."""
+        return [
+            (datetime.fromtimestamp(timestamp), Decimal(repr(price)))
+            for timestamp, price in zip(self.timestamps.tolist(), self.closes.tolist())
+        ]
+
+    def get_opening_average(self, weeks: int = OPENING_PERIOD_WEEKS) -> Decimal:
+        """
+        Get average price of first N weeks.
 
-        prices = [p[1] for p in self.prices[-weeks:]]
-        return sum(prices) / Decimal(len(prices))
+        Raises:
+            InsufficientPriceDataError: If not enough data points
+        """
+        if self.opening_average is not None and weeks == OPENING_PERIOD_WEEKS:
+            return self.opening_average
+
+        _require_points(weeks, self.closes.size)
+        return self.window_average(0, weeks)
+
+    def get_current_average(self, weeks: int = CURRENT_PERIOD_WEEKS) -> Decimal:
+        """
+        Get average price of last N weeks.
+
+        Raises:
+            InsufficientPriceDataError: If not enough data points
+        """
+        _require_points(weeks, self.closes.size)
+        return self.window_average(self.closes.size - weeks, self.closes.size)
+
+    def window_average(self, start: int, end: int) -> Decimal:
+        """
+        Get average close of candles ``[start, end)`` by position in O(1).
 
-    def to_chart_data(self) -> list[dict[str, str | float]]:
+        Raises:
+            InsufficientPriceDataError: If the window is empty or out of range
+        """
+        _require_window(start, end, self.closes.size)
+        total = self._cumulative[end] - self._cumulative[start]
+        return Decimal(repr(float(total / (end - start))))
+
+    def index_of(self, when: Union[datetime, float]) -> int:
+        """Get the position of the first candle at or after ``when``."""
+        return int(np.searchsorted(self.timestamps, _epoch_seconds(when)))
+
+    def average_between(
+        self, start: Union[datetime, float], end: Union[datetime, float]
+    ) -> Decimal:
+        """
+        Get average close of candles opening in ``[start, end)``.
+
+        Raises:
+            InsufficientPriceDataError: If no candle falls in the range
+        """
+        return self.window_average(self.index_of(start), self.index_of(end))
+
+    def rolling_averages(self, weeks: int) -> np.ndarray:
+        """
+        Get the average close of every N-candle window, by start position.
+
+        Raises:
+            InsufficientPriceDataError: If not enough data points
+        """
+        _require_points(weeks, self.closes.size)
+        return (self._cumulative[weeks:] - self._cumulative[:-weeks]) / weeks
+
+    def average_from(
+        self, when: Union[datetime, float], weeks: int = OPENING_PERIOD_WEEKS
+    ) -> Decimal:
+        """
+        Get average close of the first N candles opening at or after ``when``.
+
+        Raises:
+            DateOutOfRangeError: If fewer than N candles follow ``when``
+        """
+        start = self.index_of(when)
+        _require_dated_window(start, start + weeks, self.closes.size)
+        return self.window_average(start, start + weeks)
+
+    def average_before(
+        self, when: Union[datetime, float], weeks: int = CURRENT_PERIOD_WEEKS
+    ) -> Decimal:
+        """
+        Get average close of the last N candles opening before ``when``.
+
+        Raises:
+            DateOutOfRangeError: If fewer than N candles precede ``when``
+        """
+        end = self.index_of(when)
+        _require_dated_window(end - weeks, end, self.closes.size)
+        return self.window_average(end - weeks, end)
+
+    def to_chart_data(
+        self, points: Optional[int] = None
+    ) -> list[dict[str, str | float]]:
         """
         Convert price data to chart format for frontend.
 
+        Args:
+            points: Downsample to this many points with LTTB; None keeps all
+
         Returns:
             List of dictionaries with 'x' (timestamp) and 'y' (price)
         """
+        timestamps, closes = self.timestamps, self.closes
+        if points is not None and points < closes.size:
+            indices = lttb_indices(timestamps, closes, points)
+            timestamps, closes = timestamps[indices], closes[indices]
+
+        labels = _format_local_timestamps(timestamps)
         return [
-            {"x": timestamp.strftime(DATE_TIME_FORMAT), "y": float(price)}
-            for timestamp, price in self.prices
+            {"x": label, "y": price}
+            for label, price in zip(labels.tolist(), closes.tolist())
         ]
 
 
+# Either price data representation; both share the analysis interface
+AnyPriceData = Union[PriceData, ColumnarPriceData]
+
+
+@dataclass(eq=False)
+class AnalysisKernel:
+    """
+    Amount-independent analysis of one symbol's price data.
+
+    The averages, growth factor and charts depend only on the candles, so
+    they are computed once per candle version; ``evaluate`` then answers
+    any investment amount with a few operations in the kernel's numeric
+    backend (Decimal or float64).
+    """
+
+    symbol: str
+    version: str
+    opening_average: Union[Decimal, float]
+    current_average: Union[Decimal, float]
+    growth_factor: Union[Decimal, float]
+    price_data: AnyPriceData = field(repr=False)
+    opening_weeks: int = OPENING_PERIOD_WEEKS
+    numeric: NumericBackend = field(default=EXACT, repr=False)
+    _charts: dict[Optional[int], list[dict[str, str | float]]] = field(
+        default_factory=dict, repr=False
+    )
+    _entries: Optional[tuple[list[str], np.ndarray, np.ndarray]] = field(
+        default=None, repr=False
+    )
+
+    @classmethod
+    def build(
+        cls,
+        price_data: AnyPriceData,
+        opening_weeks: int = OPENING_PERIOD_WEEKS,
+        current_weeks: int = CURRENT_PERIOD_WEEKS,
+        buy_date: Optional[float] = None,
+        sell_date: Optional[float] = None,
+        numeric: NumericBackend = EXACT,
+    ) -> "AnalysisKernel":
+        """
+        Compute the kernel for price data and averaging windows.
+
+        Without dates the buy window is the first candles of the history and
+        the sell window the last; ``buy_date`` and ``sell_date`` (epoch
+        seconds) move them to the candles starting at and ending before
+        those times.
+
+        Raises:
+            DateOutOfRangeError: If a date leaves a window outside the history
+            InsufficientPriceDataError: If not enough data points
+            InvalidInvestmentError: If opening price is invalid
+        """
+        if buy_date is None:
+            opening = price_data.get_opening_average(opening_weeks)
+        else:
+            opening = price_data.average_from(buy_date, opening_weeks)
+        if sell_date is None:
+            current = price_data.get_current_average(current_weeks)
+        else:
+            current = price_data.average_before(sell_date, current_weeks)
+        opening, current = numeric.number(opening), numeric.number(current)
+        if opening <= 0:
+            raise InvalidInvestmentError("Opening price must be positive")
+
+        return cls(
+            symbol=price_data.symbol,
+            version=price_data.version,
+            opening_average=opening,
+            current_average=current,
+            growth_factor=current / opening - 1,
+            price_data=price_data,
+            opening_weeks=opening_weeks,
+            numeric=numeric,
+        )
+
+    def evaluate(self, amount: Decimal) -> dict[str, Union[Decimal, float]]:
+        """
+        Calculate the metrics for an investment amount.
+
+        Returns:
+            Backend numbers keyed "coins", "profit", "growth" and "lambos"
+        """
+        amount = self.numeric.number(amount)
+        profit = amount * self.growth_factor
+        return {
+            "coins": amount / self.opening_average,
+            "profit": profit,
+            "growth": self.growth_factor,
+            "lambos": profit / self.numeric.lambo_price,
+        }
+
+    def chart(self, points: Optional[int] = None) -> list[dict[str, str | float]]:
+        """Chart data at a resolution, built on first use and then reused."""
+        chart = self._charts.get(points)
+        if chart is None:
+            chart = self._charts[points] = self.price_data.to_chart_data(points)
+        return chart
+
+    def entry_growth(self) -> tuple[list[str], np.ndarray, np.ndarray]:
+        """
+        Growth factor of buying at every candle, computed once per kernel.
+
+        Entry i buys at the average of the ``opening_weeks`` candles from
+        candle i and sells at ``current_average``.
+
+        Returns:
+            Entry dates (chart labels), buy prices and growth factors
+
+        Raises:
+            InsufficientPriceDataError: If not enough data points
+            InvalidInvestmentError: If a buy price is not positive
+        """
+        if self._entries is None:
+            opening = self.price_data.rolling_averages(self.opening_weeks)
+            if (opening <= 0).any():
+                raise InvalidInvestmentError("Opening price must be positive")
+            labels = [point["x"] for point in self.chart()[: opening.size]]
+            growth = float(self.current_average) / opening - 1
+            self._entries = (labels, opening, growth)
+        return self._entries
+
+
+def _require_points(weeks: int, count: int) -> None:
+    """Check that a series holds at least ``weeks`` candles."""
+    if count < weeks:
+        raise InsufficientPriceDataError(
+            f"Not enough data points. Need {weeks}, have {count}"
+        )
+
+
+def _require_window(start: int, end: int, count: int) -> None:
+    """Check that ``[start, end)`` is a non-empty window of the series."""
+    if not 0 <= start < end <= count:
+        raise InsufficientPriceDataError(
+            f"No price data in window [{start}, {end}) of {count} candles"
+        )
+
+
+def _require_dated_window(start: int, end: int, count: int) -> None:
+    """Check that a window placed by a requested date lies in the series."""
+    if not 0 <= start < end <= count:
+        raise DateOutOfRangeError(
+            f"No price data in window [{start}, {end}) of {count} candles "
+            "around the requested date"
+        )
+
+
+def _epoch_seconds(when: Union[datetime, float]) -> float:
+    """Convert a datetime (naive means local, like the candles) to epoch."""
+    if isinstance(when, datetime):
+        return when.timestamp()
+    return float(when)
+
+
+def _format_local_timestamps(timestamps: np.ndarray) -> np.ndarray:
+    """
+    Format epoch seconds with DATE_TIME_FORMAT in server-local time.
+
+    Matches ``datetime.fromtimestamp(...).strftime`` used by PriceData.
+    Vectorized when the local zone has no DST (always the case on UTC
+    servers); otherwise falls back to per-row formatting.
+    """
+    if time.daylight:
+        return np.array(
+            [
+                datetime.fromtimestamp(timestamp).strftime(DATE_TIME_FORMAT)
+                for timestamp in timestamps.tolist()
+            ]
+        )
+
+    offset = -time.timezone
+    local = (timestamps + offset).astype("datetime64[s]")
+    return np.char.replace(np.datetime_as_string(local, unit="s"), "T", " ")
+
+
 # Database Models
 
 
@@ -216,6 +905,30 @@ class OpeningAverage(Base):
     AVERAGE = Column(Float)
 
 
+class Candle(Base):
+    """Class to represent a CANDLES object"""
+
+    __tablename__ = "CANDLES"
+
+    SYMBOL = Column(String, primary_key=True)
+    INTERVAL = Column(Integer, primary_key=True)
+    TIMESTAMP = Column(Integer, primary_key=True)
+    # Close price kept as Kraken's decimal string so reloads stay exact
+    CLOSE = Column(String, nullable=False)
+
+
+class LeaderboardEntry(Base):
+    """Class to represent a LEADERBOARD object"""
+
+    __tablename__ = "LEADERBOARD"
+
+    RANK = Column(Integer, primary_key=True)
+    SYMBOL = Column(String, nullable=False)
+    GROWTHFACTOR = Column(Float)
+    LAMBOS = Column(Float)
+    GENERATIONDATE = Column(DateTime)
+
+
 class Logging(Base):
     """Class to represent an LOGGING object"""
 
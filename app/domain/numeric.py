@@ -0,0 +1,51 @@
+"""Numeric backends for the analysis arithmetic."""
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import Any, Callable
+
+from .constants import LAMBO_PRICE
+
+
+@dataclass(frozen=True)
+class NumericBackend:
+    """
+    Number type used by the analysis kernel.
+
+    "exact" keeps the Decimal arithmetic. "fast" does the same formulas in
+    float64, which agrees with exact to within FAST_MATH_RTOL (relative)
+    and is what the API returns anyway.
+    """
+
+    name: str
+    # Convert a price, average or amount to the backend's number type
+    number: Callable[[Any], Any]
+    lambo_price: Any
+
+
+def _to_decimal(value: Any) -> Decimal:
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(repr(value)) if isinstance(value, float) else Decimal(value)
+
+
+EXACT = NumericBackend("exact", _to_decimal, LAMBO_PRICE)
+FAST = NumericBackend("fast", float, float(LAMBO_PRICE))
+
+NUMERIC_BACKENDS = {backend.name: backend for backend in (EXACT, FAST)}
+
+
+def get_numeric_backend(name: str) -> NumericBackend:
+    """
+    Look up a numeric backend by name.
+
+    Raises:
+        ValueError: If the name is not "exact" or "fast"
+    """
+    try:
+        return NUMERIC_BACKENDS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown numeric mode {name!r}; expected one of "
+            f"{', '.join(NUMERIC_BACKENDS)}"
+        ) from None
@@ -0,0 +1,242 @@
+"""Buffered investment query log written by a background flusher."""
+
+import atexit
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import deque
+from datetime import datetime
+from typing import Any, Optional
+
+from flask import Flask
+
+from app.domain.constants import (
+    QUERY_LOG_BATCH_SIZE,
+    QUERY_LOG_FLUSH_INTERVAL,
+    QUERY_LOG_PUT_TIMEOUT,
+    QUERY_LOG_QUEUE_SIZE,
+)
+from app.domain.models import Investment
+from app.domain.repositories import QueryLogRow, SqlAlchemyInvestmentRepository
+
+logger = logging.getLogger(__name__)
+
+
+class BufferedInvestmentRepository:
+    """
+    Investment log with SqlAlchemyInvestmentRepository's interface that
+    keeps database writes off the request path.
+
+    ``log_query`` and ``log_queries`` only append to a bounded in-memory
+    queue. A flusher thread bulk-inserts queued rows once ``batch_size``
+    are waiting or ``flush_interval`` seconds have passed. When the queue
+    is full a caller waits up to ``put_timeout`` seconds for room, then
+    the row is dropped and counted. ``shutdown`` writes whatever is still
+    queued and runs at interpreter exit.
+    """
+
+    def __init__(
+        self,
+        repository: SqlAlchemyInvestmentRepository,
+        max_queue: int = QUERY_LOG_QUEUE_SIZE,
+        batch_size: int = QUERY_LOG_BATCH_SIZE,
+        flush_interval: float = QUERY_LOG_FLUSH_INTERVAL,
+        put_timeout: float = QUERY_LOG_PUT_TIMEOUT,
+    ) -> None:
+        self.repository = repository
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.put_timeout = put_timeout
+
+        self._queue: deque[QueryLogRow] = deque()
+        self._lock = threading.Lock()
+        # _ready wakes the flusher; _room wakes callers waiting for space
+        self._ready = threading.Condition(self._lock)
+        self._room = threading.Condition(self._lock)
+        self._flusher: Optional[threading.Thread] = None
+        self._closing = False
+
+        self.enqueued = 0
+        self.dropped = 0
+        self.written = 0
+        self.failed = 0
+        self.flushes = 0
+        self.flush_seconds = 0.0
+        self.max_flush_seconds = 0.0
+        _repositories.add(self)
+
+    def init_app(self, app: Flask) -> None:
+        """Configure queue and flush thresholds from ``QUERY_LOG_*`` config."""
+        self.shutdown()
+        self.max_queue = app.config.get("QUERY_LOG_QUEUE_SIZE", self.max_queue)
+        self.batch_size = app.config.get("QUERY_LOG_BATCH_SIZE", self.batch_size)
+        self.flush_interval = app.config.get(
+            "QUERY_LOG_FLUSH_INTERVAL", self.flush_interval
+        )
+        self.put_timeout = app.config.get("QUERY_LOG_PUT_TIMEOUT", self.put_timeout)
+
+    def log_query(self, investment: Investment) -> None:
+        """Queue an investment query for logging."""
+        self._put(
+            [(investment.symbol, float(investment.amount), investment.created_at)]
+        )
+
+    def log_queries(
+        self, entries: list[tuple[str, float]], created_at: datetime
+    ) -> None:
+        """
+        Queue many investment queries for logging.
+
+        Args:
+            entries: (symbol, amount) pairs
+            created_at: Generation time shared by the batch
+        """
+        self._put([(symbol, float(amount), created_at) for symbol, amount in entries])
+
+    def flush(self) -> None:
+        """Write every queued row from the calling thread."""
+        while True:
+            with self._lock:
+                batch = self._take()
+            if not batch:
+                return
+            self._write(batch)
+
+    def shutdown(self, timeout: float = 5.0) -> None:
+        """Stop the flusher and write what is still queued."""
+        with self._lock:
+            flusher = self._flusher
+            self._closing = True
+            self._ready.notify_all()
+            self._room.notify_all()
+        if flusher is not None:
+            flusher.join(timeout)
+        with self._lock:
+            self._flusher = None
+            self._closing = False
+        self.flush()
+
+    def stats(self) -> dict[str, Any]:
+        """Return queue depth, row counters and flush latency."""
+        with self._lock:
+            return {
+                "depth": len(self._queue),
+                "max_queue": self.max_queue,
+                "batch_size": self.batch_size,
+                "flush_interval": self.flush_interval,
+                "enqueued": self.enqueued,
+                "dropped": self.dropped,
+                "written": self.written,
+                "failed": self.failed,
+                "flushes": self.flushes,
+                "mean_flush_seconds": (
+                    self.flush_seconds / self.flushes if self.flushes else 0.0
+                ),
+                "max_flush_seconds": self.max_flush_seconds,
+            }
+
+    def _put(self, rows: list[QueryLogRow]) -> None:
+        """Queue rows, waiting up to ``put_timeout`` for room before dropping."""
+        if not rows:
+            return
+        deadline = time.monotonic() + self.put_timeout
+        with self._lock:
+            self._start_flusher()
+            for row in rows:
+                if len(self._queue) >= self.max_queue:
+                    self._ready.notify()
+                    self._room.wait_for(
+                        lambda: len(self._queue) < self.max_queue or self._closing,
+                        timeout=max(deadline - time.monotonic(), 0.0),
+                    )
+                if len(self._queue) >= self.max_queue:
+                    self.dropped += 1
+                    continue
+                self._queue.append(row)
+                self.enqueued += 1
+            if self._batch_ready():
+                self._ready.notify()
+
+    def _start_flusher(self) -> None:
+        """Start the flusher thread if it is not running (lock held)."""
+        if self._flusher is None or not self._flusher.is_alive():
+            self._flusher = threading.Thread(
+                target=self._run, name="query-log-flush", daemon=True
+            )
+            self._flusher.start()
+
+    def _run(self) -> None:
+        """Flush a batch whenever one fills or the interval elapses."""
+        while True:
+            with self._lock:
+                self._ready.wait_for(
+                    lambda: self._batch_ready() or self._closing,
+                    timeout=self.flush_interval,
+                )
+                batch = self._take()
+                closing = self._closing
+            if batch:
+                self._write(batch)
+            elif closing:
+                return
+
+    def _batch_ready(self) -> bool:
+        """Whether a full batch, or a full queue, is waiting (lock held)."""
+        return len(self._queue) >= min(self.batch_size, self.max_queue)
+
+    def _take(self) -> list[QueryLogRow]:
+        """Pop up to ``batch_size`` rows and wake waiting callers (lock held)."""
+        count = min(len(self._queue), self.batch_size)
+        batch = [self._queue.popleft() for _ in range(count)]
+        if batch:
+            self._room.notify_all()
+        return batch
+
+    def _write(self, batch: list[QueryLogRow]) -> None:
+        """Bulk insert a batch and record its outcome and latency."""
+        started = time.perf_counter()
+        try:
+            self.repository.insert_rows(batch)
+            written, failed = len(batch), 0
+        except Exception as e:
+            logger.error(f"Error flushing {len(batch)} logged queries: {e}")
+            written, failed = 0, len(batch)
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self.written += written
+            self.failed += failed
+            self.flushes += 1
+            self.flush_seconds += elapsed
+            self.max_flush_seconds = max(self.max_flush_seconds, elapsed)
+
+    def _reset_after_fork(self) -> None:
+        """Drop the parent's flusher and rows; the parent writes those."""
+        self._queue = deque()
+        self._lock = threading.Lock()
+        self._ready = threading.Condition(self._lock)
+        self._room = threading.Condition(self._lock)
+        self._flusher = None
+        self._closing = False
+
+
+# Every buffered log, so forked children can drop inherited state and all
+# of them are flushed at exit
+_repositories: "weakref.WeakSet[BufferedInvestmentRepository]" = weakref.WeakSet()
+
+
+def _reset_repositories_after_fork() -> None:
+    for repo in list(_repositories):
+        repo._reset_after_fork()
+
+
+@atexit.register
+def _shutdown_repositories() -> None:
+    for repo in list(_repositories):
+        repo.shutdown()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_repositories_after_fork)
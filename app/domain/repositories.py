@@ -1,108 +1,953 @@
 """Infrastructure repositories implementation."""
 
+import dataclasses
+import json
 import logging
+import math
+import os
 import random
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 import requests
+from flask import Flask
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
-from app.domain.exceptions import InsufficientPriceDataError, SymbolNotFoundError
-from app.domain.models import Investment, Logging, OpeningAverage, PriceData, Results
+from app.domain.asset_pairs import AssetPairIndex
+from app.domain.codecs import (
+    OHLCFrame,
+    decode_price_data,
+    encode_price_data,
+    ohlc_decoder,
+)
+from app.domain.constants import (
+    API_TIMEOUT,
+    CANDLE_ROLLUP_INTERVALS,
+    HISTORY_START_TIMESTAMP,
+    LEADERBOARD_CACHE_TTL,
+    OHLC_INTERVAL_MINUTES,
+    OHLC_MAX_CANDLES,
+    PRICE_CACHE_MAX_STALE,
+    PRICE_CACHE_SIZE,
+    PRICE_CACHE_TTL,
+    PRICE_REFRESH_WORKERS,
+    UNKNOWN_SYMBOL_CACHE_SIZE,
+    UNKNOWN_SYMBOL_TTL,
+)
+from app.domain.exceptions import (
+    ExternalServiceError,
+    InsufficientPriceDataError,
+    SymbolNotFoundError,
+)
+from app.domain.models import (
+    AnyPriceData,
+    Candle,
+    ColumnarPriceData,
+    Investment,
+    LeaderboardEntry,
+    Logging,
+    OpeningAverage,
+    PriceData,
+    Results,
+)
+from app.shared.cache import TTLCache
 from app.shared.database import Database
+from app.shared.http_client import HttpClient
+from app.shared.redis_cache import RedisCache
 
 logger = logging.getLogger(__name__)
 
+# A stored candle: (epoch seconds, close price as Kraken's decimal string)
+CandleRow = tuple[int, str]
+
+# A logged query: (symbol, amount in USD, generation time)
+QueryLogRow = tuple[str, float, datetime]
+
 
 class KrakenPriceRepository:
-    """Repository for fetching price data from Kraken API."""
+    """
+    Repository for fetching price data from Kraken API.
 
-    def __init__(self, database: Database):
+    In the default "blocking" serving mode a request waits for Kraken
+    whenever its cached data is older than ``price_cache_ttl``. In
+    "stale-while-revalidate" mode that data is still returned at once, and a
+    background refresh is scheduled; only data older than ``max_stale``
+    blocks the request.
+    """
+
+    def __init__(
+        self,
+        database: Database,
+        http_client: Optional[HttpClient] = None,
+        candle_store: Optional["SqlAlchemyCandleRepository"] = None,
+        opening_averages: Optional["SqlAlchemyOpeningAverageRepository"] = None,
+        asset_pairs: Optional[AssetPairIndex] = None,
+        shared_cache: Optional[RedisCache] = None,
+        price_data_mode: str = "exact",
+        serving_mode: str = "blocking",
+        price_cache_ttl: float = PRICE_CACHE_TTL,
+        price_cache_size: int = PRICE_CACHE_SIZE,
+        max_stale: float = PRICE_CACHE_MAX_STALE,
+        refresh_workers: int = PRICE_REFRESH_WORKERS,
+        unknown_symbol_ttl: float = UNKNOWN_SYMBOL_TTL,
+        unknown_symbol_cache_size: int = UNKNOWN_SYMBOL_CACHE_SIZE,
+    ):
         self.db = database
+        self.http = http_client or HttpClient(read_timeout=API_TIMEOUT)
+        self.candle_store = candle_store
+        self.opening_averages = opening_averages
         self.base_url = "https://api.kraken.com/0/public/OHLC"
+        self.asset_pairs_url = "https://api.kraken.com/0/public/AssetPairs"
+        # Local USD pair list for existence checks and pair names
+        self.asset_pairs = asset_pairs or AssetPairIndex(self._fetch_asset_pairs)
+        # "exact" builds Decimal PriceData, "columnar" NumPy-backed data
+        self.price_data_mode = price_data_mode
+        self.decoder = ohlc_decoder
 
-    def symbol_exists(self, symbol: str) -> bool:
-        """Check if symbol exists on exchange."""
-        try:
-            response = requests.get(
-                f"{self.base_url}?pair={symbol}USD&interval=21600&since=1548111600"
+        # Optional cross-process tier between the in-process cache and Kraken
+        self.shared_cache = shared_cache
+        self.shared_cache_ttl = price_cache_ttl
+
+        # "blocking" or "stale-while-revalidate"; data younger than
+        # fresh_ttl is fresh, stale data is served for up to max_stale
+        self.serving_mode = serving_mode
+        self.fresh_ttl = price_cache_ttl
+        self.max_stale = max_stale
+        self.refresh_workers = refresh_workers
+
+        # Per-symbol PriceData, with concurrent misses coalesced
+        self.price_cache: TTLCache[AnyPriceData] = TTLCache(
+            maxsize=price_cache_size, ttl=price_cache_ttl
+        )
+        # Negative cache of symbols Kraken reported as unknown
+        self.unknown_symbols: TTLCache[bool] = TTLCache(
+            maxsize=unknown_symbol_cache_size, ttl=unknown_symbol_ttl
+        )
+
+        # Symbols with a background refresh queued or running
+        self._refreshing: set[str] = set()
+        self._refresh_lock = threading.Lock()
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        self._apply_serving_mode()
+        _price_repositories.add(self)
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Configure the repository from Flask app config.
+
+        Replaces the upstream client with one sized and timed by the
+        ``KRAKEN_*`` settings, sizes the price cache from ``PRICE_CACHE_*``
+        and attaches the Redis tier when ``ENABLE_CACHING`` is set.
+        """
+        self.base_url = app.config.get("KRAKEN_API_URL", self.base_url)
+        self.price_data_mode = app.config.get("PRICE_DATA_MODE", self.price_data_mode)
+        self.serving_mode = app.config.get("PRICE_SERVING_MODE", self.serving_mode)
+        self.fresh_ttl = app.config.get("PRICE_CACHE_TTL", self.fresh_ttl)
+        self.max_stale = app.config.get("PRICE_CACHE_MAX_STALE", self.max_stale)
+        self.refresh_workers = app.config.get(
+            "PRICE_REFRESH_WORKERS", self.refresh_workers
+        )
+        self.price_cache.maxsize = app.config.get(
+            "PRICE_CACHE_SIZE", self.price_cache.maxsize
+        )
+
+        if app.config.get("ENABLE_CACHING", False):
+            self.shared_cache = RedisCache.from_url(
+                app.config["SHARED_CACHE_URL"],
+                lock_ttl=app.config.get("SHARED_CACHE_LOCK_TTL", 30),
+                lock_wait=app.config.get("SHARED_CACHE_LOCK_WAIT", 10),
             )
-            data = response.json()
+            self.shared_cache_ttl = app.config.get(
+                "SHARED_CACHE_TTL", self.shared_cache_ttl
+            )
+        else:
+            self.shared_cache = None
+        self._apply_serving_mode()
+
+        previous = self.http
+        self.http = HttpClient(
+            pool_size=app.config.get("KRAKEN_POOL_SIZE", 10),
+            connect_timeout=app.config.get("KRAKEN_CONNECT_TIMEOUT", 3.05),
+            read_timeout=app.config.get("KRAKEN_READ_TIMEOUT", API_TIMEOUT),
+            max_retries=app.config.get("KRAKEN_MAX_RETRIES", 3),
+            backoff_factor=app.config.get("KRAKEN_BACKOFF_FACTOR", 0.5),
+            backoff_jitter=app.config.get("KRAKEN_BACKOFF_JITTER", 0.5),
+        )
+        previous.close()
 
-            if "error" in data and data["error"]:
-                # Check specifically for "Instrument not found" or similar errors
-                # Kraken returns errors as a list of strings
-                for error in data["error"]:
-                    if "Unknown asset pair" in error or "Instrument not found" in error:
-                        return False
+    def symbol_exists(self, symbol: str) -> bool:
+        """
+        Check if symbol exists on exchange.
 
-            # If result is empty or error present but not specific, might be other issue
-            # But for "exists" check, if we get a result, it exists.
-            if "result" in data and data["result"]:
-                return True
+        Answered from the local asset pair index. Only if the index cannot
+        be loaded is existence derived from an OHLC request, so prefer
+        calling get_price_data directly and handling SymbolNotFoundError
+        when the prices are needed anyway.
+        """
+        if self.unknown_symbols.get(symbol):
+            return False
+        try:
+            return self.asset_pairs.exists(symbol)
+        except ExternalServiceError as e:
+            logger.warning(f"Asset pair index unavailable, probing OHLC: {e}")
 
+        try:
+            self.get_price_data(symbol)
+            return True
+        except SymbolNotFoundError:
             return False
         except Exception as e:
             logger.error(f"Error checking symbol existence: {e}")
             return False
 
-    def get_price_data(self, symbol: str) -> PriceData:
-        """Get historical price data for a symbol."""
-        # 1. Check cache for opening average (optimization from original code)
-        # The original code cached the opening average.
-        # Here we are asked to return PriceData which contains a list of prices.
-        # The service then calculates averages.
-        # To be faithful to the original logic while fitting the new architecture,
-        # we should fetch the full data.
+    def get_price_data(self, symbol: str) -> AnyPriceData:
+        """
+        Get historical price data for a symbol.
 
-        # However, the original code had a specific optimization:
-        # if dataCache.check_if_historical_cache_exists(): use cached average
-        # else: fetch from API and cache it.
+        Served from the in-process price cache when possible; concurrent
+        misses for a symbol share a single upstream fetch. Unknown pairs
+        are remembered in a negative cache so repeated lookups fail fast.
 
-        # The new PriceData model expects a list of (datetime, Decimal).
-        # If we want to use the cache, we might need to adjust the repository
-        # to return the averages directly or construct PriceData differently.
+        Raises:
+            SymbolNotFoundError: If Kraken does not know the pair
+            ExternalServiceError: If Kraken cannot be reached or errors
+            InsufficientPriceDataError: If the response holds no candles
+        """
+        if self.unknown_symbols.get(symbol) or self._pair_name(symbol) is None:
+            raise SymbolNotFoundError(f"Symbol {symbol} not found on exchange")
 
-        # For now, let's implement fetching from Kraken as that's the primary source.
-        # We can add caching of the *opening average* as a side effect if needed,
-        # but the Service calculates it from the PriceData.
+        price_data = self.price_cache.get_or_load(
+            symbol,
+            lambda: self._attach_opening_average(self._load_price_data(symbol)),
+        )
+        if self.serving_mode == "stale-while-revalidate":
+            if _age(price_data) >= self.fresh_ttl:
+                self._schedule_refresh(symbol)
+        return price_data
 
-        # Let's fetch the data.
-        try:
-            url = f"{self.base_url}?pair={symbol}USD&interval=21600&since=1548111600"
-            response = requests.get(url)
-            data = response.json()
+    def get_chart_candles(
+        self,
+        symbol: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        points: Optional[int] = None,
+    ) -> tuple[int, np.ndarray, np.ndarray]:
+        """
+        Get closes for a chart range at the coarsest level it needs.
+
+        The finest candle level that covers ``[start, end)`` in at most
+        ``points`` candles is read from the candle store; without a point
+        budget, or if a rollup level is not stored, the base candles are
+        used.
+
+        Returns:
+            Interval in minutes, epoch-second times and closes
 
-            if "error" in data and data["error"]:
-                raise SymbolNotFoundError(
-                    f"Error fetching data for {symbol}: {data['error']}"
+        Raises:
+            SymbolNotFoundError: If Kraken does not know the pair
+            ExternalServiceError: If Kraken cannot be reached or errors
+            InsufficientPriceDataError: If no candle falls in the range
+        """
+        # Keeps the store current and validates the symbol
+        timestamps, closes = self.get_price_data(symbol).series
+        low = 0 if start is None else int(np.searchsorted(timestamps, start))
+        high = timestamps.size if end is None else int(np.searchsorted(timestamps, end))
+        if low >= high:
+            raise InsufficientPriceDataError(f"No price data for {symbol} in range")
+
+        interval = OHLC_INTERVAL_MINUTES
+        if points is not None:
+            interval = _chart_interval(timestamps[high - 1] - timestamps[low], points)
+        if interval != OHLC_INTERVAL_MINUTES and self.candle_store is not None:
+            try:
+                rows = self.candle_store.get_candles(symbol, interval, start, end)
+            except SQLAlchemyError as e:
+                logger.error(f"Error reading candle rollups for {symbol}: {e}")
+                rows = []
+            if rows:
+                return (
+                    interval,
+                    np.array([timestamp for timestamp, _ in rows], dtype=np.int64),
+                    np.array([close for _, close in rows], dtype=np.float64),
                 )
+        return OHLC_INTERVAL_MINUTES, timestamps[low:high], closes[low:high]
+
+    def usd_symbols(self) -> list[str]:
+        """
+        List the base symbols of every Kraken pair quoted in USD.
 
-            if "result" not in data:
-                raise InsufficientPriceDataError(f"No result data for {symbol}")
+        Raises:
+            ExternalServiceError: If Kraken cannot be reached or errors
+        """
+        return self.asset_pairs.symbols(include_aliases=False)
 
-            # Kraken returns a dict where the key is the pair name
-            # e.g. {'result': {'XXBTZUSD': [[...], ...]}}
-            # We need to get the first value from the result dict
-            result_data = list(data["result"].values())[0]
+    def freshness(self, symbol: str) -> Optional[dict[str, Any]]:
+        """
+        Describe how fresh the cached price data for a symbol is.
 
-            # Convert to list of (datetime, Decimal)
-            # Kraken OHLC format: [time, open, high, low, close, vwap, volume, count]
-            prices = []
-            for entry in result_data:
-                # entry[0] is timestamp, entry[4] is close price
-                timestamp = datetime.fromtimestamp(entry[0])
-                close_price = Decimal(str(entry[4]))
-                prices.append((timestamp, close_price))
+        Returns:
+            Dict with ``state`` ("fresh" or "stale") and ``age`` in whole
+            seconds (None if unknown), or None if nothing is cached
+        """
+        price_data = self.price_cache.peek(symbol)
+        if price_data is None:
+            return None
+        age = _age(price_data)
+        return {
+            "state": "fresh" if age < self.fresh_ttl else "stale",
+            "age": None if math.isinf(age) else int(age),
+        }
 
-            return PriceData(symbol=symbol, prices=prices)
+    def invalidate(self, symbol: str) -> None:
+        """Drop cached price data for a symbol so the next read refetches."""
+        self.price_cache.invalidate(symbol)
+        if self.shared_cache is not None:
+            self.shared_cache.delete(_shared_key(symbol))
 
+    def stats(self) -> dict[str, Any]:
+        """Return cache counters for monitoring."""
+        stats = {
+            "serving_mode": self.serving_mode,
+            "refreshing": len(self._refreshing),
+            "price_cache": self.price_cache.stats(),
+            "unknown_symbols": self.unknown_symbols.stats(),
+            "asset_pairs": self.asset_pairs.stats(),
+            "ohlc_decoder": self.decoder.stats(),
+        }
+        if self.shared_cache is not None:
+            stats["shared_cache"] = self.shared_cache.stats()
+        return stats
+
+    def _attach_opening_average(self, price_data: AnyPriceData) -> AnyPriceData:
+        """Attach the persisted opening average before the data is cached."""
+        if self.opening_averages is not None:
+            price_data.opening_average = self.opening_averages.resolve(price_data)
+        return price_data
+
+    def _apply_serving_mode(self) -> None:
+        """Size cache lifetimes for the serving mode."""
+        if self.serving_mode == "stale-while-revalidate":
+            self.price_cache.ttl = max(self.fresh_ttl, self.max_stale)
+        else:
+            self.price_cache.ttl = self.fresh_ttl
+
+    def _schedule_refresh(self, symbol: str) -> None:
+        """Queue one background refresh per stale symbol."""
+        with self._refresh_lock:
+            if symbol in self._refreshing:
+                return
+            self._refreshing.add(symbol)
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(
+                    max_workers=self.refresh_workers,
+                    thread_name_prefix="price-refresh",
+                )
+            executor = self._refresh_executor
+        executor.submit(self._refresh, symbol)
+
+    def _refresh(self, symbol: str) -> None:
+        """Reload a symbol and swap it into the cache, keeping stale data on error."""
+        try:
+            price_data = self._load_price_data(symbol, max_age=self.fresh_ttl)
+            self.price_cache.set(symbol, self._attach_opening_average(price_data))
         except Exception as e:
+            logger.warning(f"Background refresh failed for {symbol}: {e}")
+        finally:
+            with self._refresh_lock:
+                self._refreshing.discard(symbol)
+
+    def _reset_after_fork(self) -> None:
+        """Forget the parent's refresh pool; its threads do not exist here."""
+        self._refresh_executor = None
+        self._refreshing = set()
+        self._refresh_lock = threading.Lock()
+
+    def _load_price_data(
+        self, symbol: str, max_age: Optional[float] = None
+    ) -> AnyPriceData:
+        """
+        Load price data on an in-process cache miss or refresh.
+
+        Consults the shared cache first when one is configured. Misses are
+        refreshed under a distributed lock so only one process fetches a
+        symbol at a time; waiters pick up the value it publishes.
+
+        Args:
+            symbol: Cryptocurrency symbol
+            max_age: Ignore shared entries fetched longer ago than this
+        """
+        if self.shared_cache is None:
+            return self._fetch_price_data(symbol)
+
+        key = _shared_key(symbol)
+        cached = self._get_shared(key, max_age)
+        if cached is not None:
+            return cached
+
+        with self.shared_cache.lock(key):
+            # Another process may have refreshed it while we waited
+            cached = self._get_shared(key, max_age)
+            if cached is not None:
+                return cached
+
+            price_data = self._fetch_price_data(symbol)
+            self.shared_cache.set(
+                key, encode_price_data(price_data), self._shared_entry_ttl()
+            )
+            return price_data
+
+    def _shared_entry_ttl(self) -> float:
+        """Shared entries must outlive the stale window when serving stale."""
+        if self.serving_mode == "stale-while-revalidate":
+            return max(self.shared_cache_ttl, self.max_stale)
+        return self.shared_cache_ttl
+
+    def _get_shared(
+        self, key: str, max_age: Optional[float] = None
+    ) -> Optional[AnyPriceData]:
+        """Read and decode PriceData from the shared cache."""
+        payload = self.shared_cache.get(key) if self.shared_cache else None
+        if payload is None:
+            return None
+        try:
+            price_data = decode_price_data(payload)
+        except InsufficientPriceDataError as e:
+            logger.warning(f"Discarding unreadable shared cache entry {key}: {e}")
+            return None
+        if max_age is not None and _age(price_data) >= max_age:
+            return None
+        return price_data
+
+    def _fetch_price_data(self, symbol: str) -> AnyPriceData:
+        """
+        Fetch price data from Kraken, bypassing every cache tier.
+
+        With a candle store attached, only candles newer than the last
+        stored one are requested and merged into the local history.
+        """
+        stored = self._load_stored_candles(symbol)
+        # Re-request the last stored candle: it may still have been open
+        since = stored[-1][0] - 1 if stored else HISTORY_START_TIMESTAMP
+
+        try:
+            frame = self._check_frame(symbol, self._fetch_ohlc(symbol, since))
+        except ExternalServiceError:
+            if not stored:
+                raise
+            # Served without fetched_at: how current it is is unknown
+            logger.warning(f"Kraken unavailable, serving stored candles for {symbol}")
+            return self._build_price_data(symbol, stored)
+        if _is_truncated(frame, since):
+            # Older candles cannot be paged in, so averages would be wrong
+            raise InsufficientPriceDataError(
+                f"Kraken returned only the latest {OHLC_MAX_CANDLES} candles "
+                f"for {symbol}; history since {since} is incomplete"
+            )
+        fetched_at = time.time()
+
+        if self.candle_store is not None:
+            self.candle_store.save_candles(symbol, OHLC_INTERVAL_MINUTES, frame.rows())
+
+        if stored:
+            rows = _merge_candles(stored, frame.rows())
+            price_data = self._build_price_data(symbol, rows)
+        else:
+            price_data = self._build_price_data_from_frame(symbol, frame)
+        price_data.fetched_at = fetched_at
+        return price_data
+
+    def _load_stored_candles(self, symbol: str) -> list[CandleRow]:
+        """Load stored candles, treating store failures as an empty history."""
+        if self.candle_store is None:
+            return []
+        try:
+            return self.candle_store.get_candles(symbol, OHLC_INTERVAL_MINUTES)
+        except SQLAlchemyError as e:
+            logger.error(f"Error reading stored candles for {symbol}: {e}")
+            return []
+
+    def _check_frame(self, symbol: str, frame: OHLCFrame) -> OHLCFrame:
+        """Map Kraken errors in a decoded payload to domain exceptions."""
+        if any(_is_unknown_pair_error(error) for error in frame.errors):
+            self.unknown_symbols.set(symbol, True)
+            raise SymbolNotFoundError(f"Symbol {symbol} not found on exchange")
+        if frame.errors:
+            raise ExternalServiceError(f"Kraken error for {symbol}: {frame.errors}")
+        if frame.pair is None:
+            raise InsufficientPriceDataError(f"No result data for {symbol}")
+        return frame
+
+    def _build_price_data(self, symbol: str, rows: list[CandleRow]) -> AnyPriceData:
+        """Convert (timestamp, close) rows to the configured price model."""
+        if self.price_data_mode == "columnar":
+            return ColumnarPriceData(
+                symbol=symbol,
+                timestamps=[timestamp for timestamp, _ in rows],
+                closes=[close for _, close in rows],
+            )
+
+        prices = [
+            (datetime.fromtimestamp(timestamp), Decimal(close))
+            for timestamp, close in rows
+        ]
+        return PriceData(symbol=symbol, prices=prices)
+
+    def _build_price_data_from_frame(
+        self, symbol: str, frame: OHLCFrame
+    ) -> AnyPriceData:
+        """Convert a decoded frame to the configured price model."""
+        if self.price_data_mode == "columnar":
+            return ColumnarPriceData(
+                symbol=symbol, timestamps=frame.timestamps, closes=frame.closes
+            )
+        return self._build_price_data(symbol, frame.rows())
+
+    def _fetch_asset_pairs(self) -> dict[str, dict[str, Any]]:
+        """Fetch Kraken's tradable asset pairs, keyed by pair name."""
+        try:
+            response = self.http.get(self.asset_pairs_url)
+            response.raise_for_status()
+            payload = json.loads(response.content)
+        except (requests.RequestException, ValueError) as e:
+            logger.error(f"Error fetching asset pairs: {e}")
+            raise ExternalServiceError(f"Failed to fetch asset pairs: {e}")
+        if payload.get("error"):
+            raise ExternalServiceError(f"Kraken error: {payload['error']}")
+        return payload.get("result", {})
+
+    def _pair_name(self, symbol: str) -> Optional[str]:
+        """
+        Get Kraken's pair name for a symbol from the asset pair index.
+
+        Returns:
+            The pair name, None if Kraken lists no USD pair for the symbol,
+            or the plain "<symbol>USD" guess while the index cannot load
+        """
+        try:
+            return self.asset_pairs.pair_for(symbol)
+        except ExternalServiceError as e:
+            logger.warning(f"Asset pair index unavailable, guessing pair: {e}")
+            return f"{symbol}USD"
+
+    def _fetch_ohlc(
+        self, symbol: str, since: int = HISTORY_START_TIMESTAMP
+    ) -> OHLCFrame:
+        """Fetch and decode the OHLC payload for a symbol."""
+        params = {
+            "pair": self._pair_name(symbol) or f"{symbol}USD",
+            "interval": OHLC_INTERVAL_MINUTES,
+            "since": since,
+        }
+        try:
+            response = self.http.get(self.base_url, params=params)
+            response.raise_for_status()
+            return self.decoder.decode(response.content)
+        except (requests.RequestException, ValueError) as e:
             logger.error(f"Error fetching price data: {e}")
-            raise InsufficientPriceDataError(f"Failed to fetch price data: {e}")
+            raise ExternalServiceError(f"Failed to fetch price data: {e}")
+
+
+def _age(price_data: AnyPriceData) -> float:
+    """Seconds since price data was fetched; infinite if unknown."""
+    if price_data.fetched_at is None:
+        return math.inf
+    return max(time.time() - price_data.fetched_at, 0.0)
+
+
+def _shared_key(symbol: str) -> str:
+    """Shared cache key for a symbol's price data."""
+    return f"price:{OHLC_INTERVAL_MINUTES}:{symbol}"
+
+
+def _is_unknown_pair_error(error: str) -> bool:
+    """Check whether a Kraken error string means the pair does not exist."""
+    return "Unknown asset pair" in error or "Instrument not found" in error
+
+
+def _is_truncated(frame: OHLCFrame, since: int) -> bool:
+    """
+    Check whether Kraken cut a response off at its candle limit.
+
+    A full response starting more than a candle after ``since`` means the
+    candles in between exist but were not returned. A short one starting
+    late is just a pair listed after ``since``.
+    """
+    return (
+        frame.timestamps.size >= OHLC_MAX_CANDLES
+        and int(frame.timestamps[0]) > since + OHLC_INTERVAL_MINUTES * 60
+    )
+
+
+def _chart_interval(span: float, points: int) -> int:
+    """Finest candle level that spans ``span`` seconds in ``points`` candles."""
+    for interval in (OHLC_INTERVAL_MINUTES, *CANDLE_ROLLUP_INTERVALS):
+        if span // (interval * 60) + 1 <= points:
+            return interval
+    return CANDLE_ROLLUP_INTERVALS[-1]
+
+
+def _merge_candles(
+    stored: list[CandleRow], fetched: list[CandleRow]
+) -> list[CandleRow]:
+    """Merge fetched candles over stored ones, newest value winning."""
+    if not stored:
+        return fetched
+    merged = dict(stored)
+    merged.update(fetched)
+    return sorted(merged.items())
+
+
+# Every price repository, so forked children can drop inherited refresh pools
+_price_repositories: "weakref.WeakSet[KrakenPriceRepository]" = weakref.WeakSet()
+
+
+def _reset_price_repositories_after_fork() -> None:
+    for repo in list(_price_repositories):
+        repo._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_price_repositories_after_fork)
+
+
+class SqlAlchemyCandleRepository:
+    """
+    Repository for the local OHLC candle history.
+
+    Candles are keyed by (symbol, interval, timestamp) so price requests
+    only need to fetch the tail newer than the last stored candle.
+    """
+
+    def __init__(self, database: Database):
+        self.db = database
+        self._table_ready = False
+
+    def get_candles(
+        self,
+        symbol: str,
+        interval: int,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> list[CandleRow]:
+        """
+        Get stored candles for a symbol, oldest first.
+
+        Args:
+            symbol: Cryptocurrency symbol
+            interval: Candle interval in minutes, the base interval or one
+                of CANDLE_ROLLUP_INTERVALS
+            start: Only candles opening at or after this epoch time
+            end: Only candles opening before this epoch time
+
+        Returns:
+            List of (timestamp, close) tuples
+        """
+        self._ensure_table()
+        session = self.db.get_session()
+        try:
+            query = session.query(Candle.TIMESTAMP, Candle.CLOSE).filter(
+                Candle.SYMBOL == symbol, Candle.INTERVAL == interval
+            )
+            if start is not None:
+                query = query.filter(Candle.TIMESTAMP >= start)
+            if end is not None:
+                query = query.filter(Candle.TIMESTAMP < end)
+            rows = query.order_by(Candle.TIMESTAMP).all()
+            return [(timestamp, close) for timestamp, close in rows]
+        finally:
+            session.close()
+
+    def save_candles(self, symbol: str, interval: int, rows: list[CandleRow]) -> None:
+        """
+        Insert or replace candles for a symbol.
+
+        Stored candles at or after the first new timestamp are replaced,
+        which also refreshes a candle that was still open when last stored.
+        Base interval candles also update the rollup levels, from the
+        bucket holding the first new candle onwards.
+        """
+        if not rows:
+            return
+
+        session = self.db.get_session()
+        try:
+            self._ensure_table()
+            _replace_candles(session, symbol, interval, rows)
+            if interval == OHLC_INTERVAL_MINUTES:
+                self._update_rollups(session, symbol, rows[0][0])
+            session.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"Error saving candles for {symbol}: {e}")
+            session.rollback()
+        finally:
+            session.close()
+
+    def _update_rollups(self, session: Session, symbol: str, since: int) -> None:
+        """
+        Re-aggregate every rollup bucket from the one holding ``since``.
+
+        A level with nothing stored yet (history saved before rollups
+        existed) is built from the whole base history.
+        """
+        for interval in CANDLE_ROLLUP_INTERVALS:
+            size = interval * 60
+            start = since // size * size
+            stored = (
+                session.query(Candle.TIMESTAMP)
+                .filter(Candle.SYMBOL == symbol, Candle.INTERVAL == interval)
+                .first()
+            )
+            if stored is None:
+                start = 0
+            base = (
+                session.query(Candle.TIMESTAMP, Candle.CLOSE)
+                .filter(
+                    Candle.SYMBOL == symbol,
+                    Candle.INTERVAL == OHLC_INTERVAL_MINUTES,
+                    Candle.TIMESTAMP >= start,
+                )
+                .order_by(Candle.TIMESTAMP)
+                .all()
+            )
+            _replace_candles(session, symbol, interval, _rollup(base, size), start)
+
+    def _ensure_table(self) -> None:
+        """Create the candle table on first use."""
+        if not self._table_ready:
+            Candle.__table__.create(self.db.engine, checkfirst=True)
+            self._table_ready = True
+
+
+def _replace_candles(
+    session: Session,
+    symbol: str,
+    interval: int,
+    rows: list[CandleRow],
+    start: Optional[int] = None,
+) -> None:
+    """Replace a level's candles from ``start`` (default first row) onwards."""
+    if start is None:
+        start = rows[0][0]
+    session.query(Candle).filter(
+        Candle.SYMBOL == symbol,
+        Candle.INTERVAL == interval,
+        Candle.TIMESTAMP >= start,
+    ).delete(synchronize_session=False)
+    session.bulk_insert_mappings(
+        Candle,
+        [
+            {"SYMBOL": symbol, "INTERVAL": interval, "TIMESTAMP": t, "CLOSE": c}
+            for t, c in rows
+        ],
+    )
+
+
+def _rollup(rows: list[CandleRow], size: int) -> list[CandleRow]:
+    """
+    Aggregate candles into ``size``-second buckets aligned to the epoch.
+
+    Each bucket is stamped with its start and closes at the close of the
+    last candle opening in it.
+    """
+    buckets: dict[int, str] = {}
+    for timestamp, close in rows:
+        buckets[timestamp // size * size] = close
+    return list(buckets.items())
+
+
+class SqlAlchemyLeaderboardRepository:
+    """
+    Repository for the materialised top-movers leaderboard in LEADERBOARD.
+
+    A scheduled task rebuilds the table; requests read an in-memory copy
+    that is reloaded from the table at most every ``ttl`` seconds, so other
+    processes pick up a rebuild without recomputing anything.
+    """
+
+    def __init__(self, database: Database, ttl: float = LEADERBOARD_CACHE_TTL):
+        self.db = database
+        self._table_ready = False
+        self._cache: TTLCache[list[dict[str, Any]]] = TTLCache(maxsize=1, ttl=ttl)
+
+    def get_leaderboard(self) -> list[dict[str, Any]]:
+        """Get leaderboard entries, best first; empty until first built."""
+        return self._cache.get_or_load("leaderboard", self._load)
+
+    def save_leaderboard(
+        self, entries: list[dict[str, Any]], generated_at: datetime
+    ) -> None:
+        """
+        Replace the leaderboard with ranked entries.
+
+        Args:
+            entries: Dicts with SYMBOL, GROWTHFACTOR and LAMBOS, best first
+            generated_at: When the leaderboard was computed
+        """
+        self._ensure_table()
+        rows = [
+            {
+                "RANK": rank,
+                "SYMBOL": entry["SYMBOL"],
+                "GROWTHFACTOR": entry["GROWTHFACTOR"],
+                "LAMBOS": entry["LAMBOS"],
+                "GENERATIONDATE": generated_at,
+            }
+            for rank, entry in enumerate(entries, start=1)
+        ]
+        session = self.db.get_session()
+        try:
+            session.query(LeaderboardEntry).delete(synchronize_session=False)
+            session.bulk_insert_mappings(LeaderboardEntry, rows)
+            session.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"Error saving leaderboard: {e}")
+            session.rollback()
+            return
+        finally:
+            session.close()
+        self._cache.set("leaderboard", [_leaderboard_entry(row) for row in rows])
+
+    def _load(self) -> list[dict[str, Any]]:
+        """Read the leaderboard table."""
+        self._ensure_table()
+        session = self.db.get_session()
+        try:
+            rows = session.query(LeaderboardEntry).order_by(LeaderboardEntry.RANK).all()
+            return [
+                _leaderboard_entry(
+                    {
+                        "RANK": row.RANK,
+                        "SYMBOL": row.SYMBOL,
+                        "GROWTHFACTOR": row.GROWTHFACTOR,
+                        "LAMBOS": row.LAMBOS,
+                        "GENERATIONDATE": row.GENERATIONDATE,
+                    }
+                )
+                for row in rows
+            ]
+        finally:
+            session.close()
+
+    def _ensure_table(self) -> None:
+        """Create the leaderboard table on first use."""
+        if not self._table_ready:
+            LeaderboardEntry.__table__.create(self.db.engine, checkfirst=True)
+            self._table_ready = True
+
+
+def _leaderboard_entry(row: dict[str, Any]) -> dict[str, Any]:
+    """Convert a LEADERBOARD row mapping to its JSON-ready form."""
+    return {**row, "GENERATIONDATE": row["GENERATIONDATE"].isoformat()}
+
+
+class SqlAlchemyOpeningAverageRepository:
+    """
+    Repository for precomputed opening averages in OPENING_AVERAGE.
+
+    The opening average covers the first OPENING_PERIOD_WEEKS candles of a
+    symbol's history, so it never changes once computed. Values are kept
+    in the table for every process and memoised in memory after first use.
+    """
+
+    def __init__(self, database: Database):
+        self.db = database
+        self._table_ready = False
+        self._memo: dict[str, Decimal] = {}
+        self._lock = threading.Lock()
+
+    def get_average(self, symbol: str) -> Optional[Decimal]:
+        """Get the stored opening average for a symbol, or None."""
+        session = self.db.get_session()
+        try:
+            self._ensure_table()
+            row = session.get(OpeningAverage, symbol)
+            if row is None or row.AVERAGE is None:
+                return None
+            return Decimal(repr(row.AVERAGE))
+        except SQLAlchemyError as e:
+            logger.error(f"Error loading opening average for {symbol}: {e}")
+            return None
+        finally:
+            session.close()
+
+    def save_average(self, symbol: str, average: Decimal) -> None:
+        """Insert or replace the opening average for a symbol."""
+        session = self.db.get_session()
+        try:
+            self._ensure_table()
+            session.merge(OpeningAverage(SYMBOL=symbol, AVERAGE=float(average)))
+            session.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"Error saving opening average for {symbol}: {e}")
+            session.rollback()
+        finally:
+            session.close()
+
+    def resolve(self, price_data: AnyPriceData) -> Optional[Decimal]:
+        """
+        Return the opening average for price data, persisting it if needed.
+
+        The first time a symbol is seen in this process, the value averaged
+        from its history is checked against the table, and the row is
+        written or corrected if it is missing or does not match. The stored
+        row is only served as-is when the history is too short to cover the
+        opening window. Later calls are answered from memory.
+
+        Args:
+            price_data: Price data whose history starts at the opening window
+
+        Returns:
+            Opening average, or None if neither the table nor the history
+            can provide one
+        """
+        symbol = price_data.symbol
+        with self._lock:
+            average = self._memo.get(symbol)
+        if average is not None:
+            return average
+
+        stored = self.get_average(symbol)
+        average = self._compute(price_data)
+        if average is None:
+            average = stored
+        # The column is a float, so compare at its precision
+        elif stored != Decimal(repr(float(average))):
+            if stored is not None:
+                logger.warning(
+                    f"Replacing stale opening average for {symbol}: "
+                    f"{stored} -> {average}"
+                )
+            self.save_average(symbol, average)
+
+        if average is not None:
+            with self._lock:
+                self._memo[symbol] = average
+        return average
+
+    @staticmethod
+    def _compute(price_data: AnyPriceData) -> Optional[Decimal]:
+        """Average the opening window of the history, or None if too short."""
+        if price_data.opening_average is not None:
+            # Ignore an attached value so the history itself is averaged
+            price_data = dataclasses.replace(price_data, opening_average=None)
+        try:
+            return price_data.get_opening_average()
+        except InsufficientPriceDataError:
+            return None
+
+    def _ensure_table(self) -> None:
+        """Create the opening average table on first use."""
+        if not self._table_ready:
+            OpeningAverage.__table__.create(self.db.engine, checkfirst=True)
+            self._table_ready = True
 
 
 class SqlAlchemyInvestmentRepository:
@@ -111,6 +956,54 @@ class SqlAlchemyInvestmentRepository:
     def __init__(self, database: Database):
         self.db = database
 
+    def log_queries(
+        self, entries: list[tuple[str, float]], created_at: datetime
+    ) -> None:
+        """
+        Log many investment queries in a single bulk insert.
+
+        Args:
+            entries: (symbol, amount) pairs
+            created_at: Generation time shared by the batch
+        """
+        try:
+            self.insert_rows(
+                [(symbol, amount, created_at) for symbol, amount in entries]
+            )
+        except Exception as e:
+            logger.error(f"Error logging queries: {e}")
+
+    def insert_rows(self, rows: list[QueryLogRow]) -> None:
+        """
+        Bulk insert (symbol, amount, created_at) rows into LOGGING.
+
+        Raises:
+            SQLAlchemyError: If the insert fails; nothing is written
+        """
+        if not rows:
+            return
+
+        session = self.db.get_session()
+        try:
+            session.bulk_insert_mappings(
+                Logging,
+                [
+                    {
+                        "SYMBOL": symbol,
+                        "INVESTMENT": amount,
+                        "GENERATIONDATE": created_at,
+                        "QUERY_ID": random.randint(1, 2147483647),
+                    }
+                    for symbol, amount, created_at in rows
+                ],
+            )
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
     def log_query(self, investment: Investment) -> None:
         """Log investment query to database."""
         session = self.db.get_session()
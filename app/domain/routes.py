@@ -1,18 +1,24 @@
 """Domain routes for DWML process_request endpoints."""
 
 import json
+import math
+from datetime import datetime
 from decimal import Decimal
-from typing import Tuple
+from typing import Optional, Tuple
 
 import grpc
 from flask import Blueprint, current_app, request
 
+from app.domain.constants import DCA_FREQUENCIES, LEADERBOARD_SIZE, SYMBOL_SEARCH_LIMIT
+from app.domain.downsampling import MIN_POINTS, downsample_chart
 from app.domain.exceptions import (
+    DateOutOfRangeError,
     ExternalServiceError,
     InsufficientPriceDataError,
     InvalidInvestmentError,
     SymbolNotFoundError,
 )
+from app.domain.numeric import get_numeric_backend
 from app.domain.proto_files import api_pb2 as pb2
 from app.domain.proto_files import api_pb2_grpc as pb2_grpc
 from app.domain.services import CryptoAnalysisService
@@ -23,14 +29,108 @@ from app.shared.middleware.security import security_enhanced_route
 # Create blueprint for crypto domain
 crypto_bp = Blueprint("crypto", __name__)
 
+# Optional integer query parameters of process_request and their minimums
+OPTIONAL_INT_PARAMS = {
+    "opening_weeks": 1,
+    "current_weeks": 1,
+    "points": MIN_POINTS,
+}
+
+# Optional process_request query parameters that move the buy/sell windows
+DATE_PARAMS = ("buy_date", "sell_date")
+
 
 def get_crypto_service() -> CryptoAnalysisService:
     """
     Get crypto service instance with wired infrastructure.
     """
-    from app.domain import investment_repo, price_repo
+    from app.domain import analysis_kernels, chart_payloads, price_repo, query_log
+
+    return CryptoAnalysisService(
+        price_repo,
+        query_log,
+        analysis_kernels,
+        chart_payloads,
+        get_numeric_backend(current_app.config.get("NUMERIC_MODE", "exact")),
+    )
+
+
+def parse_date(value: str) -> Optional[float]:
+    """
+    Parse an ISO 8601 date or datetime, or epoch seconds, to epoch seconds.
+
+    Times without an offset are server-local, like the candle timestamps.
+    Returns None if the value is neither.
+    """
+    try:
+        when = float(value)
+    except ValueError:
+        try:
+            when = datetime.fromisoformat(value).timestamp()
+        except ValueError:
+            return None
+    return when if math.isfinite(when) else None
+
+
+def encode_analysis(message: dict, graph_data: bytes | list) -> bytes:
+    """
+    Encode a process_request body.
+
+    Pre-encoded graph_data bytes are spliced in as they are, so cached
+    charts are never decoded or re-encoded per request.
+    """
+    if not isinstance(graph_data, bytes):
+        graph_data = json.dumps(graph_data).encode()
+    return b"".join(
+        (
+            b'{"message": ',
+            json.dumps(message).encode(),
+            b', "graph_data": ',
+            graph_data,
+            b"}",
+        )
+    )
+
+
+def domain_error_response(exc: Exception) -> Tuple[str, int, dict[str, str]]:
+    """Map an analysis exception to the response process_request gives it."""
+    if isinstance(exc, InvalidInvestmentError):
+        current_app.logger.warning(f"Invalid investment: {exc}")
+        body, status = {"message": "Server Failure", "error": str(exc)}, 400
+    elif isinstance(exc, SymbolNotFoundError):
+        current_app.logger.warning(f"Symbol not found: {exc}")
+        body, status = {"message": "Symbol doesn't exist"}, 404
+    elif isinstance(exc, DateOutOfRangeError):
+        current_app.logger.warning(f"Date out of range: {exc}")
+        body, status = {"message": "Server Failure", "error": str(exc)}, 400
+    elif isinstance(exc, InsufficientPriceDataError):
+        current_app.logger.error(f"Insufficient data: {exc}")
+        body, status = {"message": "Server Failure", "error": str(exc)}, 503
+    elif isinstance(exc, ExternalServiceError):
+        current_app.logger.error(f"External service error: {exc}")
+        body, status = {"message": "Server Failure"}, 503
+    else:
+        current_app.logger.error(f"Unexpected error: {exc}", exc_info=True)
+        body, status = {"message": "Server Failure"}, 500
+    return json.dumps(body), status, {"Content-Type": "application/json"}
+
+
+def freshness_headers(symbol: str) -> dict[str, str]:
+    """
+    Build headers describing how fresh a symbol's price data is.
+
+    ``X-Data-Freshness`` is "fresh" or "stale" (being refreshed in the
+    background); ``X-Data-Age`` is the seconds since it was fetched.
+    """
+    from app.domain import price_repo
 
-    return CryptoAnalysisService(price_repo, investment_repo)
+    freshness = price_repo.freshness(symbol)
+    if freshness is None:
+        return {}
+    headers = {"X-Data-Freshness": freshness["state"]}
+    if freshness["age"] is not None:
+        headers["X-Data-Age"] = str(freshness["age"])
+    return headers
 
 
 @crypto_bp.before_request
@@ -42,12 +142,18 @@ def before_request_func() -> None:
 @crypto_bp.route("/process_request", methods=["GET"])
 @rate_limit(limit=60, window=60)
 @security_enhanced_route
-def analyze_investment() -> Tuple[str, int, dict[str, str]]:
+def analyze_investment() -> Tuple[str | bytes, int, dict[str, str]]:
     """
     Analyze crypto investment.
 
     GET /api/v1/process_request?symbol=BTC&investment=1000
 
+    Optional ``opening_weeks`` and ``current_weeks`` set how many candles
+    are averaged for the buy and current prices; ``points`` downsamples
+    graph_data to that many points. Optional ``buy_date`` and ``sell_date``
+    (ISO 8601 or epoch seconds) buy at the candles from that date and sell
+    at the candles before it, instead of the start and end of the history.
+
     Returns:
         JSON with analysis results and graph data
     """
@@ -75,16 +181,55 @@ def analyze_investment() -> Tuple[str, int, dict[str, str]]:
                 {"Content-Type": "application/json"},
             )
 
+        # Optional averaging windows (in candles) and chart resolution
+        options = {}
+        for name, minimum in OPTIONAL_INT_PARAMS.items():
+            if name in request.args:
+                value = request.args.get(name, type=int)
+                if value is None or value < minimum:
+                    return (
+                        json.dumps(
+                            {"error": f"{name} must be an integer >= {minimum}"}
+                        ),
+                        400,
+                        {"Content-Type": "application/json"},
+                    )
+                options[name] = value
+
+        for name in DATE_PARAMS:
+            if name in request.args:
+                when = parse_date(request.args[name])
+                if when is None:
+                    return (
+                        json.dumps(
+                            {"error": f"{name} must be an ISO 8601 date or epoch"}
+                        ),
+                        400,
+                        {"Content-Type": "application/json"},
+                    )
+                options[name] = when
+        if options.get("buy_date", -math.inf) >= options.get("sell_date", math.inf):
+            return (
+                json.dumps({"error": "buy_date must be before sell_date"}),
+                400,
+                {"Content-Type": "application/json"},
+            )
+
         # 3. Execute business logic via service
         service = get_crypto_service()
-        result = service.analyze_investment(symbol, investment)
+        result = service.analyze_investment(
+            symbol, investment, encode_chart=True, **options
+        )
 
         # 4. Return successful response in expected format
-        graph_data = result.pop("graph_data", [])
+        graph_data = result.pop("graph_data", b"[]")
         return (
-            json.dumps({"message": result, "graph_data": graph_data}),
+            encode_analysis(result, graph_data),
             200,
-            {"Content-Type": "application/json"},
+            {
+                "Content-Type": "application/json",
+                **freshness_headers(result["SYMBOL"]),
+            },
         )
 
     except InvalidInvestmentError as e:
@@ -103,6 +248,15 @@ def analyze_investment() -> Tuple[str, int, dict[str, str]]:
             {"Content-Type": "application/json"},
         )
 
+    except DateOutOfRangeError as e:
+        # A requested date outside the history is the caller's error
+        current_app.logger.warning(f"Date out of range: {e}")
+        return (
+            json.dumps({"message": "Server Failure", "error": str(e)}),
+            400,
+            {"Content-Type": "application/json"},
+        )
+
     except InsufficientPriceDataError as e:
         current_app.logger.error(f"Insufficient data: {e}")
         return (
@@ -137,6 +291,8 @@ def analyze_investment_grpc() -> Tuple[str, int, dict[str, str]]:
 
     GET /api/v1/process_request_grpc?symbol=BTC&investment=1000
 
+    Optional ``points`` asks for graph_data downsampled to that many points.
+
     Returns:
         JSON with analysis results from gRPC service
     """
@@ -146,11 +302,12 @@ def analyze_investment_grpc() -> Tuple[str, int, dict[str, str]]:
         # Parse parameters
         symbol = str(request.args.get("symbol", "").strip())
         investment = int(request.args.get("investment", 0))
+        points = int(request.args.get("points", 0))
 
         current_app.logger.info(f"gRPC request for {symbol}:{investment}")
 
         # Basic validation
-        if not symbol or investment <= 0:
+        if not symbol or investment <= 0 or 0 < points < MIN_POINTS:
             return (
                 json.dumps({"error": "Invalid parameters"}),
                 400,
@@ -164,15 +321,19 @@ def analyze_investment_grpc() -> Tuple[str, int, dict[str, str]]:
 
         current_app.logger.info(f"Calling gRPC stub: {stub}")
         response = stub.processRequest(
-            pb2.apiRequest(symbol=symbol, investment=investment)
+            pb2.apiRequest(symbol=symbol, investment=investment, points=points)
         )
         current_app.logger.info(f"gRPC response received: {response}")
 
+        # Servers that predate the points field ignore it and return every
+        # point, so downsample here as well
+        graph_data = response.graph_data
+        if points:
+            graph_data = json.dumps(downsample_chart(json.loads(graph_data), points))
+
         # Return response
         return (
-            json.dumps(
-                {"message": response.message, "graph_data": response.graph_data}
-            ),
+            json.dumps({"message": response.message, "graph_data": graph_data}),
             200,
             {"ContentType": "application/json"},
         )
@@ -351,3 +512,476 @@ def check_task_status(task_id: str) -> Tuple[str, int, dict[str, str]]:
             500,
             {"Content-Type": "application/json"},
         )
+
+
+@crypto_bp.route("/analyze_batch", methods=["POST"])
+@rate_limit(limit=30, window=60)
+@security_enhanced_route
+def analyze_investment_batch() -> Tuple[str, int, dict[str, str]]:
+    """
+    Analyze many crypto investments in one request.
+
+    POST /api/v1/analyze_batch
+    Body: {"requests": [{"symbol": "BTC", "investment": 1000}, ...]}
+
+    Rows with a ``frequency`` (and ``start_date``, optional ``end_date``)
+    are analysed as DCA plans like /api/v1/dca.
+
+    Returns:
+        JSON with one result (or per-row error) per request, in order
+    """
+    current_app.logger.info("Batch investment analysis request received")
+
+    data = request.get_json(silent=True)
+    rows = data.get("requests") if isinstance(data, dict) else None
+    if not isinstance(rows, list) or not all(isinstance(r, dict) for r in rows):
+        return (
+            json.dumps({"error": 'Body must be {"requests": [{...}, ...]}'}),
+            400,
+            {"Content-Type": "application/json"},
+        )
+
+    max_size = current_app.config.get("MAX_BATCH_SIZE", 10000)
+    if len(rows) > max_size:
+        return (
+            json.dumps({"error": f"Batch size exceeds limit of {max_size}"}),
+            400,
+            {"Content-Type": "application/json"},
+        )
+
+    try:
+        from app.domain import async_price_repo
+
+        # Rows with a frequency are DCA plans; the rest are lump sums
+        lump_rows = [i for i, row in enumerate(rows) if "frequency" not in row]
+        dca_rows = [i for i, row in enumerate(rows) if "frequency" in row]
+        requests = [
+            (rows[i].get("symbol", ""), rows[i].get("investment")) for i in lump_rows
+        ]
+        plans = [
+            (
+                rows[i].get("symbol", ""),
+                rows[i].get("investment"),
+                rows[i]["frequency"],
+                parse_date(str(rows[i].get("start_date", ""))),
+                parse_date(str(rows[i]["end_date"])) if "end_date" in rows[i] else None,
+            )
+            for i in dca_rows
+        ]
+
+        # Warm every symbol's price data concurrently; failures are
+        # reported per row by the service
+        symbols = {str(row.get("symbol", "")).upper().strip() for row in rows}
+        prefetched = async_price_repo.get_many_sync(
+            s for s in symbols if 0 < len(s) <= 10
+        )
+
+        service = get_crypto_service()
+        results: list = [None] * len(rows)
+        for i, result in zip(lump_rows, service.analyze_many(requests, prefetched)):
+            results[i] = result
+        if plans:
+            for i, result in zip(dca_rows, service.analyze_dca_many(plans)):
+                results[i] = result
+        return (
+            json.dumps({"results": results, "count": len(results)}),
+            200,
+            {"Content-Type": "application/json"},
+        )
+
+    except Exception as e:
+        current_app.logger.error(f"Unexpected error: {e}", exc_info=True)
+        return (
+            json.dumps({"message": "Server Failure"}),
+            500,
+            {"Content-Type": "application/json"},
+        )
+
+
+@crypto_bp.route("/entry_scan", methods=["GET"])
+@rate_limit(limit=60, window=60)
+@security_enhanced_route
+def scan_entry_dates() -> Tuple[str, int, dict[str, str]]:
+    """
+    Analyze buying at every candle of a symbol's history.
+
+    GET /api/v1/entry_scan?symbol=BTC&investment=1000
+
+    Optional ``opening_weeks`` and ``current_weeks`` work as for
+    process_request.
+
+    Returns:
+        JSON with profit and lambos per entry date, the best and worst
+        entries, and profit percentiles
+    """
+    current_app.logger.info("Entry date scan request received")
+
+    symbol = request.args.get("symbol", "").strip()
+    if not symbol:
+        return (
+            json.dumps({"error": "Symbol parameter is required"}),
+            400,
+            {"Content-Type": "application/json"},
+        )
+    try:
+        investment = Decimal(request.args.get("investment", "0"))
+    except ArithmeticError:
+        return (
+            json.dumps({"error": "Investment must be a valid number"}),
+            400,
+            {"Content-Type": "application/json"},
+        )
+
+    options = {}
+    for name in ("opening_weeks", "current_weeks"):
+        if name in request.args:
+            value = request.args.get(name, type=int)
+            if value is None or value < OPTIONAL_INT_PARAMS[name]:
+                return (
+                    json.dumps({"error": f"{name} must be an integer >= 1"}),
+                    400,
+                    {"Content-Type": "application/json"},
+                )
+            options[name] = value
+
+    try:
+        result = get_crypto_service().scan_entries(symbol, investment, **options)
+    except Exception as e:
+        return domain_error_response(e)
+
+    return (
+        json.dumps(result),
+        200,
+        {"Content-Type": "application/json", **freshness_headers(result["SYMBOL"])},
+    )
+
+
+@crypto_bp.route("/dca", methods=["GET"])
+@rate_limit(limit=60, window=60)
+@security_enhanced_route
+def analyze_dca() -> Tuple[str, int, dict[str, str]]:
+    """
+    Analyze dollar-cost averaging into a symbol.
+
+    GET /api/v1/dca?symbol=BTC&investment=100&frequency=weekly
+        &start_date=2020-01-01
+
+    ``investment`` is spent on every purchase; ``frequency`` is daily,
+    weekly or monthly. Optional ``end_date`` (default now) stops the plan,
+    and ``current_weeks`` and ``points`` work as for process_request. Dates
+    are ISO 8601 or epoch seconds.
+
+    Returns:
+        JSON with the plan totals and the holding value per candle
+    """
+    current_app.logger.info("DCA analysis request received")
+
+    symbol = request.args.get("symbol", "").strip()
+    frequency = request.args.get("frequency", "")
+    error = None
+    if not symbol:
+        error = "Symbol parameter is required"
+    elif frequency not in DCA_FREQUENCIES:
+        error = f"frequency must be one of {', '.join(DCA_FREQUENCIES)}"
+    elif parse_date(request.args.get("start_date", "")) is None:
+        error = "start_date must be an ISO 8601 date or epoch"
+    elif "end_date" in request.args and parse_date(request.args["end_date"]) is None:
+        error = "end_date must be an ISO 8601 date or epoch"
+    if error:
+        return (
+            json.dumps({"error": error}),
+            400,
+            {"Content-Type": "application/json"},
+        )
+
+    try:
+        investment = Decimal(request.args.get("investment", "0"))
+    except ArithmeticError:
+        return (
+            json.dumps({"error": "Investment must be a valid number"}),
+            400,
+            {"Content-Type": "application/json"},
+        )
+
+    options = {"start_date": parse_date(request.args["start_date"])}
+    if "end_date" in request.args:
+        options["end_date"] = parse_date(request.args["end_date"])
+    for name in ("current_weeks", "points"):
+        if name in request.args:
+            value = request.args.get(name, type=int)
+            if value is None or value < OPTIONAL_INT_PARAMS[name]:
+                minimum = OPTIONAL_INT_PARAMS[name]
+                return (
+                    json.dumps({"error": f"{name} must be an integer >= {minimum}"}),
+                    400,
+                    {"Content-Type": "application/json"},
+                )
+            options[name] = value
+
+    try:
+        result = get_crypto_service().analyze_dca(
+            symbol, investment, frequency, **options
+        )
+    except Exception as e:
+        return domain_error_response(e)
+
+    return (
+        json.dumps(result),
+        200,
+        {"Content-Type": "application/json", **freshness_headers(result["SYMBOL"])},
+    )
+
+
+@crypto_bp.route("/chart", methods=["GET"])
+@rate_limit(limit=120, window=60)
+@security_enhanced_route
+def chart() -> Tuple[str, int, dict[str, str]]:
+    """
+    Chart a symbol's closes over a time range.
+
+    GET /api/v1/chart?symbol=BTC&start=2020-01-01&end=2024-01-01&points=100
+
+    ``start`` and ``end`` (ISO 8601 or epoch seconds) are optional and
+    default to the whole history. With ``points`` the coarsest stored
+    candle level that still fills the budget is served, so long ranges
+    read a few precomputed rollup candles.
+
+    Returns:
+        JSON with the candle interval used and graph_data
+    """
+    symbol = request.args.get("symbol", "").strip()
+    if not symbol:
+        return (
+            json.dumps({"error": "Symbol parameter is required"}),
+            400,
+            {"Content-Type": "application/json"},
+        )
+
+    options = {}
+    for name in ("start", "end"):
+        if name in request.args:
+            options[name] = parse_date(request.args[name])
+            if options[name] is None:
+                return (
+                    json.dumps({"error": f"{name} must be an ISO 8601 date or epoch"}),
+                    400,
+                    {"Content-Type": "application/json"},
+                )
+    if "points" in request.args:
+        points = request.args.get("points", type=int)
+        if points is None or points < MIN_POINTS:
+            return (
+                json.dumps({"error": f"points must be an integer >= {MIN_POINTS}"}),
+                400,
+                {"Content-Type": "application/json"},
+            )
+        options["points"] = points
+    if options.get("start", -math.inf) >= options.get("end", math.inf):
+        return (
+            json.dumps({"error": "start must be before end"}),
+            400,
+            {"Content-Type": "application/json"},
+        )
+
+    try:
+        result = get_crypto_service().get_chart(symbol, **options)
+    except InsufficientPriceDataError as e:
+        if "start" not in options and "end" not in options:
+            return domain_error_response(e)
+        return (
+            json.dumps({"error": "No price data in the requested range"}),
+            400,
+            {"Content-Type": "application/json"},
+        )
+    except Exception as e:
+        return domain_error_response(e)
+
+    return (
+        json.dumps(result),
+        200,
+        {"Content-Type": "application/json", **freshness_headers(result["SYMBOL"])},
+    )
+
+
+@crypto_bp.route("/portfolio", methods=["POST"])
+@rate_limit(limit=30, window=60)
+@security_enhanced_route
+def analyze_portfolio() -> Tuple[str, int, dict[str, str]]:
+    """
+    Analyze a portfolio of holdings.
+
+    POST /api/v1/portfolio
+    Body: {"holdings": [{"symbol": "BTC", "amount": 1000}, ...], "points": 200}
+
+    Every symbol's price data is loaded concurrently, so latency follows
+    the slowest symbol rather than the sum. ``investment`` is accepted in
+    place of ``amount``; ``points`` is optional.
+
+    Returns:
+        JSON with per-holding results (or errors), aggregate totals and the
+        combined value over time
+    """
+    current_app.logger.info("Portfolio analysis request received")
+
+    data = request.get_json(silent=True)
+    rows = data.get("holdings") if isinstance(data, dict) else None
+    if not isinstance(rows, list) or not all(isinstance(r, dict) for r in rows):
+        return (
+            json.dumps({"error": 'Body must be {"holdings": [{...}, ...]}'}),
+            400,
+            {"Content-Type": "application/json"},
+        )
+
+    max_size = current_app.config.get("MAX_PORTFOLIO_SIZE", 100)
+    if not 0 < len(rows) <= max_size:
+        return (
+            json.dumps({"error": f"Portfolio must hold 1 to {max_size} symbols"}),
+            400,
+            {"Content-Type": "application/json"},
+        )
+
+    points = data.get("points")
+    if points is not None and (not isinstance(points, int) or points < MIN_POINTS):
+        return (
+            json.dumps({"error": f"points must be an integer >= {MIN_POINTS}"}),
+            400,
+            {"Content-Type": "application/json"},
+        )
+
+    try:
+        from app.domain import async_price_repo
+
+        holdings = [
+            (row.get("symbol", ""), row.get("amount", row.get("investment")))
+            for row in rows
+        ]
+        symbols = {str(symbol).upper().strip() for symbol, _ in holdings}
+        prefetched = async_price_repo.get_many_sync(
+            s for s in symbols if 0 < len(s) <= 10
+        )
+
+        result = get_crypto_service().analyze_portfolio(holdings, prefetched, points)
+        return (
+            json.dumps(result),
+            200,
+            {"Content-Type": "application/json"},
+        )
+
+    except Exception as e:
+        current_app.logger.error(f"Unexpected error: {e}", exc_info=True)
+        return (
+            json.dumps({"message": "Server Failure"}),
+            500,
+            {"Content-Type": "application/json"},
+        )
+
+
+@crypto_bp.route("/leaderboard", methods=["GET"])
+@rate_limit(limit=120, window=60)
+def leaderboard() -> Tuple[str, int, dict[str, str]]:
+    """
+    Serve the materialised top-movers leaderboard.
+
+    GET /api/v1/leaderboard?limit=10
+
+    The leaderboard is rebuilt by the refresh_leaderboard task; this only
+    reads the stored copy.
+
+    Returns:
+        JSON with the top ``limit`` symbols by lambos per $1000 invested
+    """
+    limit = request.args.get("limit", 10, type=int)
+    if limit is None or not 1 <= limit <= LEADERBOARD_SIZE:
+        return (
+            json.dumps({"error": f"limit must be between 1 and {LEADERBOARD_SIZE}"}),
+            400,
+            {"Content-Type": "application/json"},
+        )
+
+    from app.domain import leaderboard_repo
+
+    try:
+        entries = leaderboard_repo.get_leaderboard()[:limit]
+    except Exception as e:
+        current_app.logger.error(f"Unexpected error: {e}", exc_info=True)
+        return (
+            json.dumps({"message": "Server Failure"}),
+            500,
+            {"Content-Type": "application/json"},
+        )
+
+    return (
+        json.dumps(
+            {
+                "entries": entries,
+                "count": len(entries),
+                "generated_at": entries[0]["GENERATIONDATE"] if entries else None,
+            }
+        ),
+        200,
+        {"Content-Type": "application/json"},
+    )
+
+
+@crypto_bp.route("/symbols", methods=["GET"])
+@rate_limit(limit=300, window=60)
+@security_enhanced_route
+def symbols() -> Tuple[str, int, dict[str, str]]:
+    """
+    Autocomplete symbols that have a USD pair on Kraken.
+
+    GET /api/v1/symbols?prefix=BT&limit=10
+
+    Answered from the local asset pair index, so typing into a search box
+    does not reach Kraken per keystroke.
+
+    Returns:
+        JSON with up to ``limit`` matching symbols in alphabetical order
+    """
+    prefix = request.args.get("prefix", "")
+    limit = request.args.get("limit", 10, type=int)
+    if limit is None or not 1 <= limit <= SYMBOL_SEARCH_LIMIT:
+        return (
+            json.dumps({"error": f"limit must be between 1 and {SYMBOL_SEARCH_LIMIT}"}),
+            400,
+            {"Content-Type": "application/json"},
+        )
+
+    from app.domain import price_repo
+
+    try:
+        matches = price_repo.asset_pairs.search(prefix, limit)
+    except Exception as e:
+        return domain_error_response(e)
+
+    return (
+        json.dumps({"symbols": matches, "count": len(matches)}),
+        200,
+        {"Content-Type": "application/json"},
+    )
+
+
+@crypto_bp.route("/stats", methods=["GET"])
+@rate_limit(limit=60, window=60)
+def price_layer_stats() -> Tuple[str, int, dict[str, str]]:
+    """
+    Report price layer counters for cache sizing and monitoring.
+
+    GET /api/v1/stats
+
+    Returns:
+        JSON with hit, miss, coalesce and eviction counters per cache,
+        including the analysis kernel and chart payload caches, and the
+        query log's queue depth and flush latency
+    """
+    from app.domain import analysis_kernels, chart_payloads, price_repo, query_log
+
+    stats = price_repo.stats()
+    stats["analysis_kernels"] = analysis_kernels.stats()
+    stats["chart_payloads"] = chart_payloads.stats()
+    stats["query_log"] = query_log.stats()
+    return (
+        json.dumps(stats),
+        200,
+        {"Content-Type": "application/json"},
+    )
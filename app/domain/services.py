@@ -1,11 +1,39 @@
 """Domain services containing business logic."""
 
+import json
 import logging
+import math
+from datetime import datetime, timezone
 from decimal import Decimal
-from typing import Any, Dict
+from typing import Any, Dict, Iterable, Mapping, Optional
 
-from .exceptions import SymbolNotFoundError
-from .models import Investment
+import numpy as np
+
+from app.shared.cache import TTLCache
+
+from .constants import (
+    CURRENT_PERIOD_WEEKS,
+    ENTRY_SCAN_PERCENTILES,
+    LAMBO_PRICE,
+    LEADERBOARD_INVESTMENT,
+    LEADERBOARD_SIZE,
+    OHLC_INTERVAL_MINUTES,
+    OPENING_PERIOD_WEEKS,
+)
+from .downsampling import downsample_chart
+from .exceptions import CryptoDomainError, ExternalServiceError, SymbolNotFoundError
+from .models import (
+    AnalysisKernel,
+    AnyPriceData,
+    Investment,
+    calculate_dca_metrics,
+    calculate_investment_metrics,
+    calculate_portfolio_values,
+    chart_points,
+    dca_purchases_before,
+    dca_schedule,
+)
+from .numeric import EXACT, NumericBackend
 
 logger = logging.getLogger(__name__)
 
@@ -18,32 +46,64 @@ class CryptoAnalysisService:
     for analyzing cryptocurrency investments.
     """
 
-    def __init__(self, price_repo: Any, investment_repo: Any) -> None:
+    def __init__(
+        self,
+        price_repo: Any,
+        investment_repo: Any,
+        kernel_cache: Optional[TTLCache[AnalysisKernel]] = None,
+        chart_cache: Optional[TTLCache[bytes]] = None,
+        numeric: NumericBackend = EXACT,
+    ) -> None:
         """
         Initialize service with repository dependencies.
 
         Args:
             price_repo: Repository for price data access
             investment_repo: Repository for investment logging
+            kernel_cache: Shared cache of per-symbol analysis kernels;
+                kernels are rebuilt on every call when omitted
+            chart_cache: Shared cache of encoded graph_data payloads;
+                charts are encoded on every call when omitted
+            numeric: Number type for the lump-sum arithmetic, exact Decimal
+                or fast float64
         """
         self._price_repo = price_repo
         self._investment_repo = investment_repo
+        self._kernel_cache = kernel_cache
+        self._chart_cache = chart_cache
+        self._numeric = numeric
 
-    def analyze_investment(self, symbol: str, amount: Decimal) -> Dict[str, Any]:
+    def analyze_investment(
+        self,
+        symbol: str,
+        amount: Decimal,
+        opening_weeks: int = OPENING_PERIOD_WEEKS,
+        current_weeks: int = CURRENT_PERIOD_WEEKS,
+        points: Optional[int] = None,
+        encode_chart: bool = False,
+        buy_date: Optional[float] = None,
+        sell_date: Optional[float] = None,
+    ) -> Dict[str, Any]:
         """
         Analyze a crypto investment.
 
         This is the core use case orchestration that:
         1. Creates and validates investment
-        2. Checks symbol exists
-        3. Fetches price data
-        4. Calculates profit metrics
-        5. Logs the query
-        6. Returns results
+        2. Fetches price data (unknown symbols raise here)
+        3. Calculates profit metrics
+        4. Logs the query
+        5. Returns results
 
         Args:
             symbol: Cryptocurrency symbol (e.g., 'BTC')
             amount: Investment amount in USD
+            opening_weeks: Candles averaged for the buy price
+            current_weeks: Candles averaged for the current price
+            points: Downsample graph_data to this many points (None for all)
+            encode_chart: Return graph_data as JSON-encoded bytes, shared by
+                every request for the same chart
+            buy_date: Epoch seconds to buy at instead of the first candles
+            sell_date: Epoch seconds to sell at instead of the last candles
 
         Returns:
             Dictionary with analysis results including:
@@ -67,29 +127,26 @@ class CryptoAnalysisService:
         # 1. Create and validate domain model
         investment = Investment(symbol=symbol, amount=amount)
 
-        # 2. Check if symbol exists on exchange
-        if not self._price_repo.symbol_exists(investment.symbol):
+        # 2. Get price data; a single upstream response also tells us
+        # whether the symbol exists (handles caching internally)
+        try:
+            price_data = self._price_repo.get_price_data(investment.symbol)
+        except SymbolNotFoundError:
             logger.warning(f"Symbol not found: {investment.symbol}")
-            raise SymbolNotFoundError(
-                f"Symbol {investment.symbol} not found on exchange"
-            )
-
-        # 3. Get price data (handles caching internally)
-        price_data = self._price_repo.get_price_data(investment.symbol)
+            raise
 
-        # 4. Calculate metrics using domain model methods
-        opening_avg = price_data.get_opening_average()
-        current_avg = price_data.get_current_average()
-
-        coins = investment.calculate_coins_purchased(opening_avg)
-        profit = investment.calculate_profit(opening_avg, current_avg)
-        growth = investment.calculate_growth_factor(opening_avg, current_avg)
-        lambos = investment.calculate_lambos(opening_avg, current_avg)
+        # 3. Calculate metrics from the symbol's amount-independent kernel
+        kernel = self._get_kernel(
+            price_data, opening_weeks, current_weeks, buy_date, sell_date
+        )
+        metrics = kernel.evaluate(investment.amount)
+        coins, profit = metrics["coins"], metrics["profit"]
+        growth, lambos = metrics["growth"], metrics["lambos"]
 
-        # 5. Log the query to database
+        # 4. Log the query to database
         self._investment_repo.log_query(investment)
 
-        # 6. Build and return result
+        # 5. Build and return result
         result = {
             "SYMBOL": investment.symbol,
             "INVESTMENT": float(investment.amount),
@@ -98,10 +155,554 @@ class CryptoAnalysisService:
             "GROWTHFACTOR": float(growth),
             "LAMBOS": float(lambos),
             "GENERATIONDATE": investment.created_at.isoformat(),
-            "graph_data": price_data.to_chart_data(),
+            "graph_data": (
+                self._get_chart_payload(kernel, points)
+                if encode_chart
+                else kernel.chart(points)
+            ),
         }
 
         logger.info(
             f"Analysis complete for {symbol}: profit={profit:.2f}, lambos={lambos:.2f}"
         )
         return result
+
+    def scan_entries(
+        self,
+        symbol: str,
+        amount: Decimal,
+        opening_weeks: int = OPENING_PERIOD_WEEKS,
+        current_weeks: int = CURRENT_PERIOD_WEEKS,
+    ) -> Dict[str, Any]:
+        """
+        Analyze buying at every candle of the history.
+
+        The growth factor of every entry is computed once per candle version
+        in one vectorized pass and cached with the analysis kernel, so each
+        request only scales it by the amount.
+
+        Args:
+            symbol: Cryptocurrency symbol (e.g., 'BTC')
+            amount: Investment amount in USD
+            opening_weeks: Candles averaged for each buy price
+            current_weeks: Candles averaged for the current price
+
+        Returns:
+            Dictionary with SYMBOL, INVESTMENT, CURRENTPRICE, entries (date,
+            buy price, profit and lambos per buy candle), best and worst
+            entries, and profit percentiles
+
+        Raises:
+            InvalidInvestmentError: If investment data is invalid
+            SymbolNotFoundError: If symbol doesn't exist on exchange
+            InsufficientPriceDataError: If not enough price data
+            ExternalServiceError: If external API fails
+        """
+        logger.info(f"Scanning entry dates: {symbol}, amount: {amount}")
+
+        investment = Investment(symbol=symbol, amount=amount)
+        price_data = self._price_repo.get_price_data(investment.symbol)
+        kernel = self._get_kernel(price_data, opening_weeks, current_weeks)
+        labels, opening, growth = kernel.entry_growth()
+
+        profit = float(investment.amount) * growth
+        lambos = profit / float(LAMBO_PRICE)
+        entries = [
+            {"date": date, "price": price, "profit": gain, "lambos": count}
+            for date, price, gain, count in zip(
+                labels, opening.tolist(), profit.tolist(), lambos.tolist()
+            )
+        ]
+
+        self._investment_repo.log_query(investment)
+
+        return {
+            "SYMBOL": investment.symbol,
+            "INVESTMENT": float(investment.amount),
+            "CURRENTPRICE": float(kernel.current_average),
+            "entries": entries,
+            "best": entries[int(profit.argmax())],
+            "worst": entries[int(profit.argmin())],
+            "percentiles": {
+                f"p{q}": value
+                for q, value in zip(
+                    ENTRY_SCAN_PERCENTILES,
+                    np.percentile(profit, ENTRY_SCAN_PERCENTILES).tolist(),
+                )
+            },
+        }
+
+    def analyze_many(
+        self,
+        requests: Iterable[tuple[str, Any]],
+        price_data: Optional[Mapping[str, Any]] = None,
+    ) -> list[Dict[str, Any]]:
+        """
+        Analyze many investments in one pass.
+
+        Requests are grouped by symbol so each symbol's price data is loaded
+        once, and the metrics for all of its amounts are computed as one
+        vectorised operation. Invalid rows and failing symbols produce an
+        error entry instead of failing the batch.
+
+        Args:
+            requests: (symbol, amount) pairs
+            price_data: Price data (or the exception raised loading it) by
+                normalised symbol, e.g. from a concurrent prefetch; symbols
+                missing here are loaded from the price repository
+
+        Returns:
+            One result per request, in request order. Each is either the
+            analyze_investment fields without graph_data, or a dict with
+            SYMBOL, INVESTMENT and error.
+        """
+        requests = list(requests)
+        logger.info(f"Analyzing batch of {len(requests)} investments")
+        price_data = dict(price_data or {})
+
+        results: list[Dict[str, Any]] = [{} for _ in requests]
+        amounts = np.zeros(len(requests))
+        groups: dict[str, list[int]] = {}
+
+        # 1. Normalise and validate rows with the Investment rules
+        for i, (symbol, amount) in enumerate(requests):
+            symbol = str(symbol).upper().strip()
+            try:
+                amounts[i] = float(amount)
+            except (TypeError, ValueError):
+                results[i] = _batch_error(symbol, None, "Invalid investment amount")
+                continue
+
+            if not symbol or len(symbol) > 10:
+                results[i] = _batch_error(
+                    symbol, amounts[i], f"Invalid symbol: {symbol}"
+                )
+            elif not (math.isfinite(amounts[i]) and amounts[i] > 0):
+                results[i] = _batch_error(
+                    symbol, None, "Investment amount must be positive"
+                )
+            else:
+                groups.setdefault(symbol, []).append(i)
+
+        # 2. Load each symbol once and compute its rows together
+        generated_at = datetime.now(timezone.utc)
+        logged: list[tuple[str, float]] = []
+        for symbol, indexes in groups.items():
+            try:
+                kernel = self._get_kernel(self._load_price_data(symbol, price_data))
+                metrics = calculate_investment_metrics(
+                    amounts[indexes],
+                    float(kernel.opening_average),
+                    float(kernel.current_average),
+                )
+            except CryptoDomainError as e:
+                logger.warning(f"Batch analysis failed for {symbol}: {e}")
+                for i in indexes:
+                    results[i] = _batch_error(symbol, amounts[i], str(e))
+                continue
+
+            rows = zip(
+                indexes,
+                amounts[indexes].tolist(),
+                metrics["coins"].tolist(),
+                metrics["profit"].tolist(),
+                metrics["growth"].tolist(),
+                metrics["lambos"].tolist(),
+            )
+            for i, amount, coins, profit, growth, lambos in rows:
+                results[i] = {
+                    "SYMBOL": symbol,
+                    "INVESTMENT": amount,
+                    "NUMBERCOINS": coins,
+                    "PROFIT": profit,
+                    "GROWTHFACTOR": growth,
+                    "LAMBOS": lambos,
+                    "GENERATIONDATE": generated_at.isoformat(),
+                }
+                logged.append((symbol, amount))
+
+        # 3. Log the successful queries in one write
+        self._investment_repo.log_queries(logged, generated_at)
+        return results
+
+    def analyze_dca(
+        self,
+        symbol: str,
+        amount: Decimal,
+        frequency: str,
+        start_date: float,
+        end_date: Optional[float] = None,
+        current_weeks: int = CURRENT_PERIOD_WEEKS,
+        points: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Analyze buying a fixed amount on a schedule (dollar-cost averaging).
+
+        Args:
+            symbol: Cryptocurrency symbol (e.g., 'BTC')
+            amount: USD spent on each purchase
+            frequency: "daily", "weekly" or "monthly"
+            start_date: Epoch seconds of the first purchase
+            end_date: Epoch seconds of the last possible purchase (now if None)
+            current_weeks: Candles averaged for the current price
+            points: Downsample graph_data to this many points (None for all)
+
+        Returns:
+            Dictionary with SYMBOL, INVESTMENT (per purchase), FREQUENCY,
+            PURCHASES, SKIPPEDPURCHASES (scheduled before the price history
+            starts, so not bought), TOTALINVESTED, NUMBERCOINS, PROFIT,
+            GROWTHFACTOR, LAMBOS, GENERATIONDATE and graph_data (holding
+            value per candle)
+
+        Raises:
+            InvalidInvestmentError: If investment data or frequency is invalid
+            SymbolNotFoundError: If symbol doesn't exist on exchange
+            InsufficientPriceDataError: If no candle covers the schedule
+            ExternalServiceError: If external API fails
+        """
+        logger.info(f"Analyzing {frequency} DCA: {symbol}, amount: {amount}")
+
+        investment = Investment(symbol=symbol, amount=amount)
+        result, chart = self._simulate_dca(
+            investment, frequency, start_date, end_date, current_weeks
+        )
+        self._investment_repo.log_query(investment)
+
+        if points is not None:
+            chart = downsample_chart(chart, points)
+        result["graph_data"] = chart
+        return result
+
+    def analyze_dca_many(
+        self, requests: Iterable[tuple[str, Any, str, float, Optional[float]]]
+    ) -> list[Dict[str, Any]]:
+        """
+        Analyze many DCA plans.
+
+        Each plan is simulated with the vectorised engine; invalid rows and
+        failing symbols produce an error entry instead of failing the batch.
+
+        Args:
+            requests: (symbol, amount, frequency, start_date, end_date) rows;
+                dates are epoch seconds, end_date may be None
+
+        Returns:
+            One result per request, in request order. Each is either the
+            analyze_dca fields without graph_data, or a dict with SYMBOL,
+            INVESTMENT and error.
+        """
+        results: list[Dict[str, Any]] = []
+        logged: list[tuple[str, float]] = []
+        generated_at = datetime.now(timezone.utc)
+        for symbol, amount, frequency, start_date, end_date in requests:
+            symbol = str(symbol).upper().strip()
+            if start_date is None:
+                results.append(_batch_error(symbol, None, "start_date is required"))
+                continue
+            try:
+                amount = Decimal(str(amount))
+            except ArithmeticError:
+                results.append(_batch_error(symbol, None, "Invalid investment amount"))
+                continue
+            try:
+                investment = Investment(
+                    symbol=symbol, amount=amount, created_at=generated_at
+                )
+                result, _ = self._simulate_dca(
+                    investment, frequency, start_date, end_date
+                )
+            except CryptoDomainError as e:
+                logger.warning(f"Batch DCA failed for {symbol}: {e}")
+                results.append(_batch_error(symbol, None, str(e)))
+                continue
+            results.append(result)
+            logged.append((investment.symbol, float(investment.amount)))
+
+        self._investment_repo.log_queries(logged, generated_at)
+        return results
+
+    def analyze_portfolio(
+        self,
+        holdings: Iterable[tuple[str, Any]],
+        price_data: Optional[Mapping[str, Any]] = None,
+        points: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Analyze a portfolio of lump-sum holdings.
+
+        Args:
+            holdings: (symbol, amount) pairs
+            price_data: Price data (or the exception raised loading it) by
+                normalised symbol, e.g. from a concurrent prefetch; symbols
+                missing here are loaded from the price repository
+            points: Downsample graph_data to this many points (None for all)
+
+        Returns:
+            Dictionary with holdings (one result or error entry per holding,
+            in order), the aggregate INVESTMENT, VALUE, PROFIT, GROWTHFACTOR
+            and LAMBOS of the valid holdings, GENERATIONDATE, and graph_data
+            with the total value over time
+        """
+        holdings = list(holdings)
+        logger.info(f"Analyzing portfolio of {len(holdings)} holdings")
+        price_data = dict(price_data or {})
+
+        generated_at = datetime.now(timezone.utc)
+        results: list[Dict[str, Any]] = []
+        series: list[tuple[np.ndarray, np.ndarray, float, float]] = []
+        value = 0.0
+        for symbol, amount in holdings:
+            symbol = str(symbol).upper().strip()
+            try:
+                investment = Investment(
+                    symbol=symbol,
+                    amount=Decimal(str(amount)),
+                    created_at=generated_at,
+                )
+                kernel = self._get_kernel(self._load_price_data(symbol, price_data))
+                metrics = kernel.evaluate(investment.amount)
+            except ArithmeticError:
+                results.append(_batch_error(symbol, None, "Invalid investment amount"))
+                continue
+            except CryptoDomainError as e:
+                logger.warning(f"Portfolio analysis failed for {symbol}: {e}")
+                results.append(_batch_error(symbol, amount, str(e)))
+                continue
+
+            coins = float(metrics["coins"])
+            results.append(
+                {
+                    "SYMBOL": symbol,
+                    "INVESTMENT": float(investment.amount),
+                    "NUMBERCOINS": coins,
+                    "PROFIT": float(metrics["profit"]),
+                    "GROWTHFACTOR": float(metrics["growth"]),
+                    "LAMBOS": float(metrics["lambos"]),
+                }
+            )
+            timestamps, closes = price_data[symbol].series
+            series.append((timestamps, closes, coins, float(investment.amount)))
+            value += coins * float(kernel.current_average)
+
+        valid = [r for r in results if "error" not in r]
+        invested = sum(r["INVESTMENT"] for r in valid)
+        chart: list[dict[str, Any]] = []
+        if series:
+            chart = chart_points(*calculate_portfolio_values(series))
+            if points is not None:
+                chart = downsample_chart(chart, points)
+
+        self._investment_repo.log_queries(
+            [(r["SYMBOL"], r["INVESTMENT"]) for r in valid], generated_at
+        )
+
+        profit = value - invested
+        return {
+            "holdings": results,
+            "INVESTMENT": invested,
+            "VALUE": value,
+            "PROFIT": profit,
+            "GROWTHFACTOR": profit / invested if invested else 0.0,
+            "LAMBOS": profit / float(LAMBO_PRICE),
+            "GENERATIONDATE": generated_at.isoformat(),
+            "graph_data": chart,
+        }
+
+    def get_chart(
+        self,
+        symbol: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        points: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Chart a symbol's closes over a time range.
+
+        The repository picks the candle level (base or a stored rollup)
+        that covers the range in about ``points`` candles; any excess is
+        downsampled with LTTB.
+
+        Args:
+            symbol: Cryptocurrency symbol (e.g., 'BTC')
+            start: First candle time, epoch seconds (history start if None)
+            end: End of the range, exclusive (latest candle if None)
+            points: Point budget (None for every base candle)
+
+        Returns:
+            Dictionary with SYMBOL, INTERVAL (minutes per point) and
+            graph_data
+
+        Raises:
+            SymbolNotFoundError: If symbol doesn't exist on exchange
+            InsufficientPriceDataError: If no candle falls in the range
+            ExternalServiceError: If external API fails
+        """
+        symbol = symbol.upper().strip()
+        interval, timestamps, closes = self._price_repo.get_chart_candles(
+            symbol, start, end, points
+        )
+        chart = chart_points(timestamps, closes)
+        if points is not None:
+            chart = downsample_chart(chart, points)
+        return {"SYMBOL": symbol, "INTERVAL": interval, "graph_data": chart}
+
+    def build_leaderboard(
+        self, price_data: Mapping[str, Any], size: int = LEADERBOARD_SIZE
+    ) -> list[Dict[str, Any]]:
+        """
+        Rank symbols by growth since the start of their history.
+
+        Growth factors are computed for all symbols in one vectorised
+        operation. Symbols whose data failed to load, or is too short to
+        average, are left out.
+
+        Args:
+            price_data: Price data (or the exception raised loading it) by
+                symbol, e.g. from a concurrent fetch of every USD pair
+            size: Number of entries to keep
+
+        Returns:
+            Up to ``size`` dicts with SYMBOL, GROWTHFACTOR and LAMBOS (per
+            LEADERBOARD_INVESTMENT dollars), best first
+        """
+        symbols, opening, current = [], [], []
+        for symbol, data in price_data.items():
+            if isinstance(data, Exception):
+                continue
+            try:
+                averages = (data.get_opening_average(), data.get_current_average())
+            except CryptoDomainError as e:
+                logger.warning(f"Leaderboard skipped {symbol}: {e}")
+                continue
+            if averages[0] > 0:
+                symbols.append(symbol)
+                opening.append(float(averages[0]))
+                current.append(float(averages[1]))
+
+        growth = np.asarray(current) / np.asarray(opening) - 1
+        lambos = growth * LEADERBOARD_INVESTMENT / float(LAMBO_PRICE)
+        order = np.argsort(-growth, kind="stable")[:size]
+        return [
+            {
+                "SYMBOL": symbols[i],
+                "GROWTHFACTOR": float(growth[i]),
+                "LAMBOS": float(lambos[i]),
+            }
+            for i in order.tolist()
+        ]
+
+    def _simulate_dca(
+        self,
+        investment: Investment,
+        frequency: str,
+        start_date: float,
+        end_date: Optional[float] = None,
+        current_weeks: int = CURRENT_PERIOD_WEEKS,
+    ) -> tuple[Dict[str, Any], list[dict[str, Any]]]:
+        """Run a DCA plan and return its result fields and value chart."""
+        price_data = self._price_repo.get_price_data(investment.symbol)
+        kernel = self._get_kernel(price_data, current_weeks=current_weeks)
+        timestamps, closes = price_data.series
+
+        # Only purchases the history can price are built; earlier ones are
+        # counted and reported, and none are scheduled after now
+        now = investment.created_at.timestamp()
+        end_date = now if end_date is None else min(end_date, now)
+        history_start = int(timestamps[0])
+        schedule = dca_schedule(start_date, end_date, frequency, since=history_start)
+        skipped = dca_purchases_before(
+            start_date, min(history_start, end_date + 1), frequency
+        )
+        metrics = calculate_dca_metrics(
+            timestamps, closes, float(investment.amount), schedule
+        )
+
+        invested = float(metrics["invested"][-1])
+        coins = float(metrics["coins"][-1])
+        profit = coins * float(kernel.current_average) - invested
+
+        first = int(np.argmax(metrics["purchases"] > 0))
+        values = (metrics["coins"][first:] * closes[first:]).tolist()
+        labels = [point["x"] for point in kernel.chart()[first:]]
+        chart = [{"x": label, "y": value} for label, value in zip(labels, values)]
+
+        result = {
+            "SYMBOL": investment.symbol,
+            "INVESTMENT": float(investment.amount),
+            "FREQUENCY": frequency,
+            "PURCHASES": int(metrics["purchases"][-1]),
+            "SKIPPEDPURCHASES": skipped,
+            "TOTALINVESTED": invested,
+            "NUMBERCOINS": coins,
+            "PROFIT": profit,
+            "GROWTHFACTOR": profit / invested,
+            "LAMBOS": profit / float(LAMBO_PRICE),
+            "GENERATIONDATE": investment.created_at.isoformat(),
+        }
+        return result, chart
+
+    def _load_price_data(self, symbol: str, price_data: dict[str, Any]) -> AnyPriceData:
+        """
+        Return prefetched price data for a symbol, loading it if missing.
+
+        A domain error from the prefetch (or the load) is raised again, and
+        any other prefetch failure becomes an ExternalServiceError.
+        """
+        if symbol not in price_data:
+            try:
+                price_data[symbol] = self._price_repo.get_price_data(symbol)
+            except CryptoDomainError as e:
+                price_data[symbol] = e
+        loaded = price_data[symbol]
+        if isinstance(loaded, CryptoDomainError):
+            raise loaded
+        if isinstance(loaded, Exception):
+            raise ExternalServiceError(
+                f"Price data unavailable for {symbol}"
+            ) from loaded
+        return loaded
+
+    def _get_kernel(
+        self,
+        price_data: AnyPriceData,
+        opening_weeks: int = OPENING_PERIOD_WEEKS,
+        current_weeks: int = CURRENT_PERIOD_WEEKS,
+        buy_date: Optional[float] = None,
+        sell_date: Optional[float] = None,
+    ) -> AnalysisKernel:
+        """Return the memoised kernel for this candle version and windows."""
+        windows = (opening_weeks, current_weeks, buy_date, sell_date)
+        if self._kernel_cache is None:
+            return AnalysisKernel.build(price_data, *windows, numeric=self._numeric)
+
+        key = (price_data.symbol, price_data.version, *windows, self._numeric.name)
+        return self._kernel_cache.get_or_load(
+            key,
+            lambda: AnalysisKernel.build(price_data, *windows, numeric=self._numeric),
+        )
+
+    def _get_chart_payload(
+        self, kernel: AnalysisKernel, points: Optional[int] = None
+    ) -> bytes:
+        """Return the encoded chart, reused until the candle version changes."""
+        if self._chart_cache is None:
+            return _encode_chart(kernel.chart(points))
+
+        key = (kernel.symbol, OHLC_INTERVAL_MINUTES, points, kernel.version)
+        return self._chart_cache.get_or_load(
+            key, lambda: _encode_chart(kernel.chart(points))
+        )
+
+
+def _batch_error(symbol: str, amount: Any, message: str) -> Dict[str, Any]:
+    """Build the result entry for a batch row that could not be analysed."""
+    return {
+        "SYMBOL": symbol,
+        "INVESTMENT": None if amount is None else float(amount),
+        "error": message,
+    }
+
+
+def _encode_chart(chart: list[dict[str, Any]]) -> bytes:
+    """Encode chart data exactly as json.dumps would inside a response."""
+    return json.dumps(chart).encode()
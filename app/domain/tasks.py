@@ -10,6 +10,8 @@ from typing import Any, Dict
 
 from celery import shared_task
 
+from app.domain.constants import LEADERBOARD_MIN_LOADED
+
 logger = logging.getLogger(__name__)
 
 
@@ -139,23 +141,85 @@ def periodic_price_update() -> Dict[str, Any]:
     """
     logger.info("Starting periodic price update")
 
-    # TODO: Implement actual price update logic when repositories are ready
-    # Example implementation:
-    # from app.infrastructure.repositories import PriceRepository
-    # price_repo = PriceRepository()
-    # symbols = ['BTC', 'ETH', 'SOL']  # Configure from settings
-    # updated = []
-    # for symbol in symbols:
-    #     try:
-    #         price_data = price_repo.get_price_data(symbol, force_refresh=True)
-    #         updated.append(symbol)
-    #     except Exception as e:
-    #         logger.error(f"Failed to update {symbol}: {e}")
+    from flask import current_app
+
+    from app.domain import async_price_repo, price_repo
+
+    symbols = current_app.config.get("PRICE_WARMUP_SYMBOLS", [])
+    for symbol in symbols:
+        price_repo.invalidate(symbol)
+
+    # Fetch every symbol concurrently; one failure does not block the rest
+    results = async_price_repo.get_many_sync(symbols)
+
+    updated, failed = [], {}
+    for symbol, result in results.items():
+        if isinstance(result, Exception):
+            logger.error(f"Failed to update {symbol}: {result}")
+            failed[symbol] = str(result)
+        else:
+            updated.append(symbol)
+
+    logger.info(f"Periodic price update refreshed {len(updated)}/{len(symbols)}")
+    return {
+        "status": "completed" if not failed else "partial",
+        "updated_symbols": updated,
+        "failed_symbols": failed,
+    }
+
+
+@shared_task(name="app.domain.tasks.refresh_leaderboard")
+def refresh_leaderboard() -> Dict[str, Any]:
+    """
+    Rebuild the top-movers leaderboard across every Kraken USD pair.
+
+    Every pair is fetched through the bounded async price repository, the
+    growth factors are ranked in one pass, and the result is written to the
+    LEADERBOARD table for /api/v1/leaderboard to serve. When nothing is
+    ranked, or fewer than LEADERBOARD_MIN_LOADED of the pairs load, the
+    stored leaderboard is kept and the run reports "failed".
+
+    Schedule in celery beat:
+        'refresh-leaderboard': {
+            'task': 'app.domain.tasks.refresh_leaderboard',
+            'schedule': crontab(minute=0),  # Hourly
+        }
+
+    Returns:
+        Dictionary with status and symbol counts
+    """
+    logger.info("Starting leaderboard refresh")
+
+    from datetime import datetime, timezone
+
+    from app.domain import async_price_repo, leaderboard_repo, price_repo
+    from app.domain.routes import get_crypto_service
+
+    symbols = price_repo.usd_symbols()
+    results = async_price_repo.get_many_sync(symbols)
+    failed = [s for s, result in results.items() if isinstance(result, Exception)]
+
+    entries = get_crypto_service().build_leaderboard(results)
+    loaded = len(symbols) - len(failed)
+    if not entries or loaded < LEADERBOARD_MIN_LOADED * len(symbols):
+        logger.error(
+            f"Leaderboard refresh loaded {loaded} of {len(symbols)} USD pairs "
+            f"and ranked {len(entries)}; keeping the previous leaderboard"
+        )
+        return {
+            "status": "failed",
+            "symbols": len(symbols),
+            "ranked": len(entries),
+            "failed_symbols": failed,
+        }
+    leaderboard_repo.save_leaderboard(entries, datetime.now(timezone.utc))
 
+    logger.info(f"Leaderboard ranked {len(entries)} of {len(symbols)} USD pairs")
     return {
-        "status": "completed",
-        "updated_symbols": [],  # Will contain actual symbols when implemented
-        "message": "Mock periodic update - implement repository layer",
+        "status": "completed" if not failed else "partial",
+        "symbols": len(symbols),
+        "ranked": len(entries),
+        "failed_symbols": failed,
     }
 
 
@@ -0,0 +1,170 @@
+"""In-process caching primitives."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Generic, Hashable, Optional, TypeVar
+
+V = TypeVar("V")
+
+
+class _Flight:
+    """A load in progress that concurrent callers can wait on."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class TTLCache(Generic[V]):
+    """
+    Thread-safe, bounded cache with per-entry TTL and LRU eviction.
+
+    ``get_or_load`` coalesces concurrent misses for the same key onto a
+    single in-flight load (single-flight), so a burst of requests for a
+    cold key triggers exactly one upstream fetch.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 256,
+        ttl: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+
+        # key -> (expiry, value), ordered from least to most recently used
+        self._data: "OrderedDict[Hashable, tuple[float, V]]" = OrderedDict()
+        self._inflight: dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return a live cached value, or None on a miss."""
+        with self._lock:
+            value = self._get_live(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def peek(self, key: Hashable) -> Optional[V]:
+        """Return a live cached value without counting a lookup or reordering."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= self._clock():
+                return None
+            return entry[1]
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._set(key, value)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], V]) -> V:
+        """
+        Return the cached value for key, loading it on a miss.
+
+        Concurrent misses for the same key wait for the first caller's
+        load and share its result or exception.
+
+        Args:
+            key: Cache key
+            loader: Zero-argument callable producing the value
+
+        Returns:
+            Cached or freshly loaded value
+        """
+        with self._lock:
+            value = self._get_live(key)
+            if value is not None:
+                self.hits += 1
+                return value
+
+            flight = self._inflight.get(key)
+            if flight is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                self.misses += 1
+                flight = self._inflight[key] = _Flight()
+                leader = True
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = loader()
+        except BaseException as e:
+            flight.error = e
+            raise
+        else:
+            with self._lock:
+                self._set(key, flight.value)
+            return flight.value
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove a key from the cache."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict[str, Any]:
+        """Return counters for sizing and monitoring the cache."""
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            }
+
+    def _get_live(self, key: Hashable) -> Optional[V]:
+        """Return an unexpired value and mark it recently used (lock held)."""
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expiry, value = entry
+        if expiry <= self._clock():
+            del self._data[key]
+            self.expirations += 1
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def _set(self, key: Hashable, value: V) -> None:
+        """Insert a value and enforce the size bound (lock held)."""
+        self._data[key] = (self._clock() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+            self.evictions += 1
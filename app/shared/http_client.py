@@ -0,0 +1,156 @@
+"""Pooled, keep-alive HTTP client for upstream APIs."""
+
+import logging
+import os
+import random
+import threading
+import weakref
+from typing import Any, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# Status codes worth retrying: rate limiting and transient server errors
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+class JitteredRetry(Retry):
+    """urllib3 Retry that adds random jitter to the exponential backoff."""
+
+    def __init__(self, *args: Any, jitter: float = 0.0, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.jitter = jitter
+
+    def new(self, **kwargs: Any) -> "JitteredRetry":
+        """Carry the jitter setting over to the next retry state."""
+        retry = super().new(**kwargs)
+        retry.jitter = self.jitter
+        return retry
+
+    def get_backoff_time(self) -> float:
+        """Return the exponential backoff plus up to ``jitter`` seconds."""
+        backoff = super().get_backoff_time()
+        if backoff <= 0 or self.jitter <= 0:
+            return backoff
+        return backoff + random.uniform(0, self.jitter)  # nosec B311
+
+
+class HttpClient:
+    """
+    Thread-safe, connection-pooled HTTP client.
+
+    Wraps a single ``requests.Session`` whose adapter keeps up to
+    ``pool_size`` keep-alive connections per host, applies connect/read
+    timeouts to every call and retries 429/5xx responses with jittered
+    exponential backoff (honouring ``Retry-After``).
+
+    The session is created lazily and discarded in forked children so
+    gunicorn/Celery workers never share sockets with their parent.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = 10,
+        connect_timeout: float = 3.05,
+        read_timeout: float = 10,
+        max_retries: int = 3,
+        backoff_factor: float = 0.5,
+        backoff_jitter: float = 0.5,
+    ) -> None:
+        self.pool_size = pool_size
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.backoff_jitter = backoff_jitter
+
+        self._session: Optional[requests.Session] = None
+        self._lock = threading.Lock()
+        _clients.add(self)
+
+    @property
+    def timeout(self) -> tuple[float, float]:
+        """Return the (connect, read) timeout tuple passed to requests."""
+        return (self.connect_timeout, self.read_timeout)
+
+    @property
+    def session(self) -> requests.Session:
+        """Return the shared session, creating it on first use."""
+        session = self._session
+        if session is None:
+            with self._lock:
+                if self._session is None:
+                    self._session = self._build_session()
+                session = self._session
+        return session
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        """
+        Issue a GET request through the pooled session.
+
+        Args:
+            url: Request URL
+            **kwargs: Extra arguments for ``requests.Session.get``
+
+        Returns:
+            The final response once retries are exhausted
+
+        Raises:
+            requests.RequestException: On connection errors or timeouts
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session.get(url, **kwargs)
+
+    def close(self) -> None:
+        """Close pooled connections; the next call opens a fresh session."""
+        with self._lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+    def _build_session(self) -> requests.Session:
+        """Create a session with pooling and retry configured."""
+        retry = JitteredRetry(
+            total=self.max_retries,
+            connect=self.max_retries,
+            read=self.max_retries,
+            status=self.max_retries,
+            backoff_factor=self.backoff_factor,
+            status_forcelist=RETRY_STATUS_CODES,
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+            jitter=self.backoff_jitter,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size,
+            pool_maxsize=self.pool_size,
+            max_retries=retry,
+        )
+
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers.update({"Accept-Encoding": "gzip, deflate"})
+        return session
+
+    def _reset_after_fork(self) -> None:
+        """Drop the inherited session without closing the parent's sockets."""
+        self._session = None
+        self._lock = threading.Lock()
+
+
+# Every client, so forked children can drop inherited sessions
+_clients: "weakref.WeakSet[HttpClient]" = weakref.WeakSet()
+
+
+def _reset_clients_after_fork() -> None:
+    for client in list(_clients):
+        client._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_clients_after_fork)
@@ -0,0 +1,159 @@
+"""Shared cross-process cache backed by Redis."""
+
+import logging
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+# Conditional imports to avoid issues when dependencies are not installed
+try:
+    import redis
+
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    redis = None  # type: ignore
+
+logger = logging.getLogger(__name__)
+
+
+class RedisCache:
+    """
+    Byte-oriented cache and lock shared by every worker process.
+
+    All Redis failures are logged and treated as cache misses (or a lock
+    that could not be taken) so the cache can never fail a request.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        prefix: str = "dwml:",
+        lock_ttl: float = 30.0,
+        lock_wait: float = 10.0,
+        lock_poll_interval: float = 0.05,
+    ) -> None:
+        self.client = client
+        self.prefix = prefix
+        self.lock_ttl = lock_ttl
+        self.lock_wait = lock_wait
+        self.lock_poll_interval = lock_poll_interval
+
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self.lock_waits = 0
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs: Any) -> Optional["RedisCache"]:
+        """
+        Create a cache for a Redis URL, or None if redis is not installed.
+
+        Args:
+            url: Redis connection URL
+            **kwargs: Extra RedisCache settings
+        """
+        if not REDIS_AVAILABLE:
+            logger.warning("redis not installed, shared cache disabled")
+            return None
+
+        client = redis.Redis.from_url(
+            url, socket_timeout=0.5, socket_connect_timeout=0.5
+        )
+        return cls(client, **kwargs)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return the cached bytes for key, or None."""
+        try:
+            value = self.client.get(self.prefix + key)
+        except Exception as e:
+            self._record_error("get", e)
+            return None
+
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store bytes for key with a TTL in seconds."""
+        try:
+            self.client.set(self.prefix + key, value, px=int(ttl * 1000))
+        except Exception as e:
+            self._record_error("set", e)
+
+    def delete(self, key: str) -> None:
+        """Remove a key."""
+        try:
+            self.client.delete(self.prefix + key)
+        except Exception as e:
+            self._record_error("delete", e)
+
+    @contextmanager
+    def lock(self, key: str) -> Iterator[bool]:
+        """
+        Hold a distributed lock on key for the duration of the block.
+
+        Waits up to ``lock_wait`` seconds for another holder to finish.
+        The lock expires after ``lock_ttl`` seconds so a crashed holder
+        cannot wedge other processes.
+
+        Yields:
+            True if the lock was acquired, False if waiting timed out
+        """
+        name = f"{self.prefix}lock:{key}"
+        token = uuid.uuid4().hex
+        acquired = self._acquire(name, token)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                self._release(name, token)
+
+    def stats(self) -> dict[str, Any]:
+        """Return counters for monitoring the shared cache."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "lock_waits": self.lock_waits,
+        }
+
+    def _acquire(self, name: str, token: str) -> bool:
+        """Take the lock with SET NX, polling until lock_wait elapses."""
+        deadline = time.monotonic() + self.lock_wait
+        waited = False
+        while True:
+            try:
+                if self.client.set(name, token, nx=True, px=int(self.lock_ttl * 1000)):
+                    return True
+            except Exception as e:
+                self._record_error("lock", e)
+                return False
+
+            if time.monotonic() >= deadline:
+                return False
+            if not waited:
+                self.lock_waits += 1
+                waited = True
+            time.sleep(self.lock_poll_interval)
+
+    def _release(self, name: str, token: str) -> None:
+        """Delete the lock only if this holder still owns it."""
+        try:
+            with self.client.pipeline() as pipe:
+                pipe.watch(name)
+                if pipe.get(name) == token.encode():
+                    pipe.multi()
+                    pipe.delete(name)
+                    pipe.execute()
+                else:
+                    pipe.unwatch()
+        except Exception as e:
+            self._record_error("unlock", e)
+
+    def _record_error(self, operation: str, error: Exception) -> None:
+        self.errors += 1
+        logger.warning(f"Shared cache {operation} failed: {error}")
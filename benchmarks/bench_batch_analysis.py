@@ -0,0 +1,75 @@
+"""Benchmark per-row analyze_investment vs vectorised analyze_many.
+
+Usage:
+    python -m benchmarks.bench_batch_analysis [--rows N] [--symbols N] [--repeat N]
+"""
+
+import argparse
+import random
+import timeit
+from decimal import Decimal
+from typing import Optional
+
+from app.domain.services import CryptoAnalysisService
+
+
+class StubPriceData:
+    symbol = "STUB"
+    version = "1"
+
+    def get_opening_average(self, weeks: int = 4) -> Decimal:
+        return Decimal("3650.5")
+
+    def get_current_average(self, weeks: int = 4) -> Decimal:
+        return Decimal("64250.25")
+
+    def to_chart_data(self, points: Optional[int] = None) -> list:
+        return []
+
+
+class StubPriceRepository:
+    def __init__(self) -> None:
+        self.price_data = StubPriceData()
+
+    def get_price_data(self, symbol: str) -> StubPriceData:
+        return self.price_data
+
+
+class NullInvestmentRepository:
+    def log_query(self, investment) -> None:
+        pass
+
+    def log_queries(self, entries, created_at) -> None:
+        pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--symbols", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    symbols = [f"S{i}" for i in range(args.symbols)]
+    requests = [
+        (random.choice(symbols), random.randint(1, 100000))  # nosec B311
+        for _ in range(args.rows)
+    ]
+    service = CryptoAnalysisService(StubPriceRepository(), NullInvestmentRepository())
+
+    cases = {
+        "analyze_investment loop": lambda: [
+            service.analyze_investment(symbol, Decimal(amount))
+            for symbol, amount in requests
+        ],
+        "analyze_many": lambda: service.analyze_many(requests),
+    }
+
+    print(f"{args.rows} rows over {args.symbols} symbols, best of {args.repeat}")
+    for name, case in cases.items():
+        best = min(timeit.repeat(case, number=1, repeat=args.repeat))
+        print(f"  {name:<24} {best * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark the vectorised DCA engine vs a per-purchase Decimal loop.
+
+Usage:
+    python -m benchmarks.bench_dca [--candles N] [--frequency F] [--repeat N]
+"""
+
+import argparse
+import timeit
+from datetime import datetime
+from decimal import Decimal
+
+from app.domain.constants import DCA_FREQUENCIES
+from app.domain.models import PriceData, calculate_dca_metrics, dca_schedule
+from benchmarks.bench_price_data import build_exact, make_rows
+
+
+def naive_dca(
+    price_data: PriceData, amount: Decimal, start: float, end: float, frequency: str
+) -> tuple[Decimal, Decimal]:
+    """Buy once per scheduled date, looking up each candle by scanning."""
+    invested, coins = Decimal(0), Decimal(0)
+    for when in dca_schedule(start, end, frequency).tolist():
+        moment = datetime.fromtimestamp(when)
+        candle = None
+        for timestamp, price in price_data.prices:
+            if timestamp > moment:
+                break
+            candle = price
+        if candle is not None:
+            invested += amount
+            coins += amount / candle
+    return invested, coins
+
+
+def vectorised_dca(
+    price_data: PriceData, amount: Decimal, start: float, end: float, frequency: str
+) -> tuple[float, float]:
+    timestamps, closes = price_data.series
+    metrics = calculate_dca_metrics(
+        timestamps, closes, float(amount), dca_schedule(start, end, frequency)
+    )
+    return float(metrics["invested"][-1]), float(metrics["coins"][-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--candles", type=int, default=190)
+    parser.add_argument("--frequency", choices=DCA_FREQUENCIES, default="weekly")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    price_data = build_exact(make_rows(args.candles))
+    start = price_data.prices[0][0].timestamp()
+    end = price_data.prices[-1][0].timestamp()
+    amount = Decimal(100)
+
+    naive = naive_dca(price_data, amount, start, end, args.frequency)
+    fast = vectorised_dca(price_data, amount, start, end, args.frequency)
+    assert float(naive[0]) == fast[0]
+    assert abs(float(naive[1]) - fast[1]) <= 1e-9 * fast[1]
+
+    cases = {
+        "naive loop": lambda: naive_dca(price_data, amount, start, end, args.frequency),
+        "vectorised": lambda: vectorised_dca(
+            price_data, amount, start, end, args.frequency
+        ),
+    }
+
+    purchases = dca_schedule(start, end, args.frequency).size
+    print(
+        f"{args.candles} candles, {purchases} {args.frequency} purchases, "
+        f"best of {args.repeat}"
+    )
+    for name, case in cases.items():
+        best = min(timeit.repeat(case, number=1, repeat=args.repeat))
+        print(f"  {name:<12} {best * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
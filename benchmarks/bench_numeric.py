@@ -0,0 +1,78 @@
+"""Benchmark the /process_request service path in exact vs fast numeric mode.
+
+"warm" is the steady state: kernel and chart payload served from cache,
+so a request pays for validation and the per-amount arithmetic. "cold" is
+the first request after a new candle: the kernel is rebuilt every call.
+
+Usage:
+    python -m benchmarks.bench_numeric [--candles N] [--requests N] [--repeat N]
+"""
+
+import argparse
+import random
+import timeit
+from decimal import Decimal
+
+from app.domain.numeric import NUMERIC_BACKENDS
+from app.domain.services import CryptoAnalysisService
+from app.shared.cache import TTLCache
+from benchmarks.bench_batch_analysis import NullInvestmentRepository
+from benchmarks.bench_price_data import build_columnar, build_exact, make_rows
+
+
+class FixedPriceRepository:
+    def __init__(self, price_data) -> None:
+        self.price_data = price_data
+
+    def get_price_data(self, symbol: str):
+        return self.price_data
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--candles", type=int, default=190)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = make_rows(args.candles)
+    amounts = [
+        Decimal(random.randint(1, 100000)) for _ in range(args.requests)  # nosec B311
+    ]
+
+    print(
+        f"{args.requests} requests over {args.candles} candles, "
+        f"best of {args.repeat}, per request"
+    )
+    for data_mode, build in (("exact", build_exact), ("columnar", build_columnar)):
+        repo = FixedPriceRepository(build(rows))
+        for numeric in NUMERIC_BACKENDS.values():
+            warm = CryptoAnalysisService(
+                repo,
+                NullInvestmentRepository(),
+                TTLCache(maxsize=8, ttl=3600),
+                TTLCache(maxsize=8, ttl=3600),
+                numeric,
+            )
+            cold = CryptoAnalysisService(
+                repo, NullInvestmentRepository(), numeric=numeric
+            )
+            for state, service in (("warm", warm), ("cold", cold)):
+                best = min(
+                    timeit.repeat(
+                        lambda: [
+                            service.analyze_investment(
+                                "BTC", amount, encode_chart=state == "warm"
+                            )
+                            for amount in amounts
+                        ],
+                        number=1,
+                        repeat=args.repeat,
+                    )
+                )
+                label = f"{data_mode}/{numeric.name} {state}"
+                print(f"  {label:<22} {best * 1e6 / args.requests:8.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark exact (Decimal) vs columnar (NumPy) PriceData.
+
+Usage:
+    python -m benchmarks.bench_price_data [--candles N] [--repeat N]
+"""
+
+import argparse
+import random
+import timeit
+from datetime import datetime
+from decimal import Decimal
+
+from app.domain.constants import HISTORY_START_TIMESTAMP, OHLC_INTERVAL_MINUTES
+from app.domain.models import ColumnarPriceData, PriceData
+
+
+def make_rows(count: int) -> list[tuple[int, str]]:
+    """Generate (timestamp, close) rows shaped like Kraken candles."""
+    interval = OHLC_INTERVAL_MINUTES * 60
+    price = 3600.0
+    rows = []
+    for i in range(count):
+        price *= 1 + random.uniform(-0.05, 0.05)  # nosec B311
+        rows.append((HISTORY_START_TIMESTAMP + i * interval, f"{price:.5f}"))
+    return rows
+
+
+def build_exact(rows: list[tuple[int, str]]) -> PriceData:
+    return PriceData(
+        symbol="BTC",
+        prices=[(datetime.fromtimestamp(t), Decimal(c)) for t, c in rows],
+    )
+
+
+def build_columnar(rows: list[tuple[int, str]]) -> ColumnarPriceData:
+    return ColumnarPriceData(
+        symbol="BTC",
+        timestamps=[t for t, _ in rows],
+        closes=[c for _, c in rows],
+    )
+
+
+def analyse(price_data) -> None:
+    price_data.get_opening_average()
+    price_data.get_current_average()
+    price_data.to_chart_data()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--candles", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = make_rows(args.candles)
+    exact = build_exact(rows)
+    columnar = build_columnar(rows)
+
+    cases = {
+        "build exact": lambda: build_exact(rows),
+        "build columnar": lambda: build_columnar(rows),
+        "analyse exact": lambda: analyse(exact),
+        "analyse columnar": lambda: analyse(columnar),
+    }
+
+    print(f"{args.candles} candles, best of {args.repeat} runs")
+    for name, case in cases.items():
+        best = min(timeit.repeat(case, number=1, repeat=args.repeat))
+        print(f"  {name:<18} {best * 1000:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Benchmark synchronous log_query vs the buffered query log.
+
+Times what a request pays to log one query, against a SQLite file.
+
+Usage:
+    python -m benchmarks.bench_query_log [--queries N] [--repeat N]
+"""
+
+import argparse
+import tempfile
+import timeit
+from decimal import Decimal
+from pathlib import Path
+
+from app.domain.models import Investment
+from app.domain.query_log import BufferedInvestmentRepository
+from app.domain.repositories import SqlAlchemyInvestmentRepository
+from app.shared.database import Database
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    investment = Investment(symbol="BTC", amount=Decimal(1000))
+    with tempfile.TemporaryDirectory() as directory:
+        database = Database(f"sqlite:///{Path(directory) / 'bench.db'}")
+        repository = SqlAlchemyInvestmentRepository(database)
+        buffered = BufferedInvestmentRepository(repository)
+
+        cases = {
+            "synchronous": lambda: [
+                repository.log_query(investment) for _ in range(args.queries)
+            ],
+            "buffered": lambda: [
+                buffered.log_query(investment) for _ in range(args.queries)
+            ],
+        }
+
+        print(f"{args.queries} logged queries, best of {args.repeat}, per query")
+        for name, case in cases.items():
+            best = min(timeit.repeat(case, number=1, repeat=args.repeat))
+            print(f"  {name:<12} {best * 1e6 / args.queries:8.2f} us")
+
+        buffered.shutdown()
+        stats = buffered.stats()
+        print(
+            f"  buffered flushes: {stats['flushes']}, "
+            f"mean {stats['mean_flush_seconds'] * 1000:.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
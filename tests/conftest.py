@@ -2,10 +2,13 @@
 
 import json
 import os
+from datetime import datetime
+from decimal import Decimal
 
 import pytest
 
 from app import create_app
+from app.domain.models import PriceData
 
 
 @pytest.fixture
@@ -45,6 +48,28 @@ def sample_crypto_data():
     }
 
 
+@pytest.fixture
+def make_price_data():
+    """
+    Build daily PriceData starting in January 2023.
+
+    Without closes, the history is ``count`` days rising by 1000 a day.
+    """
+
+    def make(closes=None, symbol="BTC", count=8, first_day=1):
+        if closes is None:
+            closes = [10000 + 1000 * day for day in range(1, count + 1)]
+        return PriceData(
+            symbol=symbol,
+            prices=[
+                (datetime(2023, 1, day), Decimal(close))
+                for day, close in enumerate(closes, start=first_day)
+            ],
+        )
+
+    return make
+
+
 @pytest.fixture
 def sample_graph_data():
     """Sample graph data for testing."""
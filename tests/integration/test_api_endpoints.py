@@ -38,7 +38,9 @@ class TestCryptoEndpoints:
 
         def mock_get_service():
             mock_service = type("MockService", (), {})()
-            mock_service.analyze_investment = lambda symbol, amount: mock_result
+            mock_service.analyze_investment = lambda symbol, amount, **opts: (
+                mock_result
+            )
             return mock_service
 
         monkeypatch.setattr("app.domain.routes.get_crypto_service", mock_get_service)
@@ -50,6 +52,347 @@ class TestCryptoEndpoints:
         assert "message" in data
         assert "graph_data" in data
 
+    def test_process_request_freshness_headers(self, client, monkeypatch):
+        """Test that responses say how fresh the price data is."""
+        mock_service = type("MockService", (), {})()
+        mock_service.analyze_investment = lambda symbol, amount, **opts: {
+            "SYMBOL": "BTC",
+            "graph_data": b"[]",
+        }
+        monkeypatch.setattr(
+            "app.domain.routes.get_crypto_service", lambda: mock_service
+        )
+        monkeypatch.setattr(
+            "app.domain.price_repo.freshness",
+            lambda symbol: {"state": "stale", "age": 420},
+        )
+
+        response = client.get("/api/v1/process_request?symbol=BTC&investment=1000")
+
+        assert response.status_code == 200
+        assert response.headers["X-Data-Freshness"] == "stale"
+        assert response.headers["X-Data-Age"] == "420"
+
+    def test_process_request_dates(self, client, monkeypatch):
+        """Test that buy and sell dates are parsed to epoch seconds."""
+        from datetime import datetime
+
+        calls = []
+        mock_service = type("MockService", (), {})()
+        mock_service.analyze_investment = lambda symbol, amount, **opts: (
+            calls.append(opts) or {"SYMBOL": symbol, "graph_data": b"[]"}
+        )
+        monkeypatch.setattr(
+            "app.domain.routes.get_crypto_service", lambda: mock_service
+        )
+        url = "/api/v1/process_request?symbol=BTC&investment=1000"
+
+        response = client.get(f"{url}&buy_date=2021-01-01&sell_date=1700000000")
+        reversed_range = client.get(f"{url}&buy_date=2022-01-01&sell_date=2021-01-01")
+        garbage = client.get(f"{url}&buy_date=yesterday")
+
+        assert response.status_code == 200
+        assert calls[0]["buy_date"] == datetime(2021, 1, 1).timestamp()
+        assert calls[0]["sell_date"] == 1700000000.0
+        assert reversed_range.status_code == 400
+        assert garbage.status_code == 400
+
+    def test_process_request_date_errors(self, client, monkeypatch):
+        """Test that only an out-of-range date is a 400 on a dated request."""
+        from app.domain.exceptions import (
+            DateOutOfRangeError,
+            InsufficientPriceDataError,
+        )
+
+        errors = [DateOutOfRangeError("no candles"), InsufficientPriceDataError("cut")]
+
+        def analyze_investment(symbol, amount, **opts):
+            raise errors.pop(0)
+
+        mock_service = type("MockService", (), {})()
+        mock_service.analyze_investment = analyze_investment
+        monkeypatch.setattr(
+            "app.domain.routes.get_crypto_service", lambda: mock_service
+        )
+        url = "/api/v1/process_request?symbol=BTC&investment=1000&buy_date=2021-01-01"
+
+        out_of_range = client.get(url)
+        upstream = client.get(url)
+
+        assert out_of_range.status_code == 400
+        assert upstream.status_code == 503
+
+    def test_process_request_splices_encoded_chart(self, client, monkeypatch):
+        """Test that pre-encoded graph_data bytes are sent unchanged."""
+        encoded = b'[{"x": "2023-01-01 00:00:00", "y": 20000.0}]'
+        mock_service = type("MockService", (), {})()
+        mock_service.analyze_investment = lambda symbol, amount, **opts: {
+            "SYMBOL": "BTC",
+            "graph_data": encoded,
+        }
+        monkeypatch.setattr(
+            "app.domain.routes.get_crypto_service", lambda: mock_service
+        )
+
+        response = client.get("/api/v1/process_request?symbol=BTC&investment=1000")
+
+        assert response.status_code == 200
+        assert encoded in response.get_data()
+        assert response.get_json() == {
+            "message": {"SYMBOL": "BTC"},
+            "graph_data": [{"x": "2023-01-01 00:00:00", "y": 20000.0}],
+        }
+
+    def test_entry_scan(self, client, monkeypatch):
+        """Test the entry scan endpoint and its error mapping."""
+        from app.domain.exceptions import SymbolNotFoundError
+
+        mock_service = type("MockService", (), {})()
+        mock_service.scan_entries = lambda symbol, amount, **opts: {
+            "SYMBOL": symbol,
+            "best": {"date": "2023-01-01 00:00:00"},
+        }
+        monkeypatch.setattr(
+            "app.domain.routes.get_crypto_service", lambda: mock_service
+        )
+
+        response = client.get("/api/v1/entry_scan?symbol=BTC&investment=1000")
+        bad_amount = client.get("/api/v1/entry_scan?symbol=BTC&investment=lots")
+
+        def raise_not_found(symbol, amount, **opts):
+            raise SymbolNotFoundError(symbol)
+
+        mock_service.scan_entries = raise_not_found
+        missing = client.get("/api/v1/entry_scan?symbol=NOPE&investment=1000")
+
+        assert response.status_code == 200
+        assert response.get_json()["best"]["date"] == "2023-01-01 00:00:00"
+        assert bad_amount.status_code == 400
+        assert missing.status_code == 404
+
+    def test_analyze_batch(self, client, monkeypatch):
+        """Test that the batch endpoint returns one result per request."""
+        calls = []
+        mock_service = type("MockService", (), {})()
+        mock_service.analyze_many = lambda requests, prefetched: calls.append(
+            (requests, prefetched)
+        ) or [
+            {"SYMBOL": symbol.upper(), "INVESTMENT": amount}
+            for symbol, amount in requests
+        ]
+        monkeypatch.setattr(
+            "app.domain.routes.get_crypto_service", lambda: mock_service
+        )
+        monkeypatch.setattr(
+            "app.domain.async_price_repo.get_many_sync",
+            lambda symbols: {"BTC": "prefetched"},
+        )
+
+        response = client.post(
+            "/api/v1/analyze_batch",
+            json={
+                "requests": [
+                    {"symbol": "BTC", "investment": 1000},
+                    {"symbol": "eth", "investment": 50},
+                ]
+            },
+        )
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["count"] == 2
+        assert [r["SYMBOL"] for r in data["results"]] == ["BTC", "ETH"]
+        assert calls == [([("BTC", 1000), ("eth", 50)], {"BTC": "prefetched"})]
+
+    def test_dca(self, client, monkeypatch):
+        """Test that DCA parameters are validated and parsed."""
+        from datetime import datetime
+
+        calls = []
+        mock_service = type("MockService", (), {})()
+        mock_service.analyze_dca = lambda symbol, amount, frequency, **opts: (
+            calls.append((frequency, opts)) or {"SYMBOL": symbol, "graph_data": []}
+        )
+        monkeypatch.setattr(
+            "app.domain.routes.get_crypto_service", lambda: mock_service
+        )
+        url = "/api/v1/dca?symbol=BTC&investment=100"
+
+        response = client.get(f"{url}&frequency=weekly&start_date=2021-01-01")
+        bad_frequency = client.get(f"{url}&frequency=hourly&start_date=2021-01-01")
+        no_start = client.get(f"{url}&frequency=weekly")
+
+        assert response.status_code == 200
+        assert calls == [("weekly", {"start_date": datetime(2021, 1, 1).timestamp()})]
+        assert bad_frequency.status_code == 400
+        assert no_start.status_code == 400
+
+    def test_analyze_batch_mixes_dca_rows(self, client, monkeypatch):
+        """Test that rows with a frequency are analysed as DCA plans."""
+        mock_service = type("MockService", (), {})()
+        mock_service.analyze_many = lambda requests, prefetched: [
+            {"SYMBOL": symbol, "kind": "lump"} for symbol, _ in requests
+        ]
+        mock_service.analyze_dca_many = lambda plans: [
+            {"SYMBOL": plan[0], "kind": "dca", "start": plan[3]} for plan in plans
+        ]
+        monkeypatch.setattr(
+            "app.domain.routes.get_crypto_service", lambda: mock_service
+        )
+        monkeypatch.setattr(
+            "app.domain.async_price_repo.get_many_sync", lambda symbols: {}
+        )
+
+        response = client.post(
+            "/api/v1/analyze_batch",
+            json={
+                "requests": [
+                    {"symbol": "ETH", "investment": 10, "frequency": "weekly"},
+                    {"symbol": "BTC", "investment": 1000},
+                    {
+                        "symbol": "SOL",
+                        "investment": 10,
+                        "frequency": "monthly",
+                        "start_date": 1600000000,
+                    },
+                ]
+            },
+        )
+
+        results = response.get_json()["results"]
+        assert [r["kind"] for r in results] == ["dca", "lump", "dca"]
+        assert results[0]["start"] is None
+        assert results[2]["start"] == 1600000000.0
+
+    def test_portfolio(self, client, monkeypatch):
+        """Test that holdings are prefetched together and analysed."""
+        calls = []
+        mock_service = type("MockService", (), {})()
+        mock_service.analyze_portfolio = lambda holdings, prefetched, points: (
+            calls.append((holdings, prefetched, points)) or {"holdings": []}
+        )
+        monkeypatch.setattr(
+            "app.domain.routes.get_crypto_service", lambda: mock_service
+        )
+        monkeypatch.setattr(
+            "app.domain.async_price_repo.get_many_sync",
+            lambda symbols: {s: s for s in sorted(symbols)},
+        )
+
+        response = client.post(
+            "/api/v1/portfolio",
+            json={
+                "holdings": [
+                    {"symbol": "btc", "amount": 1000},
+                    {"symbol": "ETH", "investment": 50},
+                ]
+            },
+        )
+        empty = client.post("/api/v1/portfolio", json={"holdings": []})
+        bad_points = client.post(
+            "/api/v1/portfolio",
+            json={"holdings": [{"symbol": "BTC", "amount": 1}], "points": 1},
+        )
+
+        assert response.status_code == 200
+        assert calls == [
+            ([("btc", 1000), ("ETH", 50)], {"BTC": "BTC", "ETH": "ETH"}, None)
+        ]
+        assert empty.status_code == 400
+        assert bad_points.status_code == 400
+
+    def test_leaderboard(self, client, monkeypatch):
+        """Test that the stored leaderboard is served up to the limit."""
+        entries = [
+            {"RANK": rank, "SYMBOL": symbol, "GENERATIONDATE": "2024-01-01"}
+            for rank, symbol in enumerate(["SOL", "BTC", "ETH"], start=1)
+        ]
+        monkeypatch.setattr(
+            "app.domain.leaderboard_repo.get_leaderboard", lambda: entries
+        )
+
+        response = client.get("/api/v1/leaderboard?limit=2")
+        too_many = client.get("/api/v1/leaderboard?limit=1000")
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert [e["SYMBOL"] for e in data["entries"]] == ["SOL", "BTC"]
+        assert data["generated_at"] == "2024-01-01"
+        assert too_many.status_code == 400
+
+    def test_symbols_autocomplete(self, client, monkeypatch):
+        """Test that symbol search is served from the asset pair index."""
+        monkeypatch.setattr(
+            "app.domain.price_repo.asset_pairs.search",
+            lambda prefix, limit: ["BTC", "BTT"][:limit] if prefix == "bt" else [],
+        )
+
+        response = client.get("/api/v1/symbols?prefix=bt&limit=1")
+        too_many = client.get("/api/v1/symbols?limit=1000")
+
+        assert response.status_code == 200
+        assert response.get_json() == {"symbols": ["BTC"], "count": 1}
+        assert too_many.status_code == 400
+
+    def test_chart_range(self, client, monkeypatch):
+        """Test that the chart range and point budget reach the service."""
+        calls = []
+        mock_service = type("MockService", (), {})()
+        mock_service.get_chart = lambda symbol, **options: (
+            calls.append(options)
+            or {"SYMBOL": symbol, "INTERVAL": 43200, "graph_data": []}
+        )
+        monkeypatch.setattr(
+            "app.domain.routes.get_crypto_service", lambda: mock_service
+        )
+
+        response = client.get(
+            "/api/v1/chart?symbol=BTC&start=1600000000&end=1700000000&points=50"
+        )
+        reversed_range = client.get(
+            "/api/v1/chart?symbol=BTC&start=1700000000&end=1600000000"
+        )
+        bad_points = client.get("/api/v1/chart?symbol=BTC&points=1")
+
+        assert response.status_code == 200
+        assert response.get_json()["INTERVAL"] == 43200
+        assert calls == [{"start": 1600000000.0, "end": 1700000000.0, "points": 50}]
+        assert reversed_range.status_code == 400
+        assert bad_points.status_code == 400
+
+    def test_analyze_batch_rejects_bad_body(self, client):
+        """Test that the batch endpoint validates its envelope."""
+        response = client.post("/api/v1/analyze_batch", json={"requests": "BTC"})
+
+        assert response.status_code == 400
+
+    def test_process_request_options(self, client, monkeypatch):
+        """Test that windows and chart points are read from the query string."""
+        calls = []
+        mock_service = type("MockService", (), {})()
+        mock_service.analyze_investment = lambda symbol, amount, **windows: (
+            calls.append(windows) or {"SYMBOL": symbol, "graph_data": b"[]"}
+        )
+        monkeypatch.setattr(
+            "app.domain.routes.get_crypto_service", lambda: mock_service
+        )
+
+        response = client.get(
+            "/api/v1/process_request?symbol=BTC&investment=1000&opening_weeks=2"
+            "&points=200"
+        )
+        invalid = client.get(
+            "/api/v1/process_request?symbol=BTC&investment=1000&current_weeks=0"
+        )
+        too_few_points = client.get(
+            "/api/v1/process_request?symbol=BTC&investment=1000&points=2"
+        )
+
+        assert response.status_code == 200
+        assert calls == [{"encode_chart": True, "opening_weeks": 2, "points": 200}]
+        assert invalid.status_code == 400
+        assert too_few_points.status_code == 400
+
     def test_process_request_missing_params(self, client):
         """Test process_request with missing parameters."""
         response = client.get("/api/v1/process_request")
@@ -67,6 +410,17 @@ class TestCryptoEndpoints:
         data = response.get_json()
         assert "error" in data
 
+    def test_stats_endpoint(self, client):
+        """Test that price cache counters are exposed."""
+        response = client.get("/api/v1/stats")
+
+        assert response.status_code == 200
+        data = response.get_json()
+        for counter in ["hits", "misses", "coalesced", "evictions"]:
+            assert counter in data["price_cache"]
+        assert "hit_rate" in data["analysis_kernels"]
+        assert "hit_rate" in data["chart_payloads"]
+
     def test_restricted_endpoint_unauthorized(self, client):
         """Test restricted endpoint without authentication."""
         response = client.get("/api/v1/restricted")
@@ -33,12 +33,12 @@ class TestGraphQLProcessRequest:
             "GROWTHFACTOR": 0.25,
             "LAMBOS": 0.00125,
             "GENERATIONDATE": datetime.now(timezone.utc).isoformat(),
-            "graph_data": [{"x": "2023-01-01 00:00:00", "y": 20000.0}],
+            "graph_data": b'[{"x": "2023-01-01 00:00:00", "y": 20000.0}]',
         }
 
         def mock_get_service():
             mock_service = type("MockService", (), {})()
-            mock_service.analyze_investment = lambda symbol, amount: mock_result
+            mock_service.analyze_investment = lambda symbol, amount, **opts: mock_result
             return mock_service
 
         monkeypatch.setattr(
@@ -81,6 +81,57 @@ class TestGraphQLProcessRequest:
         assert len(graph_data) == 1
         assert graph_data[0]["y"] == 20000.0
 
+    def test_process_request_points(self, client, monkeypatch):
+        """Test that the points argument reaches the service."""
+        calls = []
+        mock_service = type("MockService", (), {})()
+        mock_service.analyze_investment = lambda symbol, amount, **options: (
+            calls.append(options) or {"SYMBOL": symbol, "graph_data": b"[]"}
+        )
+        monkeypatch.setattr(
+            "app.domain.graphql_schema.get_crypto_service", lambda: mock_service
+        )
+
+        query = """
+        {
+            processRequest(symbol: "BTC", investment: 1000, points: 50) {
+                message
+            }
+        }
+        """
+        response = client.post("/graphql", json={"query": query})
+
+        assert response.status_code == 200
+        assert calls == [{"encode_chart": True, "points": 50}]
+
+    def test_dca(self, client, monkeypatch):
+        """Test that the dca field parses dates and returns the chart."""
+        calls = []
+        mock_service = type("MockService", (), {})()
+        mock_service.analyze_dca = lambda symbol, amount, frequency, **options: (
+            calls.append((frequency, options))
+            or {"SYMBOL": symbol, "graph_data": [{"x": "2023-01-01", "y": 1.0}]}
+        )
+        monkeypatch.setattr(
+            "app.domain.graphql_schema.get_crypto_service", lambda: mock_service
+        )
+
+        query = """
+        {
+            dca(symbol: "BTC", investment: 100, frequency: "weekly",
+                startDate: "1600000000") {
+                message
+                graphData
+            }
+        }
+        """
+        response = client.post("/graphql", json={"query": query})
+
+        data = response.get_json()["data"]["dca"]
+        assert json.loads(data["message"]) == {"SYMBOL": "BTC"}
+        assert json.loads(data["graphData"])[0]["y"] == 1.0
+        assert calls == [("weekly", {"start_date": 1600000000.0})]
+
     def test_process_request_empty_symbol(self, client):
         """Test GraphQL process_request with empty symbol."""
         query = """
@@ -160,7 +211,7 @@ class TestGraphQLProcessRequest:
         def mock_get_service():
             mock_service = type("MockService", (), {})()
 
-            def raise_not_found(symbol, amount):
+            def raise_not_found(symbol, amount, **opts):
                 raise SymbolNotFoundError(f"Symbol {symbol} not found")
 
             mock_service.analyze_investment = raise_not_found
@@ -199,7 +250,7 @@ class TestGraphQLProcessRequest:
         def mock_get_service():
             mock_service = type("MockService", (), {})()
 
-            def raise_invalid(symbol, amount):
+            def raise_invalid(symbol, amount, **opts):
                 raise InvalidInvestmentError("Investment amount is invalid")
 
             mock_service.analyze_investment = raise_invalid
@@ -239,7 +290,7 @@ class TestGraphQLProcessRequest:
         def mock_get_service():
             mock_service = type("MockService", (), {})()
 
-            def raise_insufficient(symbol, amount):
+            def raise_insufficient(symbol, amount, **opts):
                 raise InsufficientPriceDataError("Not enough price data")
 
             mock_service.analyze_investment = raise_insufficient
@@ -279,7 +330,7 @@ class TestGraphQLProcessRequest:
         def mock_get_service():
             mock_service = type("MockService", (), {})()
 
-            def raise_external(symbol, amount):
+            def raise_external(symbol, amount, **opts):
                 raise ExternalServiceError("External API failed")
 
             mock_service.analyze_investment = raise_external
@@ -317,7 +368,7 @@ class TestGraphQLProcessRequest:
         def mock_get_service():
             mock_service = type("MockService", (), {})()
 
-            def raise_unexpected(symbol, amount):
+            def raise_unexpected(symbol, amount, **opts):
                 raise RuntimeError("Unexpected error occurred")
 
             mock_service.analyze_investment = raise_unexpected
@@ -383,12 +434,12 @@ class TestGraphQLProcessRequest:
             "GROWTHFACTOR": 0.25,
             "LAMBOS": 0.00125,
             "GENERATIONDATE": datetime.now(timezone.utc).isoformat(),
-            "graph_data": [],
+            "graph_data": b"[]",
         }
 
         def mock_get_service():
             mock_service = type("MockService", (), {})()
-            mock_service.analyze_investment = lambda symbol, amount: mock_result
+            mock_service.analyze_investment = lambda symbol, amount, **opts: mock_result
             return mock_service
 
         monkeypatch.setattr(
@@ -0,0 +1,138 @@
+"""Unit tests for the asset pair index."""
+
+from unittest.mock import Mock
+
+import pytest
+
+from app.domain.asset_pairs import AssetPairIndex
+from app.domain.exceptions import ExternalServiceError
+
+PAIRS = {
+    "XXBTZUSD": {"base": "XXBT", "wsname": "XBT/USD"},
+    "XETHZUSD": {"base": "XETH", "wsname": "ETH/USD"},
+    "XETHXXBT": {"base": "XETH", "wsname": "ETH/XBT"},
+    "XDGUSD": {"base": "XXDG", "wsname": "XDG/USD"},
+    "SOLUSD": {"base": "SOL", "wsname": "SOL/USD"},
+    "XETHZUSD.d": {"base": "XETH"},
+}
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Create a clock the test can advance."""
+    return FakeClock()
+
+
+@pytest.fixture
+def loader():
+    """Create a loader returning the fixture pairs."""
+    return Mock(return_value=PAIRS)
+
+
+@pytest.fixture
+def index(loader, clock):
+    """Create an index with a one minute lifetime."""
+    return AssetPairIndex(loader, ttl=60, clock=clock)
+
+
+class TestAssetPairIndex:
+    """Test the asset pair index."""
+
+    def test_normalises_symbols_to_pairs(self, index):
+        """Test that wsname, asset code and alias spellings find the pair."""
+        assert index.pair_for("XBT") == "XXBTZUSD"
+        assert index.pair_for("xxbt") == "XXBTZUSD"
+        assert index.pair_for("BTC") == "XXBTZUSD"
+        assert index.pair_for("DOGE") == "XDGUSD"
+        assert index.pair_for("SOL") == "SOLUSD"
+
+    def test_only_usd_pairs_exist(self, index):
+        """Test that non-USD and unknown symbols are misses."""
+        assert index.exists("ETH") is True
+        assert index.exists("FOO") is False
+        assert "ETH/XBT" not in index.symbols()
+
+    def test_symbols_with_and_without_aliases(self, index):
+        """Test that aliases are listed only when asked for."""
+        assert index.symbols() == ["BTC", "DOGE", "ETH", "SOL", "XBT", "XDG"]
+        assert index.symbols(include_aliases=False) == ["ETH", "SOL", "XBT", "XDG"]
+
+    def test_prefix_search(self, index):
+        """Test that search returns sorted prefix matches up to the limit."""
+        assert index.search("x") == ["XBT", "XDG"]
+        assert index.search("X", limit=1) == ["XBT"]
+        assert index.search("") == ["BTC", "DOGE", "ETH", "SOL", "XBT", "XDG"]
+        assert index.search("Z") == []
+
+    def test_lookups_share_one_load(self, index, loader):
+        """Test that lookups within the lifetime do not reload."""
+        index.exists("BTC")
+        index.search("E")
+        index.symbols()
+
+        assert loader.call_count == 1
+
+    def test_reloads_when_stale(self, index, loader, clock):
+        """Test that the pair list is reloaded after the lifetime."""
+        index.exists("BTC")
+        loader.return_value = {"ADAUSD": {"base": "ADA", "wsname": "ADA/USD"}}
+        clock.now = 61
+
+        assert index.exists("ADA") is True
+        assert index.exists("BTC") is False
+        assert loader.call_count == 2
+
+    def test_failed_reload_keeps_old_index(self, index, loader, clock):
+        """Test that a failed reload serves the old index until next lifetime."""
+        index.exists("BTC")
+        loader.side_effect = ExternalServiceError("down")
+        clock.now = 61
+
+        assert index.exists("BTC") is True
+        assert index.exists("ETH") is True
+        assert loader.call_count == 2
+
+    def test_first_load_failure_raises(self, index, loader):
+        """Test that an index which never loaded surfaces the failure."""
+        loader.side_effect = ExternalServiceError("down")
+
+        with pytest.raises(ExternalServiceError):
+            index.exists("BTC")
+        assert index.loaded is False
+
+    def test_failed_first_load_is_retried_later(self, index, loader, clock):
+        """Test that a never-loaded index does not retry on every lookup."""
+        loader.side_effect = ExternalServiceError("down")
+        with pytest.raises(ExternalServiceError):
+            index.exists("BTC")
+        with pytest.raises(ExternalServiceError):
+            index.exists("BTC")
+        assert loader.call_count == 1
+
+        loader.side_effect = None
+        clock.now = index.retry
+
+        assert index.exists("BTC") is True
+        assert loader.call_count == 2
+
+    def test_list_without_usd_pairs_is_a_failure(self, loader):
+        """Test that a malformed pair list does not reject every symbol."""
+        loader.return_value = {"result": [], "last": 0}
+
+        with pytest.raises(ExternalServiceError):
+            AssetPairIndex(loader).exists("BTC")
+
+    def test_unloaded_lookup_without_load(self, index, loader):
+        """Test that load=False answers None without calling Kraken."""
+        assert index.pair_for("BTC", load=False) is None
+        assert loader.call_count == 0
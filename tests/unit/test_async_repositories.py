@@ -0,0 +1,141 @@
+"""Unit tests for the asyncio price repository."""
+
+import asyncio
+import threading
+import time
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+
+from app.domain.async_repositories import AsyncKrakenPriceRepository, run_sync
+from app.domain.exceptions import SymbolNotFoundError
+from app.domain.models import PriceData
+
+
+def _price_data(symbol):
+    return PriceData(symbol=symbol, prices=[(Mock(), Decimal("1"))])
+
+
+class SlowPriceRepository:
+    """Blocking repository that records how many fetches overlap."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def get_price_data(self, symbol):
+        with self._lock:
+            self.calls.append(symbol)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            if symbol == "NOPE":
+                raise SymbolNotFoundError(f"Symbol {symbol} not found on exchange")
+            return _price_data(symbol)
+        finally:
+            with self._lock:
+                self.active -= 1
+
+    def symbol_exists(self, symbol):
+        return symbol != "NOPE"
+
+
+class TestAsyncKrakenPriceRepository:
+    """Test concurrent multi-symbol fetching."""
+
+    def test_get_price_data_delegates(self):
+        """Test that a single fetch returns the blocking repository result."""
+        repo = AsyncKrakenPriceRepository(SlowPriceRepository(delay=0))
+
+        result = asyncio.run(repo.get_price_data("BTC"))
+
+        assert result.symbol == "BTC"
+
+    def test_get_price_data_raises_domain_errors(self):
+        """Test that domain exceptions propagate unchanged."""
+        repo = AsyncKrakenPriceRepository(SlowPriceRepository(delay=0))
+
+        with pytest.raises(SymbolNotFoundError):
+            asyncio.run(repo.get_price_data("NOPE"))
+        assert asyncio.run(repo.symbol_exists("NOPE")) is False
+
+    def test_get_many_runs_concurrently(self):
+        """Test that a batch takes about as long as one fetch."""
+        slow = SlowPriceRepository(delay=0.1)
+        repo = AsyncKrakenPriceRepository(slow, max_concurrency=50)
+        symbols = [f"S{i}" for i in range(50)]
+
+        started = time.perf_counter()
+        results = repo.get_many_sync(symbols)
+        elapsed = time.perf_counter() - started
+
+        assert list(results) == symbols
+        assert elapsed < 1.0
+        assert slow.peak > 1
+
+    def test_get_many_respects_concurrency_bound(self):
+        """Test that no more than max_concurrency fetches overlap."""
+        slow = SlowPriceRepository(delay=0.02)
+        repo = AsyncKrakenPriceRepository(slow, max_concurrency=3)
+
+        repo.get_many_sync([f"S{i}" for i in range(12)])
+
+        assert slow.peak <= 3
+
+    def test_get_many_isolates_failures(self):
+        """Test that one failing symbol does not fail the batch."""
+        repo = AsyncKrakenPriceRepository(SlowPriceRepository(delay=0))
+
+        results = repo.get_many_sync(["BTC", "NOPE", "ETH"])
+
+        assert results["BTC"].symbol == "BTC"
+        assert isinstance(results["NOPE"], SymbolNotFoundError)
+        assert results["ETH"].symbol == "ETH"
+
+    def test_get_many_deduplicates_symbols(self):
+        """Test that repeated symbols are fetched once."""
+        slow = SlowPriceRepository(delay=0)
+        repo = AsyncKrakenPriceRepository(slow)
+
+        results = repo.get_many_sync(["BTC", "BTC", "ETH"])
+
+        assert list(results) == ["BTC", "ETH"]
+        assert sorted(slow.calls) == ["BTC", "ETH"]
+
+    def test_reset_after_fork_drops_executor(self):
+        """Test that a forked child starts a fresh thread pool."""
+        repo = AsyncKrakenPriceRepository(SlowPriceRepository(delay=0))
+        executor = repo.executor
+
+        repo._reset_after_fork()
+
+        assert repo.executor is not executor
+        executor.shutdown()
+
+
+class TestRunSync:
+    """Test the sync facade helper."""
+
+    def test_runs_without_event_loop(self):
+        """Test running a coroutine from plain synchronous code."""
+
+        async def answer():
+            return 42
+
+        assert run_sync(answer()) == 42
+
+    def test_runs_inside_event_loop(self):
+        """Test running a coroutine while another loop is active."""
+
+        async def answer():
+            return 42
+
+        async def outer():
+            return run_sync(answer())
+
+        assert asyncio.run(outer()) == 42
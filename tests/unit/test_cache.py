@@ -0,0 +1,130 @@
+"""Unit tests for in-process caching primitives."""
+
+import threading
+import time
+
+import pytest
+
+from app.shared.cache import TTLCache
+
+
+class FakeClock:
+    """Manually advanced clock for TTL tests."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTTLCache:
+    """Test TTL/LRU cache behaviour."""
+
+    def test_get_and_set(self):
+        """Test basic hits and misses."""
+        cache = TTLCache(maxsize=2, ttl=10)
+
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_entries_expire(self):
+        """Test that entries expire after the TTL."""
+        clock = FakeClock()
+        cache = TTLCache(maxsize=2, ttl=10, clock=clock)
+        cache.set("a", 1)
+
+        clock.now = 10
+        assert cache.get("a") is None
+        assert cache.stats()["expirations"] == 1
+
+    def test_peek_does_not_count_lookups(self):
+        """Test that peeking neither counts a lookup nor returns expired data."""
+        clock = FakeClock()
+        cache = TTLCache(maxsize=2, ttl=10, clock=clock)
+        cache.set("a", 1)
+
+        assert cache.peek("a") == 1
+        assert cache.stats()["hits"] == 0
+        clock.now = 10
+        assert cache.peek("a") is None
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        cache = TTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+
+    def test_get_or_load_caches_result(self):
+        """Test that a loaded value is reused."""
+        cache = TTLCache(maxsize=2, ttl=10)
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return "value"
+
+        assert cache.get_or_load("a", loader) == "value"
+        assert cache.get_or_load("a", loader) == "value"
+        assert len(calls) == 1
+
+    def test_concurrent_misses_are_coalesced(self):
+        """Test that concurrent misses share a single load."""
+        cache = TTLCache(maxsize=2, ttl=10)
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def loader():
+            calls.append(1)
+            started.set()
+            release.wait(timeout=5)
+            return "value"
+
+        results = []
+        leader = threading.Thread(
+            target=lambda: results.append(cache.get_or_load("a", loader))
+        )
+        leader.start()
+        started.wait(timeout=5)
+
+        followers = [
+            threading.Thread(
+                target=lambda: results.append(cache.get_or_load("a", loader))
+            )
+            for _ in range(5)
+        ]
+        for follower in followers:
+            follower.start()
+        while cache.stats()["coalesced"] < 5:
+            time.sleep(0.001)
+        release.set()
+        for thread in [leader, *followers]:
+            thread.join(timeout=5)
+
+        assert len(calls) == 1
+        assert results == ["value"] * 6
+        assert cache.stats()["coalesced"] == 5
+
+    def test_load_errors_are_not_cached(self):
+        """Test that a failed load propagates and is retried next time."""
+        cache = TTLCache(maxsize=2, ttl=10)
+
+        def failing():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            cache.get_or_load("a", failing)
+        assert cache.get_or_load("a", lambda: "ok") == "ok"
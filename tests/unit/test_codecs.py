@@ -0,0 +1,122 @@
+"""Unit tests for price data encodings."""
+
+import json
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+
+from app.domain.codecs import OHLCDecoder, decode_price_data, encode_price_data
+from app.domain.exceptions import InsufficientPriceDataError
+from app.domain.models import ColumnarPriceData, PriceData
+
+
+class TestPriceDataCodec:
+    """Test compact binary price data encoding."""
+
+    def test_round_trip_is_exact(self):
+        """Test that decoding restores the exact Decimal prices."""
+        price_data = PriceData(
+            symbol="BTC",
+            prices=[
+                (datetime.fromtimestamp(1548111600), Decimal("3650.5")),
+                (datetime.fromtimestamp(1549407600), Decimal("0.00012345")),
+                (datetime.fromtimestamp(1550703600), Decimal("42")),
+            ],
+        )
+
+        decoded = decode_price_data(encode_price_data(price_data))
+
+        assert decoded.symbol == "BTC"
+        assert decoded.prices == price_data.prices
+
+    def test_columnar_round_trip(self):
+        """Test that columnar data decodes back to columnar data."""
+        columnar = ColumnarPriceData(
+            symbol="BTC", timestamps=[1548111600, 1549407600], closes=[1.5, 2.25]
+        )
+
+        decoded = decode_price_data(encode_price_data(columnar))
+
+        assert isinstance(decoded, ColumnarPriceData)
+        assert decoded.timestamps.tolist() == [1548111600, 1549407600]
+        assert decoded.closes.tolist() == [1.5, 2.25]
+
+    def test_round_trip_keeps_fetch_time(self):
+        """Test that the fetch time survives encoding, or stays unknown."""
+        columnar = ColumnarPriceData(
+            symbol="BTC", timestamps=[1548111600], closes=[1.5], fetched_at=1700.5
+        )
+        exact = PriceData(
+            symbol="BTC", prices=[(datetime.fromtimestamp(1548111600), Decimal(1))]
+        )
+
+        assert decode_price_data(encode_price_data(columnar)).fetched_at == 1700.5
+        assert decode_price_data(encode_price_data(exact)).fetched_at is None
+
+    def test_encoding_is_compact(self):
+        """Test that each candle costs 16 bytes plus a small header."""
+        prices = [
+            (datetime.fromtimestamp(1548111600 + i * 3600), Decimal("1.5"))
+            for i in range(100)
+        ]
+
+        payload = encode_price_data(PriceData(symbol="BTC", prices=prices))
+
+        assert len(payload) < 100 * 16 + 32
+
+    def test_invalid_payload_raises(self):
+        """Test that garbage payloads are rejected."""
+        with pytest.raises(InsufficientPriceDataError):
+            decode_price_data(b"not a payload")
+
+
+class TestOHLCDecoder:
+    """Test the Kraken OHLC decoder stage."""
+
+    def test_decodes_time_and_close_columns(self):
+        """Test that only timestamp and close columns are extracted."""
+        payload = {
+            "error": [],
+            "result": {
+                "XXBTZUSD": [
+                    [1548111600, "1", "2", "0.5", "3650.50", "1", "10", 5],
+                    [1549407600, "1", "2", "0.5", "3700.1", "1", "12", 6],
+                ],
+                "last": 1549407600,
+            },
+        }
+        decoder = OHLCDecoder()
+
+        frame = decoder.decode(json.dumps(payload).encode())
+
+        assert frame.pair == "XXBTZUSD"
+        assert frame.last == 1549407600
+        assert frame.timestamps.dtype.kind == "i"
+        assert frame.timestamps.tolist() == [1548111600, 1549407600]
+        assert frame.closes.tolist() == [3650.5, 3700.1]
+        assert frame.rows() == [(1548111600, "3650.50"), (1549407600, "3700.1")]
+
+    def test_decodes_errors_without_result(self):
+        """Test that Kraken errors are surfaced with empty columns."""
+        frame = OHLCDecoder().decode(b'{"error": ["EQuery:Unknown asset pair"]}')
+
+        assert frame.pair is None
+        assert frame.errors == ("EQuery:Unknown asset pair",)
+        assert frame.timestamps.size == 0
+
+    def test_invalid_json_raises_value_error(self):
+        """Test that malformed bodies raise ValueError."""
+        with pytest.raises(ValueError):
+            OHLCDecoder().decode(b"<html>bad gateway</html>")
+
+    def test_tracks_decode_metrics(self):
+        """Test that parse and conversion time are tracked."""
+        decoder = OHLCDecoder()
+        decoder.decode(b'{"error": [], "result": {"X": [[1, "1", "1", "1", "2"]]}}')
+
+        stats = decoder.stats()
+        assert stats["payloads"] == 1
+        assert stats["candles"] == 1
+        assert stats["parse_seconds"] >= 0
+        assert stats["convert_seconds"] >= 0
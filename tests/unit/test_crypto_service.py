@@ -1,11 +1,16 @@
 """Unit tests for crypto service."""
 
+import json
+from datetime import datetime
 from decimal import Decimal
 from unittest.mock import Mock, patch
 
+import numpy as np
 import pytest
 
+from app.domain.models import PriceData
 from app.domain.services import CryptoAnalysisService
+from app.shared.cache import TTLCache
 
 
 class TestCryptoService:
@@ -17,9 +22,6 @@ class TestCryptoService:
         mock_price_repo = Mock()
         mock_investment_repo = Mock()
 
-        # Configure mock price repo
-        mock_price_repo.symbol_exists.return_value = True
-
         # Mock price data
         mock_price_data = Mock()
         mock_price_data.get_opening_average.return_value = Decimal("10000")
@@ -42,6 +44,26 @@ class TestCryptoService:
         assert result["INVESTMENT"] == 1000.0
         mock_investment_repo.log_query.assert_called_once()
 
+        # Existence is derived from the price data fetch, not a second probe
+        mock_price_repo.get_price_data.assert_called_once_with("BTC")
+        mock_price_repo.symbol_exists.assert_not_called()
+
+    def test_analyze_investment_custom_windows(self):
+        """Test that averaging windows are passed to the price data."""
+        mock_price_repo = Mock()
+        mock_price_data = mock_price_repo.get_price_data.return_value
+        mock_price_data.get_opening_average.return_value = Decimal("10000")
+        mock_price_data.get_current_average.return_value = Decimal("15000")
+        mock_price_data.to_chart_data.return_value = []
+        service = CryptoAnalysisService(mock_price_repo, Mock())
+
+        service.analyze_investment(
+            "BTC", Decimal(1000), opening_weeks=2, current_weeks=8
+        )
+
+        mock_price_data.get_opening_average.assert_called_once_with(2)
+        mock_price_data.get_current_average.assert_called_once_with(8)
+
     def test_analyze_investment_symbol_not_found(self):
         """Test investment analysis with non-existent symbol."""
         from app.domain.exceptions import SymbolNotFoundError
@@ -50,8 +72,10 @@ class TestCryptoService:
         mock_price_repo = Mock()
         mock_investment_repo = Mock()
 
-        # Configure mock to return False for symbol_exists
-        mock_price_repo.symbol_exists.return_value = False
+        # Configure mock to reject the symbol while loading prices
+        mock_price_repo.get_price_data.side_effect = SymbolNotFoundError(
+            "Symbol INVALID not found on exchange"
+        )
 
         # Create service
         service = CryptoAnalysisService(mock_price_repo, mock_investment_repo)
@@ -60,6 +84,9 @@ class TestCryptoService:
         with pytest.raises(SymbolNotFoundError):
             service.analyze_investment("INVALID", Decimal(1000))
 
+        mock_price_repo.symbol_exists.assert_not_called()
+        mock_investment_repo.log_query.assert_not_called()
+
     def test_analyze_investment_invalid_amount(self):
         """Test investment analysis with invalid amount."""
         from app.domain.exceptions import InvalidInvestmentError
@@ -74,3 +101,418 @@ class TestCryptoService:
         # Test that exception is raised for negative amount
         with pytest.raises(InvalidInvestmentError):
             service.analyze_investment("BTC", Decimal(-1000))
+
+
+class TestAnalysisKernelCache:
+    """Test memoisation of amount-independent analysis."""
+
+    def test_kernel_reused_across_amounts(self, make_price_data):
+        """Test that different amounts share one kernel computation."""
+        price_repo = Mock()
+        price_repo.get_price_data.return_value = make_price_data()
+        cache = TTLCache(maxsize=8, ttl=60)
+        service = CryptoAnalysisService(price_repo, Mock(), cache)
+
+        first = service.analyze_investment("BTC", Decimal(1000))
+        second = service.analyze_investment("BTC", Decimal(5000))
+
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["hits"] == 1
+        assert second["PROFIT"] == pytest.approx(first["PROFIT"] * 5)
+        assert second["graph_data"] is first["graph_data"]
+
+    def test_new_candles_invalidate_kernel(self, make_price_data):
+        """Test that a new candle version rebuilds the kernel."""
+        price_repo = Mock()
+        price_repo.get_price_data.return_value = make_price_data(count=8)
+        cache = TTLCache(maxsize=8, ttl=60)
+        service = CryptoAnalysisService(price_repo, Mock(), cache)
+
+        first = service.analyze_investment("BTC", Decimal(1000))
+        price_repo.get_price_data.return_value = make_price_data(count=9)
+        second = service.analyze_investment("BTC", Decimal(1000))
+
+        assert cache.stats()["misses"] == 2
+        assert second["PROFIT"] != first["PROFIT"]
+
+    def test_windows_are_part_of_key(self, make_price_data):
+        """Test that custom averaging windows do not share a kernel."""
+        price_repo = Mock()
+        price_repo.get_price_data.return_value = make_price_data()
+        cache = TTLCache(maxsize=8, ttl=60)
+        service = CryptoAnalysisService(price_repo, Mock(), cache)
+
+        service.analyze_investment("BTC", Decimal(1000))
+        service.analyze_investment("BTC", Decimal(1000), opening_weeks=2)
+
+        assert cache.stats()["misses"] == 2
+
+    def test_dates_share_cached_history(self, make_price_data):
+        """Test that date ranges reuse the cached history without refetching."""
+        price_repo = Mock()
+        price_repo.get_price_data.return_value = make_price_data()
+        cache = TTLCache(maxsize=8, ttl=60)
+        service = CryptoAnalysisService(price_repo, Mock(), cache)
+        buy, sell = datetime(2023, 1, 2).timestamp(), datetime(2023, 1, 8).timestamp()
+
+        default = service.analyze_investment("BTC", Decimal(1000))
+        dated = service.analyze_investment(
+            "BTC", Decimal(1000), buy_date=buy, sell_date=sell
+        )
+
+        assert dated["PROFIT"] != default["PROFIT"]
+        assert cache.stats()["misses"] == 2
+        price_repo.get_price_data.assert_called_with("BTC")
+
+
+class TestScanEntries:
+    """Test the best/worst entry-date scan."""
+
+    def _service(self, price_data):
+        price_repo = Mock()
+        price_repo.get_price_data.return_value = price_data
+        cache = TTLCache(maxsize=8, ttl=60)
+        return CryptoAnalysisService(price_repo, Mock(), cache), cache
+
+    def test_best_and_worst_entries(self, make_price_data):
+        """Test that the cheapest entry is best and the dearest worst."""
+        service, _ = self._service(make_price_data([100, 50, 400, 200, 200]))
+
+        result = service.scan_entries(
+            "BTC", Decimal(1000), opening_weeks=1, current_weeks=1
+        )
+
+        assert len(result["entries"]) == 5
+        assert result["best"]["date"] == "2023-01-02 00:00:00"
+        assert result["best"]["profit"] == pytest.approx(3000)
+        assert result["worst"]["date"] == "2023-01-03 00:00:00"
+        assert result["worst"]["profit"] == pytest.approx(-500)
+        assert result["percentiles"]["p50"] == pytest.approx(0)
+
+    def test_scan_matches_scalar_profit(self, make_price_data):
+        """Test that every entry matches Investment.calculate_profit."""
+        from app.domain.models import Investment
+
+        closes = [120, 80, 95, 140, 60, 180, 210, 190]
+        service, _ = self._service(make_price_data(closes))
+
+        result = service.scan_entries(
+            "BTC", Decimal(500), opening_weeks=1, current_weeks=1
+        )
+
+        investment = Investment(symbol="BTC", amount=Decimal(500))
+        for entry, close in zip(result["entries"], closes):
+            assert entry["profit"] == pytest.approx(
+                float(investment.calculate_profit(Decimal(close), Decimal(190)))
+            )
+
+    def test_scan_reuses_kernel(self, make_price_data):
+        """Test that repeated scans share the cached kernel."""
+        service, cache = self._service(make_price_data([100, 50, 400, 200, 200]))
+
+        service.scan_entries("BTC", Decimal(1))
+        service.scan_entries("BTC", Decimal(2))
+
+        assert cache.stats()["hits"] == 1
+
+
+class TestAnalyzeDca:
+    """Test dollar-cost-averaging analysis."""
+
+    def _service(self, make_price_data):
+        price_repo = Mock()
+        price_repo.get_price_data.side_effect = lambda symbol: make_price_data(
+            [100, 50, 200, 400, 400, 400], symbol
+        )
+        investment_repo = Mock()
+        return CryptoAnalysisService(price_repo, investment_repo), investment_repo
+
+    def test_daily_plan(self, make_price_data):
+        """Test totals and chart of a daily plan."""
+        service, investment_repo = self._service(make_price_data)
+
+        result = service.analyze_dca(
+            "BTC",
+            Decimal(100),
+            "daily",
+            datetime(2023, 1, 2).timestamp(),
+            datetime(2023, 1, 3).timestamp(),
+            current_weeks=1,
+        )
+
+        assert result["PURCHASES"] == 2
+        assert result["TOTALINVESTED"] == 200
+        assert result["NUMBERCOINS"] == pytest.approx(2.5)
+        assert result["PROFIT"] == pytest.approx(800)
+        assert result["GROWTHFACTOR"] == pytest.approx(4)
+        assert result["graph_data"][0] == {"x": "2023-01-02 00:00:00", "y": 100.0}
+        assert result["graph_data"][-1]["y"] == pytest.approx(1000)
+        investment_repo.log_query.assert_called_once()
+
+    def test_purchases_before_history_are_reported(self, make_price_data):
+        """Test that purchases before the first candle are counted as skipped."""
+        service, _ = self._service(make_price_data)
+
+        result = service.analyze_dca(
+            "BTC",
+            Decimal(100),
+            "daily",
+            datetime(2022, 12, 30).timestamp(),
+            datetime(2023, 1, 2).timestamp(),
+            current_weeks=1,
+        )
+
+        assert result["SKIPPEDPURCHASES"] == 2
+        assert result["PURCHASES"] == 2
+        assert result["TOTALINVESTED"] == 200
+
+    def test_batch_reports_row_errors(self, make_price_data):
+        """Test that bad plans do not fail the rest of the batch."""
+        service, investment_repo = self._service(make_price_data)
+        start = datetime(2023, 1, 1).timestamp()
+        end = datetime(2023, 1, 6).timestamp()
+
+        results = service.analyze_dca_many(
+            [
+                ("btc", 100, "weekly", start, end),
+                ("BTC", 100, "hourly", start, None),
+                ("BTC", "lots", "weekly", start, None),
+                ("BTC", 100, "weekly", None, None),
+            ]
+        )
+
+        assert results[0]["SYMBOL"] == "BTC"
+        assert results[0]["PURCHASES"] == 1
+        assert [("error" in r) for r in results] == [False, True, True, True]
+        logged = investment_repo.log_queries.call_args[0][0]
+        assert logged == [("BTC", 100.0)]
+
+
+class TestAnalyzePortfolio:
+    """Test portfolio analysis."""
+
+    def test_aggregates_prefetched_holdings(self, make_price_data):
+        """Test totals and combined chart from prefetched price data."""
+        from app.domain.exceptions import SymbolNotFoundError
+
+        price_repo = Mock()
+        investment_repo = Mock()
+        service = CryptoAnalysisService(price_repo, investment_repo)
+        prefetched = {
+            "BTC": make_price_data([100] * 4 + [200] * 4),
+            "ETH": make_price_data([10] * 4 + [5] * 4, "ETH", first_day=3),
+            "NOPE": SymbolNotFoundError("NOPE"),
+        }
+
+        result = service.analyze_portfolio(
+            [("btc", 1000), ("ETH", 1000), ("NOPE", 5)], prefetched
+        )
+
+        assert [h.get("error") is None for h in result["holdings"]] == [
+            True,
+            True,
+            False,
+        ]
+        assert result["INVESTMENT"] == 2000
+        assert result["VALUE"] == pytest.approx(2000 + 500)
+        assert result["PROFIT"] == pytest.approx(500)
+        assert result["graph_data"][0] == {"x": "2023-01-01 00:00:00", "y": 2000.0}
+        assert result["graph_data"][-1]["y"] == pytest.approx(2500)
+        price_repo.get_price_data.assert_not_called()
+        logged = investment_repo.log_queries.call_args[0][0]
+        assert logged == [("BTC", 1000.0), ("ETH", 1000.0)]
+
+    def test_loads_missing_symbols(self, make_price_data):
+        """Test that symbols absent from the prefetch are loaded."""
+        price_repo = Mock()
+        price_repo.get_price_data.return_value = make_price_data([1] * 8)
+        service = CryptoAnalysisService(price_repo, Mock())
+
+        result = service.analyze_portfolio([("BTC", 10), ("BTC", 20)])
+
+        assert result["INVESTMENT"] == 30
+        price_repo.get_price_data.assert_called_once_with("BTC")
+
+
+class TestBuildLeaderboard:
+    """Test ranking symbols for the leaderboard."""
+
+    def test_ranks_by_growth(self, make_price_data):
+        """Test that symbols are ranked best first and failures skipped."""
+        from app.domain.exceptions import ExternalServiceError
+
+        service = CryptoAnalysisService(Mock(), Mock())
+
+        entries = service.build_leaderboard(
+            {
+                "BTC": make_price_data([100] * 4 + [300] * 4, "BTC"),
+                "ETH": make_price_data([100] * 4 + [50] * 4, "ETH"),
+                "SOL": make_price_data([1] * 4 + [10] * 4, "SOL"),
+                "BAD": ExternalServiceError("down"),
+                "NEW": PriceData(symbol="NEW", prices=[(datetime(2023, 1, 1), 1)]),
+            },
+            size=2,
+        )
+
+        assert [e["SYMBOL"] for e in entries] == ["SOL", "BTC"]
+        assert entries[0]["GROWTHFACTOR"] == pytest.approx(9)
+        assert entries[0]["LAMBOS"] == pytest.approx(9000 / 200000)
+
+
+class TestGetChart:
+    """Test range charts over the candle pyramid."""
+
+    def test_rollup_level_within_budget(self):
+        """Test that the level's candles are charted as returned."""
+        price_repo = Mock()
+        price_repo.get_chart_candles.return_value = (
+            43200,
+            np.array([0, 2592000, 5184000]),
+            np.array([1.0, 2.0, 3.0]),
+        )
+        service = CryptoAnalysisService(price_repo, Mock())
+
+        result = service.get_chart(" btc ", start=0.0, points=10)
+
+        price_repo.get_chart_candles.assert_called_once_with("BTC", 0.0, None, 10)
+        assert result["INTERVAL"] == 43200
+        assert [point["y"] for point in result["graph_data"]] == [1.0, 2.0, 3.0]
+
+    def test_excess_points_are_downsampled(self):
+        """Test that a level larger than the budget is reduced to it."""
+        price_repo = Mock()
+        price_repo.get_chart_candles.return_value = (
+            525600,
+            np.arange(40) * 31536000,
+            np.arange(40, dtype=np.float64),
+        )
+        service = CryptoAnalysisService(price_repo, Mock())
+
+        result = service.get_chart("BTC", points=10)
+
+        assert len(result["graph_data"]) == 10
+
+
+class TestChartPayloadCache:
+    """Test caching of encoded graph_data."""
+
+    def _service(self, price_data, cache):
+        price_repo = Mock()
+        price_repo.get_price_data.return_value = price_data
+        return CryptoAnalysisService(price_repo, Mock(), chart_cache=cache), price_repo
+
+    def test_encoded_chart_matches_chart_data(self, make_price_data):
+        """Test that encoded bytes decode to the plain chart data."""
+        price_data = make_price_data()
+        service, _ = self._service(price_data, TTLCache(maxsize=8, ttl=60))
+
+        result = service.analyze_investment(
+            "BTC", Decimal(1000), points=4, encode_chart=True
+        )
+
+        assert json.loads(result["graph_data"]) == price_data.to_chart_data(4)
+
+    def test_payload_shared_across_requests(self, make_price_data):
+        """Test that the same chart is encoded once for every amount."""
+        cache = TTLCache(maxsize=8, ttl=60)
+        service, _ = self._service(make_price_data(), cache)
+
+        first = service.analyze_investment("BTC", Decimal(1), encode_chart=True)
+        second = service.analyze_investment("BTC", Decimal(2), encode_chart=True)
+
+        assert second["graph_data"] is first["graph_data"]
+        assert cache.stats()["hits"] == 1
+
+    def test_resolution_and_version_are_part_of_key(self, make_price_data):
+        """Test that other resolutions and new candles get their own payload."""
+        cache = TTLCache(maxsize=8, ttl=60)
+        service, price_repo = self._service(make_price_data(count=8), cache)
+
+        service.analyze_investment("BTC", Decimal(1), encode_chart=True)
+        service.analyze_investment("BTC", Decimal(1), points=3, encode_chart=True)
+        price_repo.get_price_data.return_value = make_price_data(count=9)
+        service.analyze_investment("BTC", Decimal(1), encode_chart=True)
+
+        assert cache.stats()["misses"] == 3
+
+
+class TestAnalyzeMany:
+    """Test vectorised batch analysis."""
+
+    @pytest.fixture
+    def price_repo(self):
+        """Create a price repository that knows BTC only."""
+        from app.domain.exceptions import SymbolNotFoundError
+
+        price_data = Mock()
+        price_data.get_opening_average.return_value = Decimal("10000")
+        price_data.get_current_average.return_value = Decimal("15000")
+
+        def get_price_data(symbol):
+            if symbol != "BTC":
+                raise SymbolNotFoundError(f"Symbol {symbol} not found on exchange")
+            return price_data
+
+        repo = Mock()
+        repo.get_price_data.side_effect = get_price_data
+        return repo
+
+    def test_matches_single_analysis(self, price_repo):
+        """Test that batch metrics match analyze_investment."""
+        service = CryptoAnalysisService(price_repo, Mock())
+        price_repo.get_price_data("BTC").to_chart_data.return_value = []
+
+        single = service.analyze_investment("BTC", Decimal(1000))
+        [batch] = service.analyze_many([("btc", 1000)])
+
+        for key in ["SYMBOL", "INVESTMENT", "NUMBERCOINS", "PROFIT", "LAMBOS"]:
+            assert batch[key] == pytest.approx(single[key])
+        assert "graph_data" not in batch
+
+    def test_loads_each_symbol_once(self, price_repo):
+        """Test that rows are grouped so price data is loaded per symbol."""
+        investment_repo = Mock()
+        service = CryptoAnalysisService(price_repo, investment_repo)
+
+        results = service.analyze_many([("BTC", amount) for amount in range(1, 1001)])
+
+        assert price_repo.get_price_data.call_count == 1
+        assert [r["INVESTMENT"] for r in results] == list(range(1, 1001))
+        assert results[-1]["PROFIT"] == pytest.approx(500.0)
+        logged, _ = investment_repo.log_queries.call_args.args
+        assert len(logged) == 1000
+
+    def test_row_errors_do_not_fail_batch(self, price_repo):
+        """Test that invalid rows and unknown symbols are reported per row."""
+        service = CryptoAnalysisService(price_repo, Mock())
+
+        results = service.analyze_many(
+            [("BTC", 100), ("FOO", 100), ("BTC", -5), ("BTC", "abc"), ("", 10)]
+        )
+
+        assert "error" not in results[0]
+        assert results[1]["error"] == "Symbol FOO not found on exchange"
+        assert results[2]["error"] == "Investment amount must be positive"
+        assert results[3]["error"] == "Invalid investment amount"
+        assert results[4]["error"] == "Invalid symbol: "
+
+    def test_uses_prefetched_price_data(self, price_repo):
+        """Test that prefetched data and failures are not loaded again."""
+        from app.domain.exceptions import ExternalServiceError
+
+        service = CryptoAnalysisService(price_repo, Mock())
+        prefetched = {
+            "BTC": price_repo.get_price_data("BTC"),
+            "ETH": ExternalServiceError("Kraken unavailable"),
+            "SOL": TimeoutError(),
+        }
+        price_repo.get_price_data.reset_mock()
+
+        results = service.analyze_many(
+            [("BTC", 100), ("ETH", 100), ("SOL", 100)], prefetched
+        )
+
+        assert "error" not in results[0]
+        assert results[1]["error"] == "Kraken unavailable"
+        assert results[2]["error"] == "Price data unavailable for SOL"
+        price_repo.get_price_data.assert_not_called()
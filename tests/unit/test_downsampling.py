@@ -0,0 +1,51 @@
+"""Unit tests for chart downsampling."""
+
+import numpy as np
+
+from app.domain.downsampling import downsample_chart, lttb_indices
+
+
+class TestLTTB:
+    """Test Largest-Triangle-Three-Buckets selection."""
+
+    def test_returns_requested_point_count(self):
+        """Test that exactly the requested number of sorted points is kept."""
+        x = np.arange(1000)
+        y = np.sin(x / 50)
+
+        indices = lttb_indices(x, y, 100)
+
+        assert indices.size == 100
+        assert indices[0] == 0
+        assert indices[-1] == 999
+        assert (np.diff(indices) > 0).all()
+
+    def test_preserves_extremes(self):
+        """Test that isolated spikes survive downsampling."""
+        y = np.zeros(1000)
+        y[123], y[777] = 50.0, -40.0
+
+        indices = lttb_indices(np.arange(1000), y, 20)
+
+        assert 123 in indices
+        assert 777 in indices
+
+    def test_short_series_is_unchanged(self):
+        """Test that series at or below the target keep every point."""
+        assert lttb_indices(np.arange(5), np.arange(5), 10).tolist() == [0, 1, 2, 3, 4]
+        assert lttb_indices(np.arange(5), np.arange(5), 2).tolist() == [0, 1, 2, 3, 4]
+
+
+class TestDownsampleChart:
+    """Test downsampling of built chart data."""
+
+    def test_keeps_chart_dictionaries(self):
+        """Test that chart points are selected, not rebuilt."""
+        chart = [{"x": str(i), "y": float(i % 7)} for i in range(100)]
+
+        result = downsample_chart(chart, 10)
+
+        assert len(result) == 10
+        assert result[0] is chart[0]
+        assert result[-1] is chart[-1]
+        assert downsample_chart(chart, 500) is chart
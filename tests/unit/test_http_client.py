@@ -0,0 +1,76 @@
+"""Unit tests for the pooled HTTP client."""
+
+from unittest.mock import patch
+
+from app.shared.http_client import RETRY_STATUS_CODES, HttpClient, JitteredRetry
+
+
+class TestHttpClient:
+    """Test pooled HTTP client configuration."""
+
+    def test_session_is_shared_and_pooled(self):
+        """Test that one pooled session is reused across calls."""
+        client = HttpClient(pool_size=7, max_retries=2)
+
+        session = client.session
+        adapter = session.get_adapter("https://api.kraken.com")
+
+        assert client.session is session
+        assert adapter._pool_maxsize == 7
+        assert adapter.max_retries.total == 2
+        assert set(adapter.max_retries.status_forcelist) == set(RETRY_STATUS_CODES)
+        assert "gzip" in session.headers["Accept-Encoding"]
+
+    def test_get_applies_timeouts(self):
+        """Test that every request carries connect and read timeouts."""
+        client = HttpClient(connect_timeout=1.5, read_timeout=4)
+
+        with patch.object(client.session, "get") as mock_get:
+            client.get("https://api.kraken.com/0/public/OHLC", params={"a": 1})
+
+        mock_get.assert_called_once_with(
+            "https://api.kraken.com/0/public/OHLC",
+            params={"a": 1},
+            timeout=(1.5, 4),
+        )
+
+    def test_close_discards_session(self):
+        """Test that closing the client opens a fresh session next time."""
+        client = HttpClient()
+        session = client.session
+
+        client.close()
+
+        assert client.session is not session
+
+    def test_reset_after_fork_drops_session(self):
+        """Test that a forked child never reuses the parent's sockets."""
+        client = HttpClient()
+        session = client.session
+
+        client._reset_after_fork()
+
+        assert client.session is not session
+
+
+class TestJitteredRetry:
+    """Test retry backoff jitter."""
+
+    def test_backoff_includes_bounded_jitter(self):
+        """Test that jitter is added on top of exponential backoff."""
+        retry = JitteredRetry(total=5, backoff_factor=1, jitter=0.5)
+        retry = retry.increment(method="GET", url="/")
+        retry = retry.increment(method="GET", url="/")
+        base = JitteredRetry(total=5, backoff_factor=1, jitter=0)
+        base = base.increment(method="GET", url="/").increment(method="GET", url="/")
+
+        expected = base.get_backoff_time()
+        for _ in range(20):
+            backoff = retry.get_backoff_time()
+            assert expected <= backoff <= expected + 0.5
+
+    def test_jitter_survives_increment(self):
+        """Test that the jitter setting is copied to new retry states."""
+        retry = JitteredRetry(total=3, jitter=0.25)
+
+        assert retry.increment(method="GET", url="/").jitter == 0.25
@@ -3,10 +3,25 @@
 from datetime import datetime
 from decimal import Decimal
 
+import numpy as np
 import pytest
 
-from app.domain.exceptions import InsufficientPriceDataError, InvalidInvestmentError
-from app.domain.models import Investment, PriceData
+from app.domain.exceptions import (
+    DateOutOfRangeError,
+    InsufficientPriceDataError,
+    InvalidInvestmentError,
+)
+from app.domain.models import (
+    AnalysisKernel,
+    ColumnarPriceData,
+    Investment,
+    PriceData,
+    calculate_dca_metrics,
+    calculate_investment_metrics,
+    calculate_portfolio_values,
+    dca_purchases_before,
+    dca_schedule,
+)
 
 
 class TestInvestment:
@@ -82,6 +97,200 @@ class TestInvestment:
         assert lambos == Decimal("0.0025")
 
 
+class TestInvestmentMetrics:
+    """Test vectorised investment calculations."""
+
+    def test_matches_investment_methods(self):
+        """Test that each row matches the scalar Investment formulas."""
+        amounts = [100, 1000, 12345.67]
+
+        metrics = calculate_investment_metrics(amounts, 20000.0, 30000.0)
+
+        for i, amount in enumerate(amounts):
+            investment = Investment(symbol="BTC", amount=Decimal(str(amount)))
+            opening, current = Decimal(20000), Decimal(30000)
+            assert metrics["coins"][i] == pytest.approx(
+                float(investment.calculate_coins_purchased(opening))
+            )
+            assert metrics["profit"][i] == pytest.approx(
+                float(investment.calculate_profit(opening, current))
+            )
+            assert metrics["growth"][i] == pytest.approx(0.5)
+            assert metrics["lambos"][i] == pytest.approx(
+                float(investment.calculate_lambos(opening, current))
+            )
+
+    def test_invalid_opening_price(self):
+        """Test that a non-positive opening price is rejected."""
+        with pytest.raises(InvalidInvestmentError):
+            calculate_investment_metrics([100], 0.0, 1.0)
+
+
+class TestAnalysisKernel:
+    """Test the amount-independent analysis kernel."""
+
+    def test_evaluate_matches_investment_methods(self, make_price_data):
+        """Test that kernel metrics match the scalar Investment formulas."""
+        price_data = make_price_data()
+        kernel = AnalysisKernel.build(price_data)
+        opening = price_data.get_opening_average()
+        current = price_data.get_current_average()
+
+        for amount in (Decimal(100), Decimal("12345.67")):
+            investment = Investment(symbol="BTC", amount=amount)
+            metrics = kernel.evaluate(amount)
+            assert metrics["coins"] == investment.calculate_coins_purchased(opening)
+            assert float(metrics["profit"]) == pytest.approx(
+                float(investment.calculate_profit(opening, current))
+            )
+            assert float(metrics["growth"]) == pytest.approx(
+                float(investment.calculate_growth_factor(opening, current))
+            )
+            assert float(metrics["lambos"]) == pytest.approx(
+                float(investment.calculate_lambos(opening, current))
+            )
+
+    def test_chart_is_built_once_per_resolution(self, make_price_data):
+        """Test that repeated chart requests reuse the same list."""
+        kernel = AnalysisKernel.build(make_price_data())
+
+        assert kernel.chart() is kernel.chart()
+        assert len(kernel.chart(3)) == 3
+        assert kernel.chart(3) is kernel.chart(3)
+
+    def test_dates_move_windows(self, make_price_data):
+        """Test that buy and sell dates replace the default windows."""
+        price_data = make_price_data()
+
+        kernel = AnalysisKernel.build(
+            price_data,
+            buy_date=datetime(2023, 1, 3).timestamp(),
+            sell_date=datetime(2023, 1, 7).timestamp(),
+        )
+
+        assert kernel.opening_average == price_data.window_average(2, 6)
+        assert kernel.current_average == price_data.window_average(2, 6)
+        assert kernel.growth_factor == 0
+
+    def test_date_outside_history_is_out_of_range(self, make_price_data):
+        """Test that only a date-placed window reports DateOutOfRangeError."""
+        price_data = make_price_data()
+
+        with pytest.raises(DateOutOfRangeError):
+            AnalysisKernel.build(price_data, buy_date=datetime(2024, 1, 1).timestamp())
+        with pytest.raises(DateOutOfRangeError):
+            ColumnarPriceData.from_price_data(price_data).average_before(
+                datetime(2022, 1, 1).timestamp()
+            )
+        with pytest.raises(InsufficientPriceDataError) as excinfo:
+            AnalysisKernel.build(price_data, opening_weeks=9)
+        assert not isinstance(excinfo.value, DateOutOfRangeError)
+
+    def test_entry_growth_per_candle(self, make_price_data):
+        """Test that each entry buys at the window starting at its candle."""
+        price_data = make_price_data()
+        kernel = AnalysisKernel.build(price_data, opening_weeks=2)
+
+        labels, opening, growth = kernel.entry_growth()
+
+        assert labels == [point["x"] for point in price_data.to_chart_data()[:7]]
+        assert opening[0] == float(price_data.window_average(0, 2))
+        assert growth[0] == pytest.approx(float(kernel.growth_factor))
+        assert growth[-1] < growth[0]
+        assert kernel.entry_growth() is kernel.entry_growth()
+
+    def test_version_changes_with_new_candle(self, make_price_data):
+        """Test that appending a candle yields a new version."""
+        assert make_price_data(count=8).version != make_price_data(count=9).version
+        assert make_price_data(count=8).version == make_price_data(count=8).version
+
+
+class TestDcaMetrics:
+    """Test the vectorised dollar-cost-averaging engine."""
+
+    def test_schedules(self):
+        """Test daily, weekly and month-end-clamped monthly schedules."""
+        start = datetime(2023, 1, 31).timestamp()
+        end = datetime(2023, 5, 31).timestamp()
+
+        weekly = dca_schedule(start, end, "weekly")
+        monthly = dca_schedule(start, end, "monthly")
+
+        assert dca_schedule(start, end, "daily").size == 121
+        assert weekly.size == 18
+        assert (weekly[1:] - weekly[:-1] == 7 * 86400).all()
+        assert [datetime.fromtimestamp(t).day for t in monthly.tolist()] == [
+            31,
+            28,
+            31,
+            30,
+            31,
+        ]
+        with pytest.raises(InvalidInvestmentError):
+            dca_schedule(start, end, "hourly")
+
+    @pytest.mark.parametrize("frequency", ["daily", "weekly", "monthly"])
+    def test_since_skips_early_purchases(self, frequency):
+        """Test that skipped purchases are counted, not built."""
+        start = datetime(2022, 1, 31).timestamp()
+        end = datetime(2023, 5, 31).timestamp()
+        since = datetime(2023, 2, 15).timestamp()
+        full = dca_schedule(start, end, frequency)
+
+        clamped = dca_schedule(start, end, frequency, since=since)
+        skipped = dca_purchases_before(start, since, frequency)
+
+        assert clamped.tolist() == full[full >= since].tolist()
+        assert skipped == (full < since).sum()
+
+    def test_since_bounds_ancient_start(self):
+        """Test that a start far before the history builds no extra purchases."""
+        since = datetime(2023, 1, 1).timestamp()
+        end = datetime(2023, 1, 10).timestamp()
+
+        start = since - 10**8 * 86400
+
+        schedule = dca_schedule(start, end, "daily", since=since)
+
+        assert schedule.size == 10
+        assert dca_purchases_before(start, since, "daily") == 10**8
+
+    def test_matches_purchase_loop(self):
+        """Test that totals match buying at each purchase's candle."""
+        timestamps = [0, 100, 200, 300]
+        closes = [10.0, 20.0, 40.0, 50.0]
+        purchases = [50, 150, 160, 390]
+
+        metrics = calculate_dca_metrics(timestamps, closes, 100.0, purchases)
+
+        assert metrics["purchases"].tolist() == [1, 3, 3, 4]
+        assert metrics["invested"][-1] == 400
+        assert metrics["coins"][-1] == pytest.approx(10 + 5 + 5 + 2)
+
+    def test_ignores_purchases_before_history(self):
+        """Test that purchases before the first candle are skipped."""
+        metrics = calculate_dca_metrics([100, 200], [10.0, 20.0], 10.0, [0, 150])
+
+        assert metrics["purchases"].tolist() == [1, 1]
+        with pytest.raises(InsufficientPriceDataError):
+            calculate_dca_metrics([100, 200], [10.0, 20.0], 10.0, [0, 50])
+
+
+class TestPortfolioValues:
+    """Test aligned portfolio value series."""
+
+    def test_aligns_and_forward_fills(self):
+        """Test that holdings are summed on the union of candle times."""
+        btc = (np.array([0, 100, 200]), np.array([10.0, 20.0, 30.0]), 2.0, 20.0)
+        eth = (np.array([100, 150]), np.array([5.0, 7.0]), 4.0, 20.0)
+
+        grid, values = calculate_portfolio_values([btc, eth])
+
+        assert grid.tolist() == [0, 100, 150, 200]
+        # ETH counts as its uninvested amount before its first candle
+        assert values.tolist() == [40.0, 60.0, 68.0, 88.0]
+
+
 class TestPriceData:
     """Test PriceData domain model."""
 
@@ -120,6 +329,17 @@ class TestPriceData:
         # Average of first 4: (10000 + 12000 + 14000 + 16000) / 4 = 13000
         assert opening_avg == Decimal(13000)
 
+    def test_precomputed_opening_average_is_used(self):
+        """Test that an attached opening average is served as-is."""
+        prices = [(datetime(2023, 1, day), Decimal(10000)) for day in range(1, 6)]
+
+        price_data = PriceData(
+            symbol="BTC", prices=prices, opening_average=Decimal("9000")
+        )
+
+        assert price_data.get_opening_average() == Decimal("9000")
+        assert price_data.get_opening_average(weeks=2) == Decimal(10000)
+
     def test_get_current_average(self):
         """Test getting current average."""
         prices = [
@@ -136,6 +356,82 @@ class TestPriceData:
         # Average of last 4: (12000 + 14000 + 16000 + 18000) / 4 = 15000
         assert current_avg == Decimal(15000)
 
+    def test_window_average_by_position(self):
+        """Test averages over arbitrary [start, end) windows."""
+        prices = [(datetime(2023, 1, day), Decimal(day * 1000)) for day in range(1, 11)]
+        price_data = PriceData(symbol="BTC", prices=prices)
+
+        assert price_data.window_average(0, 10) == Decimal(5500)
+        assert price_data.window_average(2, 5) == Decimal(4000)
+        assert price_data.get_current_average(3) == Decimal(9000)
+
+    def test_window_average_rejects_empty_window(self):
+        """Test that empty or out-of-range windows raise error."""
+        price_data = PriceData(symbol="BTC", prices=[(datetime(2023, 1, 1), 1)])
+
+        with pytest.raises(InsufficientPriceDataError):
+            price_data.window_average(1, 1)
+        with pytest.raises(InsufficientPriceDataError):
+            price_data.window_average(0, 2)
+
+    def test_average_between_dates(self):
+        """Test that date ranges are located by binary search."""
+        prices = [(datetime(2023, 1, day), Decimal(day * 1000)) for day in range(1, 11)]
+        price_data = PriceData(symbol="BTC", prices=prices)
+
+        assert price_data.index_of(datetime(2023, 1, 3)) == 2
+        assert price_data.index_of(datetime(2023, 1, 3, 12)) == 3
+        assert price_data.index_of(datetime(2024, 1, 1)) == 10
+        assert price_data.average_between(
+            datetime(2023, 1, 3), datetime(2023, 1, 6)
+        ) == Decimal(4000)
+        with pytest.raises(InsufficientPriceDataError):
+            price_data.average_between(datetime(2024, 1, 1), datetime(2024, 2, 1))
+
+    def test_averages_around_dates(self):
+        """Test buy and sell windows anchored at dates."""
+        prices = [(datetime(2023, 1, day), Decimal(day * 1000)) for day in range(1, 11)]
+        price_data = PriceData(symbol="BTC", prices=prices)
+        columnar = ColumnarPriceData.from_price_data(price_data)
+
+        assert price_data.average_from(datetime(2023, 1, 3), 2) == Decimal(3500)
+        assert price_data.average_before(datetime(2023, 1, 6), 2) == Decimal(4500)
+        assert columnar.average_from(datetime(2023, 1, 3), 2) == Decimal(3500)
+        assert columnar.average_before(datetime(2023, 1, 6), 2) == Decimal(4500)
+        with pytest.raises(InsufficientPriceDataError):
+            price_data.average_from(datetime(2023, 1, 9), 4)
+        with pytest.raises(InsufficientPriceDataError):
+            columnar.average_before(datetime(2023, 1, 2), 4)
+
+    def test_rolling_averages_match_windows(self):
+        """Test that every rolling window matches window_average."""
+        prices = [(datetime(2023, 1, day), Decimal(day * 1000)) for day in range(1, 11)]
+        price_data = PriceData(symbol="BTC", prices=prices)
+        columnar = ColumnarPriceData.from_price_data(price_data)
+
+        rolling = price_data.rolling_averages(4)
+
+        assert rolling.size == 7
+        for start, value in enumerate(rolling.tolist()):
+            assert value == float(price_data.window_average(start, start + 4))
+        assert columnar.rolling_averages(4).tolist() == rolling.tolist()
+        with pytest.raises(InsufficientPriceDataError):
+            price_data.rolling_averages(11)
+
+    def test_to_chart_data_downsampled(self):
+        """Test that chart data can be downsampled to a point budget."""
+        prices = [(datetime(2023, 1, day), Decimal(day % 3)) for day in range(1, 31)]
+        price_data = PriceData(symbol="BTC", prices=prices)
+        columnar = ColumnarPriceData.from_price_data(price_data)
+
+        chart = price_data.to_chart_data(points=10)
+
+        assert len(chart) == 10
+        assert chart[0]["x"] == "2023-01-01 00:00:00"
+        assert chart[-1]["x"] == "2023-01-30 00:00:00"
+        assert columnar.to_chart_data(points=10) == chart
+        assert len(price_data.to_chart_data(points=100)) == 30
+
     def test_insufficient_data_for_opening_average(self):
         """Test that insufficient data raises error."""
         prices = [
@@ -163,3 +459,55 @@ class TestPriceData:
         assert chart_data[0]["y"] == 10000.0
         assert chart_data[1]["x"] == "2023-01-02 12:00:00"
         assert chart_data[1]["y"] == 11000.0
+
+
+class TestColumnarPriceData:
+    """Test NumPy-backed PriceData."""
+
+    def _prices(self):
+        return [
+            (datetime(2023, 1, 1, 12, 0, 0), Decimal(10000)),
+            (datetime(2023, 1, 2, 12, 0, 0), Decimal(12000)),
+            (datetime(2023, 1, 3, 12, 0, 0), Decimal(14000)),
+            (datetime(2023, 1, 4, 12, 0, 0), Decimal(16000)),
+            (datetime(2023, 1, 5, 12, 0, 0), Decimal("18000.5")),
+        ]
+
+    def test_matches_exact_mode(self):
+        """Test that averages and chart data match the exact mode."""
+        exact = PriceData(symbol="BTC", prices=self._prices())
+        columnar = ColumnarPriceData.from_price_data(exact)
+
+        assert columnar.get_opening_average(4) == exact.get_opening_average(4)
+        assert columnar.get_current_average(4) == exact.get_current_average(4)
+        assert columnar.to_chart_data() == exact.to_chart_data()
+
+    def test_windows_match_exact_mode(self):
+        """Test that window lookups match the exact mode."""
+        exact = PriceData(symbol="BTC", prices=self._prices())
+        columnar = ColumnarPriceData.from_price_data(exact)
+        start, end = datetime(2023, 1, 2), datetime(2023, 1, 4, 12)
+
+        assert columnar.window_average(1, 4) == exact.window_average(1, 4)
+        assert columnar.index_of(start) == exact.index_of(start)
+        assert columnar.average_between(start, end) == exact.average_between(start, end)
+
+    def test_round_trip_to_exact(self):
+        """Test converting back to exact PriceData."""
+        exact = PriceData(symbol="BTC", prices=self._prices())
+
+        assert ColumnarPriceData.from_price_data(exact).to_price_data() == exact
+
+    def test_empty_raises_error(self):
+        """Test that empty columns raise error."""
+        with pytest.raises(InsufficientPriceDataError):
+            ColumnarPriceData(symbol="BTC", timestamps=[], closes=[])
+
+    def test_insufficient_data_for_average(self):
+        """Test that short columns raise error."""
+        columnar = ColumnarPriceData(
+            symbol="BTC", timestamps=[1, 2], closes=[10000.0, 12000.0]
+        )
+
+        with pytest.raises(InsufficientPriceDataError):
+            columnar.get_current_average(weeks=4)
@@ -0,0 +1,109 @@
+"""Unit tests for the exact and fast numeric backends."""
+
+import random
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+
+from app.domain.constants import FAST_MATH_RTOL
+from app.domain.models import AnalysisKernel, ColumnarPriceData, PriceData
+from app.domain.numeric import EXACT, FAST, get_numeric_backend
+from app.domain.services import CryptoAnalysisService
+from app.shared.cache import TTLCache
+
+METRICS = ("NUMBERCOINS", "PROFIT", "GROWTHFACTOR", "LAMBOS")
+
+
+def _random_price_data(rng: random.Random, symbol: str) -> PriceData:
+    """Build a history whose prices span micro-caps to BTC."""
+    scale = 10 ** rng.randint(-8, 5)
+    start = datetime(2019, 1, 21)
+    prices = [
+        (
+            start + timedelta(days=15 * i),
+            Decimal(str(round(rng.uniform(0.01, 10) * scale, 10))),
+        )
+        for i in range(rng.randint(8, 200))
+    ]
+    return PriceData(symbol, prices)
+
+
+def _close(fast: float, exact: float) -> bool:
+    return fast == pytest.approx(exact, rel=FAST_MATH_RTOL, abs=1e-12)
+
+
+class TestNumericBackends:
+    """Test that the fast backend stays within tolerance of the exact one."""
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_fast_matches_exact(self, seed):
+        """Test every reported metric over random histories and amounts."""
+        rng = random.Random(seed)
+        price_data = _random_price_data(rng, f"S{seed}")
+        price_repo = Mock()
+        price_repo.get_price_data.return_value = price_data
+        exact = CryptoAnalysisService(price_repo, Mock(), numeric=EXACT)
+        fast = CryptoAnalysisService(price_repo, Mock(), numeric=FAST)
+
+        for _ in range(25):
+            amount = Decimal(str(round(rng.uniform(0.01, 1e9), 2)))
+            expected = exact.analyze_investment(price_data.symbol, amount)
+            actual = fast.analyze_investment(price_data.symbol, amount)
+
+            for metric in METRICS:
+                assert _close(actual[metric], expected[metric]), metric
+
+    def test_fast_matches_exact_on_columnar_data(self):
+        """Test the fast backend over columnar price data."""
+        price_data = _random_price_data(random.Random(7), "COL")
+        columnar = ColumnarPriceData.from_price_data(price_data)
+        amount = Decimal("1234.56")
+
+        expected = AnalysisKernel.build(price_data).evaluate(amount)
+        actual = AnalysisKernel.build(columnar, numeric=FAST).evaluate(amount)
+
+        for name, value in expected.items():
+            assert _close(actual[name], float(value)), name
+
+    def test_fast_kernel_uses_floats(self):
+        """Test that the fast kernel never does Decimal arithmetic."""
+        price_data = _random_price_data(random.Random(1), "FLT")
+
+        kernel = AnalysisKernel.build(price_data, numeric=FAST)
+        metrics = kernel.evaluate(Decimal(1000))
+
+        assert type(kernel.growth_factor) is float
+        assert all(type(value) is float for value in metrics.values())
+
+    def test_exact_kernel_uses_decimals(self):
+        """Test that the exact kernel keeps Decimal results."""
+        price_data = _random_price_data(random.Random(1), "DEC")
+
+        metrics = AnalysisKernel.build(price_data).evaluate(Decimal(1000))
+
+        assert all(isinstance(value, Decimal) for value in metrics.values())
+
+    def test_kernels_are_cached_per_backend(self):
+        """Test that services in different modes never share a kernel."""
+        price_data = _random_price_data(random.Random(2), "MIX")
+        price_repo = Mock()
+        price_repo.get_price_data.return_value = price_data
+        kernels = TTLCache(maxsize=8, ttl=60)
+
+        CryptoAnalysisService(price_repo, Mock(), kernels).analyze_investment(
+            "MIX", Decimal(10)
+        )
+        CryptoAnalysisService(
+            price_repo, Mock(), kernels, numeric=FAST
+        ).analyze_investment("MIX", Decimal(10))
+
+        assert len(kernels) == 2
+
+    def test_lookup_by_name(self):
+        """Test that config names select a backend and typos are rejected."""
+        assert get_numeric_backend("exact") is EXACT
+        assert get_numeric_backend("fast") is FAST
+        with pytest.raises(ValueError):
+            get_numeric_backend("quick")
@@ -0,0 +1,122 @@
+"""Unit tests for the buffered investment query log."""
+
+import threading
+import time
+from datetime import datetime
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+
+from app.domain.models import Investment, Logging
+from app.domain.query_log import BufferedInvestmentRepository
+from app.domain.repositories import SqlAlchemyInvestmentRepository
+from app.shared.database import Database
+
+CREATED = datetime(2024, 1, 1)
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """Create an investment repository whose database every thread sees."""
+    return SqlAlchemyInvestmentRepository(Database(f"sqlite:///{tmp_path}/log.db"))
+
+
+def _logged(repository):
+    session = repository.db.get_session()
+    try:
+        return [
+            (row.SYMBOL, row.INVESTMENT)
+            for row in session.query(Logging).order_by(Logging.INVESTMENT)
+        ]
+    finally:
+        session.close()
+
+
+class TestBufferedInvestmentRepository:
+    """Test queueing, flushing and dropping logged queries."""
+
+    def test_rows_are_written_on_shutdown(self, repository):
+        """Test that queued rows reach the table when the log shuts down."""
+        log = BufferedInvestmentRepository(repository, flush_interval=60)
+
+        log.log_query(Investment(symbol="BTC", amount=Decimal(100)))
+        log.log_queries([("ETH", 200), ("SOL", 300)], CREATED)
+        log.shutdown()
+
+        assert _logged(repository) == [("BTC", 100), ("ETH", 200), ("SOL", 300)]
+        assert log.stats()["written"] == 3
+        assert log.stats()["depth"] == 0
+
+    def test_full_batch_is_flushed_in_background(self, repository):
+        """Test that reaching the batch size triggers a bulk insert."""
+        log = BufferedInvestmentRepository(repository, batch_size=3, flush_interval=60)
+        flushed = threading.Event()
+        insert_rows = repository.insert_rows
+        repository.insert_rows = lambda rows: (insert_rows(rows), flushed.set())
+
+        log.log_queries([("BTC", amount) for amount in range(3)], CREATED)
+
+        assert flushed.wait(5)
+        assert len(_logged(repository)) == 3
+        log.shutdown()
+
+    def test_partial_batch_is_flushed_after_interval(self, repository):
+        """Test that a partial batch is written once the interval elapses."""
+        log = BufferedInvestmentRepository(
+            repository, batch_size=100, flush_interval=0.01
+        )
+        flushed = threading.Event()
+        insert_rows = repository.insert_rows
+        repository.insert_rows = lambda rows: (insert_rows(rows), flushed.set())
+
+        log.log_queries([("BTC", 1)], CREATED)
+
+        assert flushed.wait(5)
+        assert log.stats()["flushes"] >= 1
+        log.shutdown()
+
+    def test_full_queue_drops_rows(self):
+        """Test that rows beyond the queue bound are dropped and counted."""
+        repository = Mock()
+        released = threading.Event()
+        repository.insert_rows.side_effect = lambda rows: released.wait(5)
+        log = BufferedInvestmentRepository(
+            repository, max_queue=2, batch_size=2, flush_interval=60
+        )
+
+        # The flusher blocks on the first batch, so the queue fills behind it
+        log.log_queries([("BTC", 1), ("BTC", 2)], CREATED)
+        while log.stats()["depth"]:
+            time.sleep(0.001)
+        log.log_queries([("BTC", amount) for amount in range(3, 7)], CREATED)
+
+        assert log.stats()["dropped"] == 2
+        assert log.stats()["depth"] == 2
+        released.set()
+        log.shutdown()
+        assert log.stats()["written"] == 4
+
+    def test_failed_flush_is_counted(self):
+        """Test that a failing insert is logged as failed, not raised."""
+        repository = Mock()
+        repository.insert_rows.side_effect = RuntimeError("database down")
+        log = BufferedInvestmentRepository(repository, flush_interval=60)
+
+        log.log_queries([("BTC", 1), ("ETH", 2)], CREATED)
+        log.shutdown()
+
+        stats = log.stats()
+        assert stats["failed"] == 2
+        assert stats["written"] == 0
+        assert stats["flushes"] == 1
+
+    def test_logging_restarts_after_shutdown(self, repository):
+        """Test that the log keeps working after a shutdown."""
+        log = BufferedInvestmentRepository(repository, flush_interval=60)
+        log.shutdown()
+
+        log.log_queries([("BTC", 1)], CREATED)
+        log.shutdown()
+
+        assert _logged(repository) == [("BTC", 1)]
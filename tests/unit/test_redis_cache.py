@@ -0,0 +1,102 @@
+"""Unit tests for the shared Redis price cache."""
+
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from app.domain.asset_pairs import AssetPairIndex
+from app.domain.repositories import KrakenPriceRepository
+from app.shared.database import Database
+from app.shared.redis_cache import RedisCache
+
+fakeredis = pytest.importorskip("fakeredis")
+
+OHLC_PAYLOAD = {
+    "error": [],
+    "result": {
+        "XXBTZUSD": [
+            [1548111600, "3600.0", "3700.0", "3500.0", "3650.5", "3600", "10", 5],
+            [1549407600, "3650.5", "3800.0", "3600.0", "0.00012345", "3700", "12", 6],
+        ],
+        "last": 1549407600,
+    },
+}
+
+
+@pytest.fixture
+def redis_client():
+    """Create an in-memory Redis stand-in."""
+    return fakeredis.FakeRedis()
+
+
+@pytest.fixture
+def shared_cache(redis_client):
+    """Create a shared cache with short lock timings."""
+    return RedisCache(redis_client, lock_ttl=1, lock_wait=0.2)
+
+
+class TestRedisCache:
+    """Test the shared Redis cache."""
+
+    def test_get_and_set(self, shared_cache):
+        """Test storing and reading bytes."""
+        assert shared_cache.get("k") is None
+        shared_cache.set("k", b"v", ttl=10)
+
+        assert shared_cache.get("k") == b"v"
+        assert shared_cache.stats()["hits"] == 1
+
+    def test_lock_is_exclusive(self, shared_cache):
+        """Test that a held lock cannot be taken by another holder."""
+        with shared_cache.lock("BTC") as first:
+            with shared_cache.lock("BTC") as second:
+                assert first is True
+                assert second is False
+
+        with shared_cache.lock("BTC") as again:
+            assert again is True
+
+    def test_redis_failures_are_misses(self):
+        """Test that an unreachable Redis never raises."""
+        client = Mock()
+        client.get.side_effect = ConnectionError("down")
+        client.set.side_effect = ConnectionError("down")
+        cache = RedisCache(client)
+
+        assert cache.get("k") is None
+        cache.set("k", b"v", ttl=10)
+        with cache.lock("k") as acquired:
+            assert acquired is False
+        assert cache.stats()["errors"] == 3
+
+
+class TestSharedPriceCache:
+    """Test the repository's shared cache tier."""
+
+    def _repo(self, shared_cache):
+        http_client = Mock()
+        response = Mock()
+        response.content = json.dumps(OHLC_PAYLOAD).encode()
+        http_client.get.return_value = response
+        repo = KrakenPriceRepository(
+            Database("sqlite://"),
+            http_client=http_client,
+            shared_cache=shared_cache,
+            asset_pairs=AssetPairIndex(
+                lambda: {"XXBTZUSD": {"base": "XXBT", "wsname": "XBT/USD"}}
+            ),
+        )
+        return repo, http_client
+
+    def test_processes_share_fetched_prices(self, redis_client):
+        """Test that a second process is served from Redis."""
+        first, first_http = self._repo(RedisCache(redis_client))
+        second, second_http = self._repo(RedisCache(redis_client))
+
+        expected = first.get_price_data("BTC")
+        shared = second.get_price_data("BTC")
+
+        assert first_http.get.call_count == 1
+        assert second_http.get.call_count == 0
+        assert shared.prices == expected.prices
@@ -0,0 +1,646 @@
+"""Unit tests for infrastructure repositories."""
+
+import json
+import time
+from datetime import datetime, timezone
+from decimal import Decimal
+from unittest.mock import Mock
+
+import pytest
+import requests
+from sqlalchemy.exc import OperationalError
+
+from app.domain.asset_pairs import AssetPairIndex
+from app.domain.constants import (
+    HISTORY_START_TIMESTAMP,
+    OHLC_INTERVAL_MINUTES,
+    OHLC_MAX_CANDLES,
+)
+from app.domain.exceptions import (
+    ExternalServiceError,
+    InsufficientPriceDataError,
+    SymbolNotFoundError,
+)
+from app.domain.models import ColumnarPriceData, Logging, OpeningAverage
+from app.domain.repositories import (
+    KrakenPriceRepository,
+    SqlAlchemyCandleRepository,
+    SqlAlchemyInvestmentRepository,
+    SqlAlchemyLeaderboardRepository,
+    SqlAlchemyOpeningAverageRepository,
+)
+from app.shared.database import Database
+
+OHLC_PAYLOAD = {
+    "error": [],
+    "result": {
+        "XXBTZUSD": [
+            [1548111600, "3600.0", "3700.0", "3500.0", "3650.5", "3600", "10", 5],
+            [1549407600, "3650.5", "3800.0", "3600.0", "3700.0", "3700", "12", 6],
+        ],
+        "last": 1549407600,
+    },
+}
+
+UNKNOWN_PAIR_PAYLOAD = {"error": ["EQuery:Unknown asset pair"]}
+
+ASSET_PAIRS_PAYLOAD = {
+    "error": [],
+    "result": {
+        "XXBTZUSD": {"altname": "XBTUSD", "base": "XXBT", "wsname": "XBT/USD"},
+        "XETHZUSD": {"altname": "ETHUSD", "base": "XETH", "wsname": "ETH/USD"},
+        "XETHXXBT": {"altname": "ETHXBT", "wsname": "ETH/XBT"},
+        "XETHZUSD.d": {"altname": "ETHUSD.d"},
+        "SOLUSD": {"altname": "SOLUSD", "base": "SOL", "wsname": "SOL/USD"},
+    },
+}
+
+
+def _response(payload):
+    response = Mock()
+    response.content = json.dumps(payload).encode()
+    return response
+
+
+@pytest.fixture
+def http_client():
+    """Create a stub upstream HTTP client."""
+    return Mock()
+
+
+@pytest.fixture
+def asset_pairs():
+    """Create an asset pair index loaded from the fixture pair list."""
+    return AssetPairIndex(lambda: ASSET_PAIRS_PAYLOAD["result"])
+
+
+@pytest.fixture
+def repo(http_client, asset_pairs):
+    """Create a repository backed by an in-memory database."""
+    return KrakenPriceRepository(
+        Database("sqlite://"), http_client=http_client, asset_pairs=asset_pairs
+    )
+
+
+@pytest.fixture
+def live_index_repo(http_client):
+    """Create a repository that loads asset pairs through the HTTP client."""
+    return KrakenPriceRepository(Database("sqlite://"), http_client=http_client)
+
+
+class TestKrakenPriceRepository:
+    """Test Kraken price repository."""
+
+    def test_get_price_data_parses_close_prices(self, repo, http_client):
+        """Test that close prices are parsed from the OHLC payload."""
+        http_client.get.return_value = _response(OHLC_PAYLOAD)
+
+        price_data = repo.get_price_data("BTC")
+
+        assert http_client.get.call_count == 1
+        assert http_client.get.call_args.kwargs["params"]["pair"] == "XXBTZUSD"
+        assert price_data.symbol == "BTC"
+        assert [price for _, price in price_data.prices] == [
+            Decimal("3650.5"),
+            Decimal("3700.0"),
+        ]
+
+    def test_unknown_symbol_is_negatively_cached(self, repo, http_client):
+        """Test that pairs Kraken rejects fail fast without another request."""
+        http_client.get.return_value = _response(UNKNOWN_PAIR_PAYLOAD)
+
+        # Listed in the (possibly stale) pair index but unknown to OHLC
+        with pytest.raises(SymbolNotFoundError):
+            repo.get_price_data("ETH")
+        with pytest.raises(SymbolNotFoundError):
+            repo.get_price_data("ETH")
+        assert repo.symbol_exists("ETH") is False
+
+        assert http_client.get.call_count == 1
+
+    def test_unlisted_symbol_is_rejected_locally(self, repo, http_client):
+        """Test that symbols missing from the pair index never reach Kraken."""
+        with pytest.raises(SymbolNotFoundError):
+            repo.get_price_data("FOO")
+        assert repo.symbol_exists("FOO") is False
+
+        assert http_client.get.call_count == 0
+
+    def test_invalidate_forces_refetch(self, repo, http_client):
+        """Test that invalidating a symbol bypasses the price cache."""
+        http_client.get.return_value = _response(OHLC_PAYLOAD)
+
+        repo.get_price_data("BTC")
+        repo.get_price_data("BTC")
+        repo.invalidate("BTC")
+        repo.get_price_data("BTC")
+
+        assert http_client.get.call_count == 2
+
+    def test_unknown_symbol_expires(self, repo, http_client):
+        """Test that the negative cache entry expires after its TTL."""
+        repo.unknown_symbols.ttl = 0
+        http_client.get.return_value = _response(UNKNOWN_PAIR_PAYLOAD)
+
+        for _ in range(2):
+            with pytest.raises(SymbolNotFoundError):
+                repo.get_price_data("ETH")
+
+        assert http_client.get.call_count == 2
+
+    def test_columnar_mode(self, repo, http_client):
+        """Test that columnar mode builds NumPy-backed price data."""
+        repo.price_data_mode = "columnar"
+        http_client.get.return_value = _response(OHLC_PAYLOAD)
+
+        price_data = repo.get_price_data("BTC")
+
+        assert isinstance(price_data, ColumnarPriceData)
+        assert price_data.closes.tolist() == [3650.5, 3700.0]
+
+    def test_price_data_is_cached(self, repo, http_client):
+        """Test that repeated lookups are served from the price cache."""
+        http_client.get.return_value = _response(OHLC_PAYLOAD)
+
+        first = repo.get_price_data("BTC")
+        second = repo.get_price_data("BTC")
+
+        assert first is second
+        assert http_client.get.call_count == 1
+        assert repo.stats()["price_cache"]["hits"] == 1
+
+    def test_other_kraken_errors_are_external(self, repo, http_client):
+        """Test that non-symbol errors are not cached as unknown symbols."""
+        http_client.get.return_value = _response({"error": ["EService:Unavailable"]})
+
+        with pytest.raises(ExternalServiceError):
+            repo.get_price_data("BTC")
+
+        assert repo.unknown_symbols.get("BTC") is None
+
+    def test_usd_symbols(self, live_index_repo, http_client):
+        """Test that only pairs quoted in USD are listed, by base symbol."""
+        http_client.get.return_value = _response(ASSET_PAIRS_PAYLOAD)
+
+        assert live_index_repo.usd_symbols() == ["ETH", "SOL", "XBT"]
+        assert http_client.get.call_args.args[0].endswith("/AssetPairs")
+
+    def test_symbol_exists_uses_asset_pair_index(self, live_index_repo, http_client):
+        """Test that existence checks share one AssetPairs request."""
+        http_client.get.return_value = _response(ASSET_PAIRS_PAYLOAD)
+
+        assert live_index_repo.symbol_exists("BTC") is True
+        assert live_index_repo.symbol_exists("ETH") is True
+        assert live_index_repo.symbol_exists("FOO") is False
+
+        assert http_client.get.call_count == 1
+        assert http_client.get.call_args.args[0].endswith("/AssetPairs")
+
+    def test_symbol_exists_falls_back_to_ohlc(self, live_index_repo, http_client):
+        """Test that an unreachable pair list falls back to an OHLC probe."""
+        http_client.get.side_effect = [
+            requests.ConnectionError("boom"),
+            _response(OHLC_PAYLOAD),
+        ]
+
+        assert live_index_repo.symbol_exists("BTC") is True
+        assert http_client.get.call_count == 2
+        assert http_client.get.call_args.kwargs["params"]["pair"] == "BTCUSD"
+
+    def test_first_analysis_loads_the_index(self, live_index_repo, http_client):
+        """Test that a fresh process normalises and rejects on first use."""
+        http_client.get.side_effect = [
+            _response(ASSET_PAIRS_PAYLOAD),
+            _response(OHLC_PAYLOAD),
+        ]
+
+        live_index_repo.get_price_data("BTC")
+        with pytest.raises(SymbolNotFoundError):
+            live_index_repo.get_price_data("FOO")
+
+        assert http_client.get.call_count == 2
+        assert http_client.get.call_args.kwargs["params"]["pair"] == "XXBTZUSD"
+
+    def test_truncated_history_is_rejected(self, repo, http_client):
+        """Test that a response cut off at Kraken's limit is not served."""
+        start = HISTORY_START_TIMESTAMP + 10 * OHLC_INTERVAL_MINUTES * 60
+        candles = [
+            [start + i * OHLC_INTERVAL_MINUTES * 60, "1", "1", "1", "1", "1", "1", 1]
+            for i in range(OHLC_MAX_CANDLES)
+        ]
+        http_client.get.return_value = _response(
+            {"error": [], "result": {"XXBTZUSD": candles, "last": start}}
+        )
+
+        with pytest.raises(InsufficientPriceDataError):
+            repo.get_price_data("BTC")
+
+    def test_late_listing_is_not_truncated(self, repo, http_client):
+        """Test that a short history starting after since is served."""
+        start = HISTORY_START_TIMESTAMP + 10 * OHLC_INTERVAL_MINUTES * 60
+        candles = [[start, "1", "1", "1", "2", "1", "1", 1]]
+        http_client.get.return_value = _response(
+            {"error": [], "result": {"SOLUSD": candles, "last": start}}
+        )
+
+        assert len(repo.get_price_data("SOL").prices) == 1
+
+    def test_network_failure_is_external(self, repo, http_client):
+        """Test that transport failures raise ExternalServiceError."""
+        http_client.get.side_effect = requests.ConnectionError("boom")
+
+        with pytest.raises(ExternalServiceError):
+            repo.get_price_data("BTC")
+
+    def test_http_error_status_is_external(self, repo, http_client):
+        """Test that a final 5xx/429 response raises ExternalServiceError."""
+        response = _response({})
+        response.raise_for_status.side_effect = requests.HTTPError("503")
+        http_client.get.return_value = response
+
+        with pytest.raises(ExternalServiceError):
+            repo.get_price_data("BTC")
+
+
+class TestCandleStore:
+    """Test incremental candle storage."""
+
+    @pytest.fixture
+    def candle_store(self):
+        """Create a candle store backed by an in-memory database."""
+        return SqlAlchemyCandleRepository(Database("sqlite://"))
+
+    @pytest.fixture
+    def repo(self, http_client, asset_pairs, candle_store):
+        """Create a repository with a candle store attached."""
+        return KrakenPriceRepository(
+            candle_store.db,
+            http_client=http_client,
+            candle_store=candle_store,
+            asset_pairs=asset_pairs,
+        )
+
+    def test_save_and_load_candles(self, candle_store):
+        """Test that candles round-trip in timestamp order."""
+        candle_store.save_candles("BTC", 21600, [(1, "1.5"), (2, "2.5")])
+
+        assert candle_store.get_candles("BTC", 21600) == [(1, "1.5"), (2, "2.5")]
+        assert candle_store.get_candles("BTC", 1440) == []
+
+    def test_save_replaces_overlapping_tail(self, candle_store):
+        """Test that re-saved candles replace the stored tail."""
+        candle_store.save_candles("BTC", 21600, [(1, "1"), (2, "2")])
+        candle_store.save_candles("BTC", 21600, [(2, "2.2"), (3, "3")])
+
+        assert candle_store.get_candles("BTC", 21600) == [
+            (1, "1"),
+            (2, "2.2"),
+            (3, "3"),
+        ]
+
+    def test_first_fetch_stores_full_history(self, repo, http_client, candle_store):
+        """Test that a cold symbol fetches from the history start."""
+        http_client.get.return_value = _response(OHLC_PAYLOAD)
+
+        repo.get_price_data("BTC")
+
+        params = http_client.get.call_args.kwargs["params"]
+        assert params["since"] == HISTORY_START_TIMESTAMP
+        assert len(candle_store.get_candles("BTC", OHLC_INTERVAL_MINUTES)) == 2
+
+    def test_store_failure_does_not_fail_fetch(self, repo, http_client, candle_store):
+        """Test that an unusable candle table is skipped, not raised."""
+        candle_store._ensure_table = Mock(
+            side_effect=OperationalError("CREATE TABLE", {}, Exception("locked"))
+        )
+        http_client.get.return_value = _response(OHLC_PAYLOAD)
+
+        price_data = repo.get_price_data("BTC")
+
+        assert len(price_data.prices) == 2
+
+    def test_warm_fetch_only_requests_tail(self, repo, http_client):
+        """Test that a warm symbol only fetches candles after the stored ones."""
+        http_client.get.return_value = _response(OHLC_PAYLOAD)
+        repo.get_price_data("BTC")
+
+        tail = {
+            "error": [],
+            "result": {
+                "XXBTZUSD": [
+                    [1549407600, "3", "3", "3", "3710.0", "3", "1", 1],
+                    [1550703600, "3", "3", "3", "3800.0", "3", "1", 1],
+                ],
+                "last": 1550703600,
+            },
+        }
+        http_client.get.return_value = _response(tail)
+        repo.price_cache.clear()
+        price_data = repo.get_price_data("BTC")
+
+        params = http_client.get.call_args.kwargs["params"]
+        assert params["since"] == 1549407600 - 1
+        assert [price for _, price in price_data.prices] == [
+            Decimal("3650.5"),
+            Decimal("3710.0"),
+            Decimal("3800.0"),
+        ]
+
+    def test_stored_history_served_when_kraken_down(self, repo, http_client):
+        """Test that stored candles are served if the tail fetch fails."""
+        http_client.get.return_value = _response(OHLC_PAYLOAD)
+        repo.get_price_data("BTC")
+
+        http_client.get.side_effect = requests.ConnectionError("boom")
+        repo.price_cache.clear()
+        price_data = repo.get_price_data("BTC")
+
+        assert len(price_data.prices) == 2
+
+    def test_base_candles_roll_up(self, candle_store):
+        """Test that saving base candles fills every rollup level."""
+        step = OHLC_INTERVAL_MINUTES * 60
+        candle_store.save_candles(
+            "BTC", OHLC_INTERVAL_MINUTES, [(i * step, str(i)) for i in range(5)]
+        )
+
+        month = 43200 * 60
+        assert candle_store.get_candles("BTC", 43200) == [
+            (0, "1"),
+            (month, "3"),
+            (2 * month, "4"),
+        ]
+        assert candle_store.get_candles("BTC", 525600) == [(0, "4")]
+
+    def test_rollups_update_incrementally(self, candle_store):
+        """Test that a new tail only re-aggregates the buckets it touches."""
+        step = OHLC_INTERVAL_MINUTES * 60
+        candle_store.save_candles(
+            "BTC", OHLC_INTERVAL_MINUTES, [(i * step, str(i)) for i in range(5)]
+        )
+        candle_store.save_candles(
+            "BTC", OHLC_INTERVAL_MINUTES, [(4 * step, "4.5"), (5 * step, "5")]
+        )
+
+        month = 43200 * 60
+        assert candle_store.get_candles("BTC", 43200) == [
+            (0, "1"),
+            (month, "3"),
+            (2 * month, "5"),
+        ]
+
+    def test_chart_reads_rollup_level(self, repo, http_client, candle_store):
+        """Test that a point budget picks the finest level that fits it."""
+        step = OHLC_INTERVAL_MINUTES * 60
+        candles = [
+            [HISTORY_START_TIMESTAMP + i * step, "1", "1", "1", str(i), "1", "1", 1]
+            for i in range(40)
+        ]
+        http_client.get.return_value = _response(
+            {"error": [], "result": {"XXBTZUSD": candles, "last": 0}}
+        )
+
+        interval, timestamps, closes = repo.get_chart_candles("BTC", points=10)
+        base, _, base_closes = repo.get_chart_candles("BTC")
+
+        assert interval == 129600
+        assert timestamps.size == len(candle_store.get_candles("BTC", 129600)) <= 10
+        assert closes[-1] == 39.0
+        assert base == OHLC_INTERVAL_MINUTES
+        assert base_closes.size == 40
+
+    def test_chart_range_is_sliced(self, repo, http_client):
+        """Test that start and end bound the base candles returned."""
+        http_client.get.return_value = _response(OHLC_PAYLOAD)
+
+        _, timestamps, _ = repo.get_chart_candles("BTC", start=1549407600)
+        with pytest.raises(InsufficientPriceDataError):
+            repo.get_chart_candles("BTC", end=HISTORY_START_TIMESTAMP)
+
+        assert timestamps.tolist() == [1549407600]
+
+
+OPENING_PAYLOAD = {
+    "error": [],
+    "result": {
+        "XXBTZUSD": [
+            [1548111600 + i * 1296000, "0", "0", "0", close, "0", "1", 1]
+            for i, close in enumerate(["10", "20", "30", "40", "50"])
+        ],
+        "last": 1553295600,
+    },
+}
+
+
+class TestOpeningAverageStore:
+    """Test persisted opening averages."""
+
+    @pytest.fixture
+    def averages(self):
+        """Create an opening average store backed by an in-memory database."""
+        return SqlAlchemyOpeningAverageRepository(Database("sqlite://"))
+
+    @pytest.fixture
+    def repo(self, http_client, asset_pairs, averages):
+        """Create a repository with the opening average store attached."""
+        return KrakenPriceRepository(
+            averages.db,
+            http_client=http_client,
+            opening_averages=averages,
+            asset_pairs=asset_pairs,
+        )
+
+    def test_save_and_load_average(self, averages):
+        """Test that a saved average can be read back."""
+        averages.save_average("BTC", Decimal("3650.5"))
+
+        assert averages.get_average("BTC") == Decimal("3650.5")
+        assert averages.get_average("ETH") is None
+
+    def test_price_data_carries_persisted_average(self, repo, http_client, averages):
+        """Test that loading price data persists its opening average."""
+        http_client.get.return_value = _response(OPENING_PAYLOAD)
+
+        price_data = repo.get_price_data("BTC")
+
+        assert price_data.opening_average == Decimal("25")
+        assert price_data.get_opening_average() == Decimal("25")
+        assert averages.get_average("BTC") == Decimal("25")
+
+    def test_stale_row_is_corrected(self, repo, http_client, averages):
+        """Test that a stored average contradicting the history is replaced."""
+        # Legacy BTC row shipped in the bundled database
+        averages.save_average("BTC", Decimal("167.2875"))
+        http_client.get.return_value = _response(OPENING_PAYLOAD)
+
+        price_data = repo.get_price_data("BTC")
+
+        assert price_data.get_opening_average() == Decimal("25")
+        assert averages.get_average("BTC") == Decimal("25")
+
+    def test_broken_table_falls_back_to_history(self, http_client, asset_pairs):
+        """Test that an unusable table still lets analysis compute the average."""
+        averages = SqlAlchemyOpeningAverageRepository(Database("sqlite://"))
+        OpeningAverage.__table__.drop(averages.db.engine)
+        averages._table_ready = True
+        repo = KrakenPriceRepository(
+            Database("sqlite://"),
+            http_client=http_client,
+            opening_averages=averages,
+            asset_pairs=asset_pairs,
+        )
+        http_client.get.return_value = _response(OPENING_PAYLOAD)
+
+        price_data = repo.get_price_data("BTC")
+
+        assert price_data.opening_average == Decimal("25")
+        assert averages.get_average("BTC") is None
+
+    def test_average_is_memoised(self, repo, http_client, averages):
+        """Test that the table is only consulted once per symbol."""
+        http_client.get.return_value = _response(OPENING_PAYLOAD)
+        repo.get_price_data("BTC")
+        averages.save_average("BTC", Decimal("1"))
+
+        repo.invalidate("BTC")
+
+        assert repo.get_price_data("BTC").get_opening_average() == Decimal("25")
+
+    def test_short_history_uses_stored_average(self, repo, http_client, averages):
+        """Test that the stored value serves history without an opening window."""
+        averages.save_average("BTC", Decimal("3600"))
+        http_client.get.return_value = _response(OHLC_PAYLOAD)
+
+        price_data = repo.get_price_data("BTC")
+
+        assert price_data.opening_average == Decimal("3600")
+
+
+class TestStaleWhileRevalidate:
+    """Test the stale-while-revalidate serving mode."""
+
+    @pytest.fixture
+    def repo(self, http_client, asset_pairs):
+        """Create a repository serving stale data while refreshing."""
+        return KrakenPriceRepository(
+            Database("sqlite://"),
+            http_client=http_client,
+            asset_pairs=asset_pairs,
+            serving_mode="stale-while-revalidate",
+            price_cache_ttl=60,
+            max_stale=3600,
+        )
+
+    def _wait_for_refresh(self, repo):
+        if repo._refresh_executor is not None:
+            repo._refresh_executor.shutdown(wait=True)
+            repo._refresh_executor = None
+
+    def test_fresh_data_is_not_refreshed(self, repo, http_client):
+        """Test that data inside the soft TTL is served without a refresh."""
+        http_client.get.return_value = _response(OHLC_PAYLOAD)
+
+        repo.get_price_data("BTC")
+        repo.get_price_data("BTC")
+        self._wait_for_refresh(repo)
+
+        assert http_client.get.call_count == 1
+        assert repo.freshness("BTC")["state"] == "fresh"
+
+    def test_stale_data_is_served_then_refreshed(self, repo, http_client):
+        """Test that stale data returns at once and is replaced in the background."""
+        http_client.get.return_value = _response(OHLC_PAYLOAD)
+        stale = repo.get_price_data("BTC")
+        stale.fetched_at = time.time() - 600
+
+        assert repo.freshness("BTC") == {"state": "stale", "age": 600}
+        assert repo.get_price_data("BTC") is stale
+        self._wait_for_refresh(repo)
+
+        refreshed = repo.get_price_data("BTC")
+        assert refreshed is not stale
+        assert repo.freshness("BTC")["state"] == "fresh"
+        assert http_client.get.call_count == 2
+
+    def test_failed_refresh_keeps_stale_data(self, repo, http_client):
+        """Test that a failing background refresh leaves stale data in place."""
+        http_client.get.return_value = _response(OHLC_PAYLOAD)
+        stale = repo.get_price_data("BTC")
+        stale.fetched_at = time.time() - 600
+        http_client.get.side_effect = requests.ConnectionError("boom")
+
+        assert repo.get_price_data("BTC") is stale
+        self._wait_for_refresh(repo)
+
+        assert not repo._refreshing
+        assert repo.price_cache.peek("BTC") is stale
+
+    def test_cache_lifetime_follows_mode(self, repo):
+        """Test that entries live to the hard TTL only when serving stale."""
+        assert repo.price_cache.ttl == 3600
+
+        repo.serving_mode = "blocking"
+        repo._apply_serving_mode()
+
+        assert repo.price_cache.ttl == 60
+
+
+class TestLeaderboardStore:
+    """Test the materialised leaderboard."""
+
+    def test_save_and_read_back(self):
+        """Test that saved entries are ranked and shared through the table."""
+        database = Database("sqlite://")
+        writer = SqlAlchemyLeaderboardRepository(database)
+        reader = SqlAlchemyLeaderboardRepository(database)
+        generated_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        entries = [
+            {"SYMBOL": "SOL", "GROWTHFACTOR": 9.0, "LAMBOS": 0.045},
+            {"SYMBOL": "BTC", "GROWTHFACTOR": 2.0, "LAMBOS": 0.01},
+        ]
+
+        writer.save_leaderboard(entries, generated_at)
+
+        saved = reader.get_leaderboard()
+        assert [(e["RANK"], e["SYMBOL"]) for e in saved] == [(1, "SOL"), (2, "BTC")]
+        assert saved[0]["GENERATIONDATE"].startswith("2024-01-01")
+        assert writer.get_leaderboard()[0]["LAMBOS"] == 0.045
+
+    def test_rebuild_replaces_entries(self):
+        """Test that a rebuild removes entries that dropped off."""
+        repo = SqlAlchemyLeaderboardRepository(Database("sqlite://"), ttl=0)
+        now = datetime.now(timezone.utc)
+        repo.save_leaderboard(
+            [{"SYMBOL": s, "GROWTHFACTOR": 1.0, "LAMBOS": 0.0} for s in "ABC"], now
+        )
+
+        repo.save_leaderboard(
+            [{"SYMBOL": "D", "GROWTHFACTOR": 1.0, "LAMBOS": 0.0}], now
+        )
+
+        assert [e["SYMBOL"] for e in repo.get_leaderboard()] == ["D"]
+
+    def test_empty_until_built(self):
+        """Test that an unbuilt leaderboard reads as empty."""
+        assert (
+            SqlAlchemyLeaderboardRepository(Database("sqlite://")).get_leaderboard()
+            == []
+        )
+
+
+class TestInvestmentLog:
+    """Test investment query logging."""
+
+    def test_log_queries_bulk_inserts(self):
+        """Test that a batch of queries is written in one call."""
+        database = Database("sqlite://")
+        repo = SqlAlchemyInvestmentRepository(database)
+
+        repo.log_queries([("BTC", 100.0), ("ETH", 50.0)], datetime.now(timezone.utc))
+
+        session = database.get_session()
+        try:
+            rows = session.query(Logging.SYMBOL, Logging.INVESTMENT).all()
+        finally:
+            session.close()
+        assert sorted(rows) == [("BTC", 100.0), ("ETH", 50.0)]
@@ -0,0 +1,76 @@
+"""Unit tests for background tasks."""
+
+from unittest.mock import Mock
+
+import pytest
+from celery import Celery, current_app
+
+from app.domain.exceptions import ExternalServiceError
+from app.domain.tasks import refresh_leaderboard
+
+
+@pytest.fixture(autouse=True)
+def celery_app():
+    """Run tasks on a bare Celery app, whatever app earlier tests set up."""
+    previous = current_app._get_current_object()
+    app = Celery("tests")
+    app.set_current()
+    yield app
+    previous.set_current()
+
+
+@pytest.fixture
+def leaderboard_deps(monkeypatch):
+    """Replace the repositories and service refresh_leaderboard uses."""
+    deps = Mock()
+    deps.price_repo.usd_symbols.return_value = ["BTC", "ETH", "SOL", "XRP"]
+    monkeypatch.setattr("app.domain.price_repo", deps.price_repo)
+    monkeypatch.setattr("app.domain.async_price_repo", deps.async_price_repo)
+    monkeypatch.setattr("app.domain.leaderboard_repo", deps.leaderboard_repo)
+    monkeypatch.setattr("app.domain.routes.get_crypto_service", lambda: deps.service)
+    return deps
+
+
+class TestRefreshLeaderboard:
+    """Test the leaderboard refresh task."""
+
+    def test_saves_ranked_entries(self, leaderboard_deps):
+        """Test that a healthy refresh replaces the stored leaderboard."""
+        leaderboard_deps.async_price_repo.get_many_sync.return_value = {
+            "BTC": Mock(),
+            "ETH": Mock(),
+            "SOL": Mock(),
+            "XRP": ExternalServiceError("down"),
+        }
+        leaderboard_deps.service.build_leaderboard.return_value = [{"SYMBOL": "BTC"}]
+
+        result = refresh_leaderboard()
+
+        assert result["status"] == "partial"
+        leaderboard_deps.leaderboard_repo.save_leaderboard.assert_called_once()
+
+    def test_outage_keeps_previous_leaderboard(self, leaderboard_deps):
+        """Test that a run where most fetches fail does not save."""
+        leaderboard_deps.async_price_repo.get_many_sync.return_value = {
+            "BTC": Mock(),
+            "ETH": ExternalServiceError("down"),
+            "SOL": ExternalServiceError("down"),
+            "XRP": ExternalServiceError("down"),
+        }
+        leaderboard_deps.service.build_leaderboard.return_value = [{"SYMBOL": "BTC"}]
+
+        result = refresh_leaderboard()
+
+        assert result["status"] == "failed"
+        assert result["failed_symbols"] == ["ETH", "SOL", "XRP"]
+        leaderboard_deps.leaderboard_repo.save_leaderboard.assert_not_called()
+
+    def test_empty_ranking_keeps_previous_leaderboard(self, leaderboard_deps):
+        """Test that a run ranking nothing does not clear the table."""
+        leaderboard_deps.async_price_repo.get_many_sync.return_value = {
+            symbol: Mock() for symbol in ["BTC", "ETH", "SOL", "XRP"]
+        }
+        leaderboard_deps.service.build_leaderboard.return_value = []
+
+        assert refresh_leaderboard()["status"] == "failed"
+        leaderboard_deps.leaderboard_repo.save_leaderboard.assert_not_called()